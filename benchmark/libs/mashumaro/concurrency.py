@@ -0,0 +1,61 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Type
+
+import pyperf
+
+from benchmark.common import load_data
+from benchmark.libs.mashumaro.common import DefaultDialect, Issue
+from mashumaro import DataClassDictMixin
+from mashumaro.config import BaseConfig
+
+THREADS = (1, 2, 4, 8)
+CALLS_PER_THREAD = 100
+
+
+def create_model() -> Type[DataClassDictMixin]:
+    # a new class with lazily compiled methods is created for every run
+    # to measure how threads wait for the first compilation
+    class Config(BaseConfig):
+        lazy_compilation = True
+        dialect = DefaultDialect
+
+    return dataclass(
+        type("LazyIssue", (Issue, DataClassDictMixin), {"Config": Config})
+    )
+
+
+def run_threads(loops: int, threads: int, data: Dict[str, Any]) -> float:
+    elapsed = 0.0
+    for _ in range(loops):
+        model = create_model()
+        barrier = threading.Barrier(threads + 1)
+
+        def target() -> None:
+            barrier.wait()
+            for _ in range(CALLS_PER_THREAD):
+                model.from_dict(data).to_dict()
+
+        with ThreadPoolExecutor(threads) as executor:
+            futures = [executor.submit(target) for _ in range(threads)]
+            barrier.wait()
+            start = time.perf_counter()
+            for future in futures:
+                future.result()
+            elapsed += time.perf_counter() - start
+    return elapsed
+
+
+if __name__ == "__main__":
+    runner = pyperf.Runner()
+    data = load_data()
+    for threads in THREADS:
+        runner.bench_time_func(
+            f"mashumaro[lazy, threads={threads}]",
+            run_threads,
+            threads,
+            data,
+            inner_loops=threads * CALLS_PER_THREAD,
+        )
@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+from enum import Enum, IntEnum
+from typing import Any, Dict, List
+
+import pyperf
+
+from benchmark.libs.mashumaro.common import (
+    AuthorAssociation,
+    IssueState,
+    IssueStateReason,
+    MilestoneState,
+)
+from mashumaro.codecs import BasicDecoder, BasicEncoder
+
+RECORDS = 1000
+
+
+class Priority(IntEnum):
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
+
+
+class Color(Enum):
+    RED = "red"
+    GREEN = "green"
+    BLUE = "blue"
+
+
+@dataclass(slots=True)
+class Record:
+    state: IssueState
+    state_reason: IssueStateReason
+    milestone_state: MilestoneState
+    author_association: AuthorAssociation
+    priority: Priority
+    color: Color
+    previous_state: IssueState
+    previous_state_reason: IssueStateReason
+    previous_milestone_state: MilestoneState
+    previous_author_association: AuthorAssociation
+    previous_priority: Priority
+    previous_color: Color
+
+
+def create_data() -> List[Dict[str, Any]]:
+    enum_types = [
+        IssueState,
+        IssueStateReason,
+        MilestoneState,
+        AuthorAssociation,
+        Priority,
+        Color,
+    ]
+    field_names = list(Record.__dataclass_fields__)
+    data = []
+    for i in range(RECORDS):
+        values = [list(t)[i % len(t)].value for t in enum_types]
+        values += [list(t)[(i + 1) % len(t)].value for t in enum_types]
+        data.append(dict(zip(field_names, values)))
+    return data
+
+
+if __name__ == "__main__":
+    runner = pyperf.Runner()
+    data = create_data()
+    decoder = BasicDecoder(List[Record])
+    encoder = BasicEncoder(List[Record])
+    obj = decoder.decode(data)
+    assert encoder.encode(obj)
+    runner.bench_func("mashumaro[enums, load]", decoder.decode, data)
+    runner.bench_func("mashumaro[enums, dump]", encoder.encode, obj)
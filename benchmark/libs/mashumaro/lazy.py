@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List
+
+import pyperf
+
+from mashumaro.codecs import BasicDecoder, BasicEncoder
+from mashumaro.types import Lazy
+
+COMMENTS = 100
+
+
+@dataclass(slots=True)
+class Comment:
+    id: int
+    author: str
+    text: str
+    created_at: datetime
+
+
+@dataclass(slots=True)
+class Post:
+    id: int
+    title: str
+    comments: List[Comment]
+
+
+@dataclass(slots=True)
+class LazyPost:
+    id: int
+    title: str
+    comments: Lazy[List[Comment]]
+
+
+def create_data() -> Dict[str, Any]:
+    return {
+        "id": 1,
+        "title": "title",
+        "comments": [
+            {
+                "id": i,
+                "author": f"author{i}",
+                "text": f"text{i}",
+                "created_at": "2024-01-01T00:00:00",
+            }
+            for i in range(COMMENTS)
+        ],
+    }
+
+
+def load_and_dump(
+    decoder: BasicDecoder, encoder: BasicEncoder, data: Dict[str, Any]
+) -> Any:
+    return encoder.encode(decoder.decode(data))
+
+
+if __name__ == "__main__":
+    runner = pyperf.Runner()
+    data = create_data()
+    for model in (Post, LazyPost):
+        decoder = BasicDecoder(model)
+        encoder = BasicEncoder(model)
+        assert encoder.encode(decoder.decode(data)) == data
+        runner.bench_func(
+            f"mashumaro[lazy, load, {model.__name__}]", decoder.decode, data
+        )
+        runner.bench_func(
+            f"mashumaro[lazy, load+dump, {model.__name__}]",
+            load_and_dump,
+            decoder,
+            encoder,
+            data,
+        )
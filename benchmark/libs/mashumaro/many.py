@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from typing import Any, List
+
+import pyperf
+
+from mashumaro.codecs import BasicDecoder, BasicEncoder
+
+ITEMS = 10000
+
+
+# per item overhead is noticeable for small models
+@dataclass(slots=True)
+class Point:
+    x: int
+    y: int
+
+
+def decode_in_loop(decoder: BasicDecoder, data: List[Any]) -> List[Any]:
+    return [decoder.decode(item) for item in data]
+
+
+def encode_in_loop(encoder: BasicEncoder, objs: List[Any]) -> List[Any]:
+    return [encoder.encode(obj) for obj in objs]
+
+
+if __name__ == "__main__":
+    runner = pyperf.Runner()
+    data = [{"x": i, "y": -i} for i in range(ITEMS)]
+    decoder = BasicDecoder(Point)
+    encoder = BasicEncoder(Point)
+    objs = decoder.decode_many(data)
+    assert encoder.encode_many(objs) == encode_in_loop(encoder, objs)
+    for name, func, args in (
+        ("load, loop", decode_in_loop, (decoder, data)),
+        ("load, decode_many", decoder.decode_many, (data,)),
+        ("dump, loop", encode_in_loop, (encoder, objs)),
+        ("dump, encode_many", encoder.encode_many, (objs,)),
+    ):
+        runner.bench_func(
+            f"mashumaro[many, {name}]", func, *args, inner_loops=ITEMS
+        )
+    runner.bench_func(
+        "mashumaro[many, load, decode_many, pause_gc]",
+        lambda: decoder.decode_many(data, pause_gc=True),
+        inner_loops=ITEMS,
+    )
@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import UUID
+
+import pyperf
+
+from mashumaro.codecs.msgpack import MessagePackDecoder, MessagePackEncoder
+from mashumaro.mixins.msgpack import MessagePackExtDialect, ext_decoder
+
+
+@dataclass(slots=True)
+class Payment:
+    id: UUID
+    created_at: datetime
+    updated_at: datetime
+    amount: Decimal
+
+
+if __name__ == "__main__":
+    runner = pyperf.Runner()
+    obj = Payment(
+        id=UUID("8d9b2d6c-3f4e-4a53-9bd4-5a1c5a7f0f6e"),
+        created_at=datetime(2024, 1, 1, 12, 30, 15, 123456, timezone.utc),
+        updated_at=datetime(2024, 1, 2, 8, 0, 0, 0, timezone.utc),
+        amount=Decimal("1234.56"),
+    )
+    for name, dialect in (("str", None), ("ext", MessagePackExtDialect)):
+        encoder = MessagePackEncoder(Payment, default_dialect=dialect)
+        decoder = MessagePackDecoder(Payment, default_dialect=dialect)
+        data = encoder.encode(obj)
+        assert decoder.decode(data) == obj
+        if dialect is not None:
+            ext_decoder_ = MessagePackDecoder(
+                Payment, default_dialect=dialect, pre_decoder_func=ext_decoder
+            )
+            assert ext_decoder_.decode(data) == obj
+            runner.bench_func(
+                f"mashumaro[msgpack_ext, load, {name}, ext_decoder]",
+                ext_decoder_.decode,
+                data,
+            )
+        runner.bench_func(
+            f"mashumaro[msgpack_ext, dump, {name}, {len(data)} bytes]",
+            encoder.encode,
+            obj,
+        )
+        runner.bench_func(
+            f"mashumaro[msgpack_ext, load, {name}]", decoder.decode, data
+        )
@@ -0,0 +1,58 @@
+import io
+from dataclasses import dataclass
+from typing import Any, List
+
+import msgpack
+import pyperf
+
+from mashumaro.codecs import BasicEncoder
+from mashumaro.codecs.msgpack import MessagePackDecoder, MessagePackEncoder
+
+ITEMS = 10000
+
+
+@dataclass(slots=True)
+class Event:
+    id: int
+    kind: str
+    value: float
+
+
+def encode_with_packb(encoder: BasicEncoder, objs: List[Any]) -> bytes:
+    return b"".join(
+        msgpack.packb(encoder.encode(obj), use_bin_type=True) for obj in objs
+    )
+
+
+def decode_one_by_one(decoder: MessagePackDecoder, data: List[bytes]) -> Any:
+    return [decoder.decode(value) for value in data]
+
+
+def decode_stream(decoder: MessagePackDecoder, data: bytes) -> Any:
+    return list(decoder.iter_decode(io.BytesIO(data)))
+
+
+if __name__ == "__main__":
+    runner = pyperf.Runner()
+    objs = [Event(i, "click", i / 3) for i in range(ITEMS)]
+    encoder = MessagePackEncoder(Event)
+    decoder = MessagePackDecoder(Event)
+    records = encoder.encode_many(objs)
+    data = encoder.encode_batch(objs)
+    basic_encoder = BasicEncoder(Event)
+    assert encode_with_packb(basic_encoder, objs) == data
+    assert b"".join(records) == data
+    assert decode_stream(decoder, data) == objs
+    for name, func, args in (
+        ("dump, packb", encode_with_packb, (basic_encoder, objs)),
+        ("dump, encode_many", encoder.encode_many, (objs,)),
+        ("dump, encode_batch", encoder.encode_batch, (objs,)),
+        ("load, decode", decode_one_by_one, (decoder, records)),
+        ("load, iter_decode", decode_stream, (decoder, data)),
+    ):
+        runner.bench_func(
+            f"mashumaro[msgpack_stream, {name}]",
+            func,
+            *args,
+            inner_loops=ITEMS,
+        )
@@ -0,0 +1,70 @@
+from dataclasses import make_dataclass
+from datetime import datetime
+from typing import Any, Dict, List
+
+import pyperf
+
+from mashumaro.codecs import BasicDecoder, BasicEncoder
+
+FIELDS = 60
+RECORDS = 1000
+
+Record = make_dataclass(
+    "Record",
+    [("id", int), ("kind", str)]
+    + [
+        (f"field_{i}", [int, str, datetime, List[int]][i % 4])
+        for i in range(FIELDS - 2)
+    ],
+)
+
+
+def create_data() -> List[Dict[str, Any]]:
+    values = [1, "str", "2024-01-01T00:00:00", [1, 2, 3]]
+    return [
+        {"id": i, "kind": "kind"}
+        | {f"field_{j}": values[j % 4] for j in range(FIELDS - 2)}
+        for i in range(RECORDS)
+    ]
+
+
+if __name__ == "__main__":
+    runner = pyperf.Runner()
+    data = create_data()
+    decoder = BasicDecoder(Record)
+    only_decoder = BasicDecoder(Record, only={"id", "kind", "field_0"})
+    assert (
+        only_decoder.decode(data[0]).field_0 == decoder.decode(data[0]).field_0
+    )
+    runner.bench_func(
+        "mashumaro[only, load, all fields]",
+        decoder.decode_many,
+        data,
+        inner_loops=RECORDS,
+    )
+    runner.bench_func(
+        "mashumaro[only, load, 3 fields]",
+        only_decoder.decode_many,
+        data,
+        inner_loops=RECORDS,
+    )
+    objs = decoder.decode_many(data)
+    encoder = BasicEncoder(Record)
+    include_encoder = BasicEncoder(Record, include={"id", "kind", "field_0"})
+    assert include_encoder.encode(objs[0]) == {
+        "id": 0,
+        "kind": "kind",
+        "field_0": 1,
+    }
+    runner.bench_func(
+        "mashumaro[only, dump, all fields]",
+        encoder.encode_many,
+        objs,
+        inner_loops=RECORDS,
+    )
+    runner.bench_func(
+        "mashumaro[only, dump, 3 fields]",
+        include_encoder.encode_many,
+        objs,
+        inner_loops=RECORDS,
+    )
@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+
+import pyperf
+
+from mashumaro.codecs.orjson import ORJSONEncoder
+from mashumaro.dialect import Dialect
+
+ITEMS = 100
+
+
+class Status(Enum):
+    ACTIVE = "active"
+    BLOCKED = "blocked"
+
+
+@dataclass(slots=True)
+class Tag:
+    name: str
+    weight: float
+
+
+@dataclass(slots=True)
+class Item:
+    id: int
+    name: str
+    status: Status
+    created_at: datetime
+    tags: List[Tag]
+    scores: List[int]
+    note: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Page:
+    items: List[Item]
+
+
+class NativeDialect(Dialect):
+    orjson_native = True
+
+
+def create_page() -> Page:
+    return Page(
+        [
+            Item(
+                id=i,
+                name=f"name{i}",
+                status=Status.ACTIVE,
+                created_at=datetime(2024, 1, 1),
+                tags=[Tag("a", 1.5), Tag("b", 2.0)],
+                scores=list(range(10)),
+            )
+            for i in range(ITEMS)
+        ]
+    )
+
+
+if __name__ == "__main__":
+    runner = pyperf.Runner()
+    page = create_page()
+    encoder = ORJSONEncoder(Page)
+    native_encoder = ORJSONEncoder(Page, default_dialect=NativeDialect)
+    assert encoder.encode(page) == native_encoder.encode(page)
+    runner.bench_func(
+        "mashumaro[orjson_native, dump, off]", encoder.encode, page
+    )
+    runner.bench_func(
+        "mashumaro[orjson_native, dump, on]", native_encoder.encode, page
+    )
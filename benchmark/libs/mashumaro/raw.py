@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+import orjson
+import pyperf
+
+from mashumaro.codecs.orjson import ORJSONDecoder, ORJSONEncoder
+from mashumaro.types import RawJSON
+
+ITEMS = 100
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+    tags: List[str]
+    attributes: Dict[str, int]
+
+
+@dataclass
+class Document:
+    id: int
+    items: List[Item]
+
+
+@dataclass
+class Envelope:
+    id: int
+    document: Document
+
+
+@dataclass
+class RawEnvelope:
+    id: int
+    document: RawJSON
+
+
+def create_data() -> bytes:
+    document: Dict[str, Any] = {
+        "id": 1,
+        "items": [
+            {
+                "id": i,
+                "name": f"name{i}",
+                "tags": ["a", "b", "c"],
+                "attributes": {"x": i, "y": -i},
+            }
+            for i in range(ITEMS)
+        ],
+    }
+    return orjson.dumps({"id": 1, "document": document})
+
+
+def proxy(decoder: ORJSONDecoder, encoder: ORJSONEncoder, data: bytes) -> Any:
+    return encoder.encode(decoder.decode(data))
+
+
+if __name__ == "__main__":
+    runner = pyperf.Runner()
+    data = create_data()
+    for model in (Envelope, RawEnvelope):
+        decoder = ORJSONDecoder(model)
+        encoder = ORJSONEncoder(model)
+        assert proxy(decoder, encoder, data) == data
+        runner.bench_func(
+            f"mashumaro[raw, load+dump, {model.__name__}]",
+            proxy,
+            decoder,
+            encoder,
+            data,
+        )
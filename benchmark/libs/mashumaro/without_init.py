@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Type
+
+import pyperf
+
+from mashumaro.codecs import BasicDecoder
+from mashumaro.config import BaseConfig
+
+ITEMS = 10000
+
+
+class WithoutInitConfig(BaseConfig):
+    construct_without_init = True
+
+
+@dataclass(slots=True)
+class Slotted:
+    id: int
+    name: str
+    score: float
+    active: bool = True
+
+
+@dataclass(slots=True)
+class SlottedWithoutInit(Slotted):
+    Config = WithoutInitConfig
+
+
+@dataclass(frozen=True)
+class Frozen:
+    id: int
+    name: str
+    score: float
+    active: bool = True
+
+
+@dataclass(frozen=True)
+class FrozenWithoutInit(Frozen):
+    Config = WithoutInitConfig
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenSlotted:
+    id: int
+    name: str
+    score: float
+    active: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenSlottedWithoutInit(FrozenSlotted):
+    Config = WithoutInitConfig
+
+
+def create_data() -> List[Dict[str, Any]]:
+    return [
+        {"id": i, "name": f"name{i}", "score": i / 3, "active": i % 2 == 0}
+        for i in range(ITEMS)
+    ]
+
+
+if __name__ == "__main__":
+    runner = pyperf.Runner()
+    data = create_data()
+    models: List[Type[Any]] = [
+        Slotted,
+        SlottedWithoutInit,
+        Frozen,
+        FrozenWithoutInit,
+        FrozenSlotted,
+        FrozenSlottedWithoutInit,
+    ]
+    for model in models:
+        decoder = BasicDecoder(List[model])  # type: ignore[valid-type]
+        assert decoder.decode(data)[-1].name == data[-1]["name"]
+        runner.bench_func(
+            f"mashumaro[without_init, load, {model.__name__}]",
+            decoder.decode,
+            data,
+            inner_loops=ITEMS,
+        )
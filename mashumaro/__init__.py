@@ -1,3 +1,4 @@
+from mashumaro.core.meta.mixin import warmup
 from mashumaro.exceptions import MissingField
 from mashumaro.helper import field_options, pass_through
 from mashumaro.mixins.dict import DataClassDictMixin
@@ -7,4 +8,5 @@ __all__ = [
     "DataClassDictMixin",
     "field_options",
     "pass_through",
+    "warmup",
 ]
@@ -0,0 +1,88 @@
+import argparse
+import importlib
+import importlib.util
+import marshal
+import sys
+from typing import Dict, List, Mapping, Optional, Sequence
+
+from mashumaro.core.meta.code.cache import code_cache
+from mashumaro.core.meta.mixin import warmup
+from mashumaro.mixins.dict import DataClassDictMixin
+
+__all__ = ["generate_bytecode_cache_module", "add_cached_bytecode", "main"]
+
+
+HEADER = "# Bytecode cache generated by mashumaro.bytecode_cache. DO NOT EDIT."
+
+
+def add_cached_bytecode(magic: bytes, entries: Mapping[str, bytes]) -> None:
+    if magic != importlib.util.MAGIC_NUMBER:
+        # compiled for another python version, the code will be compiled
+        # at runtime as usual
+        return
+    code_cache.in_memory.update(entries)
+
+
+def generate_bytecode_cache_module(module_names: Sequence[str]) -> str:
+    recorder: Dict = {}
+    code_cache.recorder = recorder
+    try:
+        for module_name in module_names:
+            module = importlib.import_module(module_name)
+            # lazily compiled methods are included as well
+            warmup(
+                obj
+                for obj in vars(module).values()
+                if isinstance(obj, type)
+                and issubclass(obj, DataClassDictMixin)
+                and obj.__module__ == module_name
+            )
+    finally:
+        code_cache.recorder = None
+    lines = [
+        HEADER,
+        f"# Source modules: {', '.join(module_names)}",
+        "# Marshalled code objects for the code generated by mashumaro,",
+        "# keyed by the hash of the generated source. The code is still",
+        "# generated at runtime, only its compilation is skipped. They are",
+        "# used only by the Python version that produced them.",
+        "from mashumaro.bytecode_cache import add_cached_bytecode",
+        "",
+        "add_cached_bytecode(",
+        f"    {importlib.util.MAGIC_NUMBER!r},",
+        "    {",
+    ]
+    for key in sorted(recorder):
+        lines.append(f"        {key!r}: {marshal.dumps(recorder[key])!r},")
+    lines.extend(["    },", ")", ""])
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m mashumaro.bytecode_cache",
+        description=(
+            "Compile the code generated for dataclasses in the given modules "
+            "and write the bytecode to an importable python module"
+        ),
+    )
+    parser.add_argument("modules", nargs="+", help="modules to compile")
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="path to the output module (default: stdout)",
+    )
+    args = parser.parse_args(argv)
+    if "" not in sys.path:
+        sys.path.insert(0, "")
+    source = generate_bytecode_cache_module(args.modules)
+    if args.output == "-":
+        sys.stdout.write(source)
+    else:
+        with open(args.output, "w", encoding="utf8") as f:
+            f.write(source)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -1,8 +1,16 @@
+import gc
 import re
-from typing import Any, Callable, Optional, Type
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Collection, Optional, Type
 
 from mashumaro.core.meta.code.builder import CodeBuilder
-from mashumaro.core.meta.helpers import is_optional, is_type_var_any
+from mashumaro.core.meta.helpers import (
+    get_args,
+    get_type_origin,
+    is_optional,
+    is_type_var_any,
+    type_name,
+)
 from mashumaro.core.meta.types.common import (
     AttrsHolder,
     FieldContext,
@@ -10,10 +18,19 @@ from mashumaro.core.meta.types.common import (
 )
 from mashumaro.core.meta.types.pack import PackerRegistry
 from mashumaro.core.meta.types.unpack import UnpackerRegistry
+from mashumaro.stats import codegen_stats
 
 CALL_EXPR = re.compile(r"^([^ ]+)\(value\)$")
 
 
+def _check_projected_shape_type(shape_type: Type, action: str) -> None:
+    if not is_dataclass(get_type_origin(shape_type)):
+        raise ValueError(
+            f"Can't {action} only some fields of {type_name(shape_type)}, "
+            "it's not a dataclass"
+        )
+
+
 class CodecCodeBuilder(CodeBuilder):
     @classmethod
     def new(cls, **kwargs: Any) -> "CodecCodeBuilder":
@@ -26,80 +43,242 @@ class CodecCodeBuilder(CodeBuilder):
         shape_type: Type,
         decoder_obj: Any,
         pre_decoder_func: Optional[Callable[[Any], Any]] = None,
+        only: Optional[Collection[str]] = None,
+        add_iter_method: bool = False,
     ) -> None:
-        self.reset()
-        with self.indent("def decode(value):"):
+        self.stats_target = shape_type
+        with codegen_stats.measure(shape_type, self.format_name, "generate"):
+            self.reset()
+            with self.indent("def decode(value):"):
+                if pre_decoder_func:
+                    self.ensure_object_imported(pre_decoder_func, "decoder")
+                    self.add_line("value = decoder(value)")
+                if only is not None:
+                    unpacked_value = self._get_projected_unpacker(
+                        shape_type, only
+                    )
+                else:
+                    could_be_none = (
+                        shape_type in (Any, type(None), None)
+                        or is_type_var_any(self.get_real_type("", shape_type))
+                        or is_optional(
+                            shape_type,
+                            self.get_field_resolved_type_params(""),
+                        )
+                    )
+                    unpacked_value = UnpackerRegistry.get(
+                        ValueSpec(
+                            type=shape_type,
+                            expression="value",
+                            builder=self,
+                            field_ctx=FieldContext(name="", metadata={}),
+                            could_be_none=could_be_none,
+                        )
+                    )
+                self.add_line(f"return {unpacked_value}")
+            self.add_line("setattr(decoder_obj, 'decode', decode)")
+            if pre_decoder_func is None:
+                m = CALL_EXPR.match(unpacked_value)
+                if m:
+                    method_name = m.group(1)
+                    self.lines.reset()
+                    self.add_line(
+                        f"setattr(decoder_obj, 'decode', {method_name})"
+                    )
             if pre_decoder_func:
-                self.ensure_object_imported(pre_decoder_func, "decoder")
-                self.add_line("value = decoder(value)")
-            could_be_none = (
-                shape_type in (Any, type(None), None)
-                or is_type_var_any(self.get_real_type("", shape_type))
-                or is_optional(
-                    shape_type, self.get_field_resolved_type_params("")
+                self._add_many_method(
+                    "decode_many", "decoder_obj", unpacked_value, "decoder"
                 )
-            )
-            unpacked_value = UnpackerRegistry.get(
-                ValueSpec(
-                    type=shape_type,
-                    expression="value",
-                    builder=self,
-                    field_ctx=FieldContext(name="", metadata={}),
-                    could_be_none=could_be_none,
+            else:
+                self._add_many_method(
+                    "decode_many", "decoder_obj", unpacked_value
+                )
+            if add_iter_method:
+                self._add_iter_method(
+                    "_unpack_values", "decoder_obj", unpacked_value
                 )
+            self.ensure_object_imported(decoder_obj, "decoder_obj")
+            self.ensure_object_imported(self.cls, "cls")
+            self.compile()
+
+    def _get_projected_builder(
+        self, shape_type: Type, only: Collection[str]
+    ) -> CodeBuilder:
+        # the projected method is kept out of the registry, which is used
+        # for the types of the fields
+        return CodeBuilder(
+            get_type_origin(shape_type),
+            get_args(shape_type),
+            format_name=self.format_name,
+            default_dialect=self.default_dialect,
+            attrs=AttrsHolder(),
+            attrs_registry=self.attrs_registry,
+            only=frozenset(only),
+        )
+
+    def _get_projected_unpacker(
+        self, shape_type: Type, only: Collection[str]
+    ) -> str:
+        _check_projected_shape_type(shape_type, "deserialize")
+        builder = self._get_projected_builder(shape_type, only)
+        builder.add_unpack_method()
+        method_name = builder.get_unpack_method_name(
+            type_args=get_args(shape_type), format_name=self.format_name
+        )
+        self.ensure_object_imported(
+            getattr(builder.attrs, method_name), "projected_unpacker"
+        )
+        return "projected_unpacker(value)"
+
+    def _get_projected_packer(
+        self,
+        shape_type: Type,
+        include: Optional[Collection[str]],
+        exclude: Optional[Collection[str]],
+    ) -> str:
+        _check_projected_shape_type(shape_type, "serialize")
+        field_names = {f.name for f in fields(get_type_origin(shape_type))}
+        only = set(field_names if include is None else include)
+        unknown_fields = only.union(exclude or ()).difference(field_names)
+        if unknown_fields:
+            raise ValueError(
+                f"{type_name(shape_type)} doesn't have fields "
+                f"{', '.join(sorted(unknown_fields))} to serialize"
             )
-            self.add_line(f"return {unpacked_value}")
-        self.add_line("setattr(decoder_obj, 'decode', decode)")
-        if pre_decoder_func is None:
-            m = CALL_EXPR.match(unpacked_value)
-            if m:
-                method_name = m.group(1)
-                self.lines.reset()
-                self.add_line(f"setattr(decoder_obj, 'decode', {method_name})")
-        self.ensure_object_imported(decoder_obj, "decoder_obj")
-        self.ensure_object_imported(self.cls, "cls")
-        self.compile()
+        builder = self._get_projected_builder(
+            shape_type, only.difference(exclude or ())
+        )
+        builder.add_pack_method()
+        method_name = builder.get_pack_method_name(
+            type_args=get_args(shape_type), format_name=self.format_name
+        )
+        self.ensure_object_imported(
+            getattr(builder.attrs, method_name), "projected_packer"
+        )
+        return "projected_packer(value)"
 
     def add_encode_method(
         self,
         shape_type: Type,
         encoder_obj: Any,
         post_encoder_func: Optional[Callable[[Any], Any]] = None,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
+        add_iter_method: bool = False,
     ) -> None:
-        self.reset()
-        with self.indent("def encode(value):"):
-            could_be_none = (
-                shape_type in (Any, type(None), None)
-                or is_type_var_any(self.get_real_type("", shape_type))
-                or is_optional(
-                    shape_type, self.get_field_resolved_type_params("")
-                )
-            )
-            packed_value = PackerRegistry.get(
-                ValueSpec(
-                    type=shape_type,
-                    expression="value",
-                    builder=self,
-                    field_ctx=FieldContext(name="", metadata={}),
-                    could_be_none=could_be_none,
-                    no_copy_collections=self.get_dialect_or_config_option(
-                        "no_copy_collections", ()
-                    ),
-                )
-            )
+        self.stats_target = shape_type
+        with codegen_stats.measure(shape_type, self.format_name, "generate"):
+            self.reset()
+            with self.indent("def encode(value):"):
+                if include is not None or exclude is not None:
+                    packed_value = self._get_projected_packer(
+                        shape_type, include, exclude
+                    )
+                else:
+                    could_be_none = (
+                        shape_type in (Any, type(None), None)
+                        or is_type_var_any(self.get_real_type("", shape_type))
+                        or is_optional(
+                            shape_type,
+                            self.get_field_resolved_type_params(""),
+                        )
+                    )
+                    packed_value = PackerRegistry.get(
+                        ValueSpec(
+                            type=shape_type,
+                            expression="value",
+                            builder=self,
+                            field_ctx=FieldContext(name="", metadata={}),
+                            could_be_none=could_be_none,
+                            no_copy_collections=(
+                                self.get_dialect_or_config_option(
+                                    "no_copy_collections", ()
+                                )
+                            ),
+                        )
+                    )
+                if post_encoder_func:
+                    self.ensure_object_imported(post_encoder_func, "encoder")
+                    self.add_line(f"return encoder({packed_value})")
+                else:
+                    self.add_line(f"return {packed_value}")
+            self.add_line("setattr(encoder_obj, 'encode', encode)")
+            if post_encoder_func is None:
+                m = CALL_EXPR.match(packed_value)
+                if m:
+                    method_name = m.group(1)
+                    self.lines.reset()
+                    self.add_line(
+                        f"setattr(encoder_obj, 'encode', {method_name})"
+                    )
             if post_encoder_func:
-                self.ensure_object_imported(post_encoder_func, "encoder")
-                self.add_line(f"return encoder({packed_value})")
+                self._add_many_method(
+                    "encode_many",
+                    "encoder_obj",
+                    packed_value,
+                    post_func_name="encoder",
+                )
             else:
-                self.add_line(f"return {packed_value}")
-        self.add_line("setattr(encoder_obj, 'encode', encode)")
-        if post_encoder_func is None:
-            m = CALL_EXPR.match(packed_value)
-            if m:
-                method_name = m.group(1)
-                self.lines.reset()
-                self.add_line(f"setattr(encoder_obj, 'encode', {method_name})")
-        self.ensure_object_imported(encoder_obj, "encoder_obj")
-        self.ensure_object_imported(self.cls, "cls")
-        self.ensure_object_imported(self.cls, "self")
-        self.compile()
+                self._add_many_method(
+                    "encode_many", "encoder_obj", packed_value
+                )
+            if add_iter_method:
+                self._add_iter_method(
+                    "_pack_values", "encoder_obj", packed_value
+                )
+            self.ensure_object_imported(encoder_obj, "encoder_obj")
+            self.ensure_object_imported(self.cls, "cls")
+            self.ensure_object_imported(self.cls, "self")
+            self.compile()
+
+    def _add_many_method(
+        self,
+        method_name: str,
+        codec_obj_name: str,
+        expression: str,
+        pre_func_name: Optional[str] = None,
+        post_func_name: Optional[str] = None,
+    ) -> None:
+        # the loop runs inside the generated function and, if the value is
+        # converted by a single function, inside map without any bytecode
+        values = "values"
+        if pre_func_name:
+            values = f"map({pre_func_name}, values)"
+        m = CALL_EXPR.match(expression)
+        if m:
+            items = f"map({m.group(1)}, {values})"
+            if post_func_name:
+                items = f"map({post_func_name}, {items})"
+            result = f"list({items})"
+        else:
+            if post_func_name:
+                expression = f"{post_func_name}({expression})"
+            result = f"[{expression} for value in {values}]"
+        self.ensure_module_imported(gc)
+        with self.indent(f"def {method_name}(values, *, pause_gc=False):"):
+            with self.indent("if pause_gc and gc.isenabled():"):
+                self.add_line("gc.disable()")
+                with self.indent("try:"):
+                    self.add_line(f"return {result}")
+                with self.indent("finally:"):
+                    self.add_line("gc.enable()")
+            self.add_line(f"return {result}")
+        self.add_line(
+            f"setattr({codec_obj_name}, '{method_name}', {method_name})"
+        )
+
+    def _add_iter_method(
+        self, method_name: str, codec_obj_name: str, expression: str
+    ) -> None:
+        # the values are converted without the encoder and decoder functions
+        # for the codecs that encode or decode many values at once
+        m = CALL_EXPR.match(expression)
+        if m:
+            result = f"map({m.group(1)}, values)"
+        else:
+            result = f"({expression} for value in values)"
+        with self.indent(f"def {method_name}(values):"):
+            self.add_line(f"return {result}")
+        self.add_line(
+            f"setattr({codec_obj_name}, '{method_name}', {method_name})"
+        )
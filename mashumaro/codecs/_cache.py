@@ -0,0 +1,32 @@
+from functools import lru_cache
+from typing import Any, Callable, Tuple, TypeVar
+
+__all__ = ["CODECS_CACHE_SIZE", "get_codec"]
+
+
+CODECS_CACHE_SIZE = 256
+
+C = TypeVar("C")
+
+
+@lru_cache(maxsize=CODECS_CACHE_SIZE)
+def _get_cached_codec(
+    codec_cls: Callable[..., Any],
+    shape_type: Any,
+    shape_type_repr: str,
+    kwargs: Tuple[Tuple[str, Any], ...],
+) -> Any:
+    return codec_cls(shape_type, **dict(kwargs))
+
+
+def get_codec(
+    codec_cls: Callable[..., C], shape_type: Any, **kwargs: Any
+) -> C:
+    key = tuple(kwargs.items())
+    try:
+        hash((shape_type, key))
+    except TypeError:
+        return codec_cls(shape_type, **kwargs)
+    # Union[int, str] == Union[str, int] but the order of the arguments
+    # matters for us, so we add repr to the key
+    return _get_cached_codec(codec_cls, shape_type, repr(shape_type), key)
@@ -0,0 +1,224 @@
+import re
+from typing import (
+    IO,
+    Any,
+    AnyStr,
+    Iterable,
+    Iterator,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
+
+__all__ = ["STREAM_CHUNK_SIZE", "iter_chunks", "iter_json_documents"]
+
+
+STREAM_CHUNK_SIZE = 65536
+
+# the part of a JSON string after the opening quote without the closing one
+_STRING_REST_PATTERN = r'[^"\\]*(?:\\.[^"\\]*)*'
+_STRING_PATTERN = rf'"{_STRING_REST_PATTERN}"'
+# a complete JSON string, a quote of an incomplete one or a character that
+# changes the nesting of a JSON array element or ends it
+_TOKEN_PATTERN = rf'{_STRING_PATTERN}|["\[\]{{}},]'
+# commas don't matter inside the nested values
+_NESTED_TOKEN_PATTERN = rf'{_STRING_PATTERN}|["\[\]{{}}]'
+# elements nested not deeper than this are skipped by a single regex match
+_ELEMENT_MAX_DEPTH = 3
+
+
+def _get_element_pattern(max_depth: int) -> str:
+    value = rf'(?:{_STRING_PATTERN}|[^"\[\]{{}}])*'
+    for _ in range(max_depth):
+        value = rf'(?:{_STRING_PATTERN}|[^"\[\]{{}}]|\[{value}\]|{{{value}}})*'
+    return rf'(?:{_STRING_PATTERN}|[^"\[\]{{}},]|\[{value}\]|{{{value}}})*'
+
+
+_ELEMENT_PATTERN = _get_element_pattern(_ELEMENT_MAX_DEPTH)
+_STR_TOKEN_RE = re.compile(_TOKEN_PATTERN, re.DOTALL)
+_BYTES_TOKEN_RE = re.compile(_TOKEN_PATTERN.encode(), re.DOTALL)
+_STR_NESTED_TOKEN_RE = re.compile(_NESTED_TOKEN_PATTERN, re.DOTALL)
+_BYTES_NESTED_TOKEN_RE = re.compile(_NESTED_TOKEN_PATTERN.encode(), re.DOTALL)
+_STR_STRING_REST_RE = re.compile(_STRING_REST_PATTERN, re.DOTALL)
+_BYTES_STRING_REST_RE = re.compile(_STRING_REST_PATTERN.encode(), re.DOTALL)
+_STR_ELEMENT_RE = re.compile(_ELEMENT_PATTERN, re.DOTALL)
+_BYTES_ELEMENT_RE = re.compile(_ELEMENT_PATTERN.encode(), re.DOTALL)
+
+StreamSource = Union[IO[str], IO[bytes], Iterable[Union[str, bytes]]]
+
+
+def iter_chunks(source: StreamSource) -> Iterator[Any]:
+    read = getattr(source, "read", None)
+    if read is not None:
+        while True:
+            chunk = read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        for chunk in source:
+            if chunk:
+                yield chunk
+
+
+def iter_json_documents(
+    source: StreamSource, lines: Optional[bool] = None
+) -> Iterator[Any]:
+    # Yields the encoded JSON documents of NDJSON or the encoded elements of
+    # a top-level JSON array. Only the boundaries of the documents are found
+    # here, the documents themselves are validated by the decoder.
+    chunks = iter_chunks(source)
+    for buffer in chunks:
+        if buffer.strip():
+            break
+    else:
+        return
+    buffer = buffer.lstrip()
+    if lines is None:
+        lines = buffer[:1] not in ("[", b"[")
+    if lines:
+        yield from _iter_lines(buffer, chunks)
+    elif buffer[:1] in ("[", b"["):
+        yield from _iter_array_elements(buffer[1:], chunks)
+    else:
+        raise ValueError("Expected JSON array")
+
+
+def _iter_lines(buffer: AnyStr, chunks: Iterator[AnyStr]) -> Iterator[AnyStr]:
+    newline = b"\n" if isinstance(buffer, (bytes, bytearray)) else "\n"
+    while True:
+        lines = buffer.split(newline)  # type: ignore[arg-type]
+        buffer = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield line
+        chunk = next(chunks, None)
+        if chunk is None:
+            break
+        buffer += chunk
+    if buffer.strip():
+        yield buffer
+
+
+def _iter_array_elements(
+    buffer: AnyStr, chunks: Iterator[AnyStr]
+) -> Iterator[AnyStr]:
+    element_re: Pattern[Any]
+    token_re: Pattern[Any]
+    nested_token_re: Pattern[Any]
+    string_rest_re: Pattern[Any]
+    if isinstance(buffer, (bytes, bytearray)):
+        element_re = _BYTES_ELEMENT_RE
+        token_re, nested_token_re = _BYTES_TOKEN_RE, _BYTES_NESTED_TOKEN_RE
+        string_rest_re = _BYTES_STRING_REST_RE
+        quote, opening, closing, comma = 34, (91, 123), 93, 44
+    else:
+        element_re = _STR_ELEMENT_RE
+        token_re, nested_token_re = _STR_TOKEN_RE, _STR_NESTED_TOKEN_RE
+        string_rest_re = _STR_STRING_REST_RE
+        quote, opening, closing, comma = '"', ("[", "{"), "]", ","
+    start = 0  # where the current element begins
+    pos = 0  # where to continue scanning from
+    depth = 0
+    elements = 0
+    open_string = False  # whether the string at pos isn't complete
+    while True:
+        if depth:
+            for nested in nested_token_re.finditer(buffer, pos):
+                idx = nested.start()
+                token = buffer[idx]
+                if token == quote:
+                    if nested.end() - idx == 1:  # the string isn't complete
+                        pos = idx
+                        open_string = True
+                        break
+                elif token in opening:
+                    depth += 1
+                else:
+                    depth -= 1
+                    if not depth:
+                        pos = idx + 1
+                        break
+            else:
+                pos = len(buffer)
+            if not depth:
+                continue
+        else:
+            # the balanced part of the element is skipped at once, what's
+            # left of it is scanned token by token
+            balanced = element_re.match(buffer, pos)
+            pos = balanced.end()  # type: ignore[union-attr]
+            match = token_re.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+            else:
+                idx = match.start()
+                token = buffer[idx]
+                if token == quote:
+                    if match.end() - idx > 1:
+                        pos = match.end()
+                        continue
+                    pos = idx
+                    open_string = True
+                elif token in opening:
+                    depth = 1
+                    pos = idx + 1
+                    continue
+                elif token == comma or token == closing:
+                    element = buffer[start:idx]
+                    if token == comma or elements or element.strip():
+                        yield element
+                        elements += 1
+                    if token == closing:
+                        if buffer[idx + 1 :].strip() or any(
+                            chunk.strip() for chunk in chunks
+                        ):
+                            raise ValueError("Extra data after JSON array")
+                        return
+                    start = pos = idx + 1
+                    continue
+                else:
+                    raise ValueError("Unbalanced brackets in JSON array")
+        # the rest of the element is in the next chunks
+        if open_string:
+            buffer, pos = _read_open_string(
+                buffer[start:], pos - start, chunks, string_rest_re, quote
+            )
+            start = 0
+            open_string = False
+            continue
+        for chunk in chunks:
+            buffer = buffer[start:] + chunk
+            pos -= start
+            start = 0
+            break
+        else:
+            raise ValueError("Unexpected end of JSON array")
+
+
+def _read_open_string(
+    buffer: AnyStr,
+    pos: int,
+    chunks: Iterator[AnyStr],
+    string_rest_re: Pattern[Any],
+    quote: Any,
+) -> Tuple[AnyStr, int]:
+    # Reads the chunks until the string that begins at pos is closed and
+    # returns the joined buffer with the position after the string. Only
+    # the new chunks are scanned, so a long string is scanned once.
+    rest = string_rest_re.match(buffer, pos + 1)
+    # a backslash at the end escapes the first character of the next chunk
+    escaped = rest.end() < len(buffer)  # type: ignore[union-attr]
+    parts = [buffer]
+    size = len(buffer)
+    for chunk in chunks:
+        parts.append(chunk)
+        end = string_rest_re.match(  # type: ignore[union-attr]
+            chunk, int(escaped)
+        ).end()
+        if end < len(chunk) and chunk[end] == quote:
+            return buffer[:0].join(parts), size + end + 1
+        escaped = end < len(chunk)
+        size += len(chunk)
+    raise ValueError("Unexpected end of JSON array")
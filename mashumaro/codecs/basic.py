@@ -1,7 +1,10 @@
 from typing import (
     Any,
     Callable,
+    Collection,
     Generic,
+    Iterable,
+    List,
     Optional,
     Type,
     TypeVar,
@@ -11,6 +14,7 @@ from typing import (
 )
 
 from mashumaro.codecs._builder import CodecCodeBuilder
+from mashumaro.codecs._cache import get_codec
 from mashumaro.core.meta.helpers import get_args
 from mashumaro.dialect import Dialect
 
@@ -25,6 +29,7 @@ class BasicDecoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         pre_decoder_func: Optional[Callable[[Any], Any]] = None,
+        only: Optional[Collection[str]] = None,
     ): ...
 
     @overload
@@ -34,6 +39,7 @@ class BasicDecoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         pre_decoder_func: Optional[Callable[[Any], Any]] = None,
+        only: Optional[Collection[str]] = None,
     ): ...
 
     def __init__(
@@ -42,15 +48,23 @@ class BasicDecoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         pre_decoder_func: Optional[Callable[[Any], Any]] = None,
+        only: Optional[Collection[str]] = None,
     ):
         code_builder = CodecCodeBuilder.new(
             type_args=get_args(shape_type), default_dialect=default_dialect
         )
-        code_builder.add_decode_method(shape_type, self, pre_decoder_func)
+        code_builder.add_decode_method(
+            shape_type, self, pre_decoder_func, only
+        )
 
     @final
     def decode(self, data: Any) -> T: ...
 
+    @final
+    def decode_many(
+        self, values: Iterable[Any], *, pause_gc: bool = False
+    ) -> List[T]: ...
+
 
 class BasicEncoder(Generic[T]):
     @overload
@@ -60,6 +74,8 @@ class BasicEncoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         post_encoder_func: Optional[Callable[[Any], Any]] = None,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
     ): ...
 
     @overload
@@ -69,6 +85,8 @@ class BasicEncoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         post_encoder_func: Optional[Callable[[Any], Any]] = None,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
     ): ...
 
     def __init__(
@@ -77,22 +95,31 @@ class BasicEncoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         post_encoder_func: Optional[Callable[[Any], Any]] = None,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
     ):
         code_builder = CodecCodeBuilder.new(
             type_args=get_args(shape_type), default_dialect=default_dialect
         )
-        code_builder.add_encode_method(shape_type, self, post_encoder_func)
+        code_builder.add_encode_method(
+            shape_type, self, post_encoder_func, include, exclude
+        )
 
     @final
     def encode(self, obj: T) -> Any: ...
 
+    @final
+    def encode_many(
+        self, values: Iterable[T], *, pause_gc: bool = False
+    ) -> List[Any]: ...
+
 
 def decode(data: Any, shape_type: Union[Type[T], Any]) -> T:
-    return BasicDecoder(shape_type).decode(data)
+    return get_codec(BasicDecoder, shape_type).decode(data)
 
 
 def encode(obj: T, shape_type: Union[Type[T], Any]) -> Any:
-    return BasicEncoder(shape_type).encode(obj)
+    return get_codec(BasicEncoder, shape_type).encode(obj)
 
 
 __all__ = [
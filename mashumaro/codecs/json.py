@@ -2,7 +2,11 @@ import json
 from typing import (
     Any,
     Callable,
+    Collection,
     Generic,
+    Iterable,
+    Iterator,
+    List,
     Optional,
     Type,
     TypeVar,
@@ -12,6 +16,8 @@ from typing import (
 )
 
 from mashumaro.codecs._builder import CodecCodeBuilder
+from mashumaro.codecs._cache import get_codec
+from mashumaro.codecs._stream import StreamSource, iter_json_documents
 from mashumaro.core.meta.helpers import get_args
 from mashumaro.dialect import Dialect
 
@@ -27,6 +33,7 @@ class JSONDecoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         pre_decoder_func: Callable[[EncodedData], Any] = json.loads,
+        only: Optional[Collection[str]] = None,
     ): ...
 
     @overload
@@ -36,6 +43,7 @@ class JSONDecoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         pre_decoder_func: Callable[[EncodedData], Any] = json.loads,
+        only: Optional[Collection[str]] = None,
     ): ...
 
     def __init__(
@@ -44,15 +52,30 @@ class JSONDecoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         pre_decoder_func: Callable[[EncodedData], Any] = json.loads,
+        only: Optional[Collection[str]] = None,
     ):
         code_builder = CodecCodeBuilder.new(
             type_args=get_args(shape_type), default_dialect=default_dialect
         )
-        code_builder.add_decode_method(shape_type, self, pre_decoder_func)
+        code_builder.add_decode_method(
+            shape_type, self, pre_decoder_func, only
+        )
 
     @final
     def decode(self, data: EncodedData) -> T: ...
 
+    @final
+    def decode_many(
+        self, values: Iterable[EncodedData], *, pause_gc: bool = False
+    ) -> List[T]: ...
+
+    def iter_decode(
+        self, source: StreamSource, *, lines: Optional[bool] = None
+    ) -> Iterator[T]:
+        decode = self.decode
+        for data in iter_json_documents(source, lines):
+            yield decode(data)
+
 
 class JSONEncoder(Generic[T]):
     @overload
@@ -62,6 +85,8 @@ class JSONEncoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         post_encoder_func: Callable[[Any], str] = json.dumps,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
     ): ...
 
     @overload
@@ -71,6 +96,8 @@ class JSONEncoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         post_encoder_func: Callable[[Any], str] = json.dumps,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
     ): ...
 
     def __init__(
@@ -79,24 +106,33 @@ class JSONEncoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         post_encoder_func: Callable[[Any], str] = json.dumps,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
     ):
         code_builder = CodecCodeBuilder.new(
             type_args=get_args(shape_type), default_dialect=default_dialect
         )
-        code_builder.add_encode_method(shape_type, self, post_encoder_func)
+        code_builder.add_encode_method(
+            shape_type, self, post_encoder_func, include, exclude
+        )
 
     @final
     def encode(self, obj: T) -> str: ...
 
+    @final
+    def encode_many(
+        self, values: Iterable[T], *, pause_gc: bool = False
+    ) -> List[str]: ...
+
 
 def json_decode(
     data: EncodedData,
     shape_type: Union[Type[T], Any],
     pre_decoder_func: Callable[[EncodedData], Any] = json.loads,
 ) -> T:
-    return JSONDecoder(shape_type, pre_decoder_func=pre_decoder_func).decode(
-        data
-    )
+    return get_codec(
+        JSONDecoder, shape_type, pre_decoder_func=pre_decoder_func
+    ).decode(data)
 
 
 def json_encode(
@@ -104,9 +140,9 @@ def json_encode(
     shape_type: Union[Type[T], Any],
     post_encoder_func: Callable[[Any], str] = json.dumps,
 ) -> str:
-    return JSONEncoder(shape_type, post_encoder_func=post_encoder_func).encode(
-        obj
-    )
+    return get_codec(
+        JSONEncoder, shape_type, post_encoder_func=post_encoder_func
+    ).encode(obj)
 
 
 decode = json_decode
@@ -1,7 +1,12 @@
 from typing import (
+    IO,
     Any,
     Callable,
+    Collection,
     Generic,
+    Iterable,
+    Iterator,
+    List,
     Optional,
     Type,
     TypeVar,
@@ -13,23 +18,20 @@ from typing import (
 import msgpack
 
 from mashumaro.codecs._builder import CodecCodeBuilder
+from mashumaro.codecs._cache import get_codec
+from mashumaro.codecs._stream import iter_chunks
 from mashumaro.core.meta.helpers import get_args
 from mashumaro.dialect import Dialect
 from mashumaro.mixins.msgpack import MessagePackDialect
+from mashumaro.mixins.msgpack import default_decoder as _default_decoder
+from mashumaro.mixins.msgpack import default_encoder as _default_encoder
 
 T = TypeVar("T")
 
 EncodedData = bytes
 PostEncoderFunc = Callable[[Any], EncodedData]
 PreDecoderFunc = Callable[[EncodedData], Any]
-
-
-def _default_decoder(data: EncodedData) -> Any:
-    return msgpack.unpackb(data, raw=False)
-
-
-def _default_encoder(data: Any) -> EncodedData:
-    return msgpack.packb(data, use_bin_type=True)
+StreamSource = Union[IO[bytes], Iterable[bytes]]
 
 
 class MessagePackDecoder(Generic[T]):
@@ -40,6 +42,7 @@ class MessagePackDecoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         pre_decoder_func: Optional[PreDecoderFunc] = _default_decoder,
+        only: Optional[Collection[str]] = None,
     ): ...
 
     @overload
@@ -49,6 +52,7 @@ class MessagePackDecoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         pre_decoder_func: Optional[PreDecoderFunc] = _default_decoder,
+        only: Optional[Collection[str]] = None,
     ): ...
 
     def __init__(
@@ -57,6 +61,7 @@ class MessagePackDecoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         pre_decoder_func: Optional[PreDecoderFunc] = _default_decoder,
+        only: Optional[Collection[str]] = None,
     ):
         if default_dialect is not None:
             default_dialect = MessagePackDialect.merge(default_dialect)
@@ -65,11 +70,32 @@ class MessagePackDecoder(Generic[T]):
         code_builder = CodecCodeBuilder.new(
             type_args=get_args(shape_type), default_dialect=default_dialect
         )
-        code_builder.add_decode_method(shape_type, self, pre_decoder_func)
+        code_builder.add_decode_method(
+            shape_type, self, pre_decoder_func, only, add_iter_method=True
+        )
 
     @final
     def decode(self, data: EncodedData) -> T: ...
 
+    @final
+    def decode_many(
+        self, values: Iterable[EncodedData], *, pause_gc: bool = False
+    ) -> List[T]: ...
+
+    def _unpack_values(self, values: Iterable[Any]) -> Iterator[T]: ...
+
+    def iter_decode(self, source: StreamSource) -> Iterator[T]:
+        # only the records that aren't complete yet are kept in the buffer
+        unpacker = msgpack.Unpacker(raw=False)
+        unpack_values = self._unpack_values
+        for chunk in iter_chunks(source):
+            unpacker.feed(chunk)
+            yield from unpack_values(unpacker)
+        try:
+            unpacker.read_bytes(1)  # fails if a record is incomplete
+        except ValueError:
+            raise ValueError("Unexpected end of MessagePack stream") from None
+
 
 class MessagePackEncoder(Generic[T]):
     @overload
@@ -79,6 +105,8 @@ class MessagePackEncoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         post_encoder_func: Optional[PostEncoderFunc] = _default_encoder,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
     ): ...
 
     @overload
@@ -88,6 +116,8 @@ class MessagePackEncoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         post_encoder_func: Optional[PostEncoderFunc] = _default_encoder,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
     ): ...
 
     def __init__(
@@ -96,6 +126,8 @@ class MessagePackEncoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         post_encoder_func: Optional[PostEncoderFunc] = _default_encoder,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
     ):
         if default_dialect is not None:
             default_dialect = MessagePackDialect.merge(default_dialect)
@@ -104,18 +136,39 @@ class MessagePackEncoder(Generic[T]):
         code_builder = CodecCodeBuilder.new(
             type_args=get_args(shape_type), default_dialect=default_dialect
         )
-        code_builder.add_encode_method(shape_type, self, post_encoder_func)
+        code_builder.add_encode_method(
+            shape_type,
+            self,
+            post_encoder_func,
+            include,
+            exclude,
+            add_iter_method=True,
+        )
 
     @final
     def encode(self, obj: T) -> EncodedData: ...
 
+    @final
+    def encode_many(
+        self, values: Iterable[T], *, pause_gc: bool = False
+    ) -> List[EncodedData]: ...
+
+    def _pack_values(self, values: Iterable[T]) -> Iterator[Any]: ...
+
+    def encode_batch(self, values: Iterable[T]) -> EncodedData:
+        packer = msgpack.Packer(use_bin_type=True, autoreset=False)
+        pack = packer.pack
+        for value in self._pack_values(values):
+            pack(value)
+        return packer.bytes()
+
 
 def msgpack_decode(data: EncodedData, shape_type: Union[Type[T], Any]) -> T:
-    return MessagePackDecoder(shape_type).decode(data)
+    return get_codec(MessagePackDecoder, shape_type).decode(data)
 
 
 def msgpack_encode(obj: T, shape_type: Union[Type[T], Any]) -> EncodedData:
-    return MessagePackEncoder(shape_type).encode(obj)
+    return get_codec(MessagePackEncoder, shape_type).encode(obj)
 
 
 decode = msgpack_decode
@@ -1,6 +1,10 @@
 from typing import (
     Any,
+    Collection,
     Generic,
+    Iterable,
+    Iterator,
+    List,
     Optional,
     Type,
     TypeVar,
@@ -12,6 +16,8 @@ from typing import (
 import orjson
 
 from mashumaro.codecs._builder import CodecCodeBuilder
+from mashumaro.codecs._cache import get_codec
+from mashumaro.codecs._stream import StreamSource, iter_json_documents
 from mashumaro.core.meta.helpers import get_args
 from mashumaro.dialect import Dialect
 from mashumaro.mixins.orjson import OrjsonDialect
@@ -27,6 +33,7 @@ class ORJSONDecoder(Generic[T]):
         shape_type: Type[T],
         *,
         default_dialect: Optional[Type[Dialect]] = None,
+        only: Optional[Collection[str]] = None,
     ): ...
 
     @overload
@@ -35,6 +42,7 @@ class ORJSONDecoder(Generic[T]):
         shape_type: Any,
         *,
         default_dialect: Optional[Type[Dialect]] = None,
+        only: Optional[Collection[str]] = None,
     ): ...
 
     def __init__(
@@ -42,6 +50,7 @@ class ORJSONDecoder(Generic[T]):
         shape_type: Union[Type[T], Any],
         *,
         default_dialect: Optional[Type[Dialect]] = None,
+        only: Optional[Collection[str]] = None,
     ):
         if default_dialect is not None:
             default_dialect = OrjsonDialect.merge(default_dialect)
@@ -50,11 +59,23 @@ class ORJSONDecoder(Generic[T]):
         code_builder = CodecCodeBuilder.new(
             type_args=get_args(shape_type), default_dialect=default_dialect
         )
-        code_builder.add_decode_method(shape_type, self, orjson.loads)
+        code_builder.add_decode_method(shape_type, self, orjson.loads, only)
 
     @final
     def decode(self, data: EncodedData) -> T: ...
 
+    @final
+    def decode_many(
+        self, values: Iterable[EncodedData], *, pause_gc: bool = False
+    ) -> List[T]: ...
+
+    def iter_decode(
+        self, source: StreamSource, *, lines: Optional[bool] = None
+    ) -> Iterator[T]:
+        decode = self.decode
+        for data in iter_json_documents(source, lines):
+            yield decode(data)
+
 
 class ORJSONEncoder(Generic[T]):
     @overload
@@ -63,6 +84,8 @@ class ORJSONEncoder(Generic[T]):
         shape_type: Type[T],
         *,
         default_dialect: Optional[Type[Dialect]] = None,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
     ): ...
 
     @overload
@@ -71,6 +94,8 @@ class ORJSONEncoder(Generic[T]):
         shape_type: Any,
         *,
         default_dialect: Optional[Type[Dialect]] = None,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
     ): ...
 
     def __init__(
@@ -78,6 +103,8 @@ class ORJSONEncoder(Generic[T]):
         shape_type: Union[Type[T], Any],
         *,
         default_dialect: Optional[Type[Dialect]] = None,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
     ):
         if default_dialect is not None:
             default_dialect = OrjsonDialect.merge(default_dialect)
@@ -86,18 +113,25 @@ class ORJSONEncoder(Generic[T]):
         code_builder = CodecCodeBuilder.new(
             type_args=get_args(shape_type), default_dialect=default_dialect
         )
-        code_builder.add_encode_method(shape_type, self, orjson.dumps)
+        code_builder.add_encode_method(
+            shape_type, self, orjson.dumps, include, exclude
+        )
 
     @final
     def encode(self, obj: T) -> bytes: ...
 
+    @final
+    def encode_many(
+        self, values: Iterable[T], *, pause_gc: bool = False
+    ) -> List[bytes]: ...
+
 
 def json_decode(data: EncodedData, shape_type: Type[T]) -> T:
-    return ORJSONDecoder(shape_type).decode(data)
+    return get_codec(ORJSONDecoder, shape_type).decode(data)
 
 
 def json_encode(obj: T, shape_type: Union[Type[T], Any]) -> bytes:
-    return ORJSONEncoder(shape_type).encode(obj)
+    return get_codec(ORJSONEncoder, shape_type).encode(obj)
 
 
 decode = json_decode
@@ -1,6 +1,9 @@
 from typing import (
     Any,
+    Collection,
     Generic,
+    Iterable,
+    List,
     Optional,
     Type,
     TypeVar,
@@ -12,6 +15,7 @@ from typing import (
 import tomli_w
 
 from mashumaro.codecs._builder import CodecCodeBuilder
+from mashumaro.codecs._cache import get_codec
 from mashumaro.core.meta.helpers import get_args
 from mashumaro.dialect import Dialect
 from mashumaro.mixins.toml import TOMLDialect
@@ -32,6 +36,7 @@ class TOMLDecoder(Generic[T]):
         shape_type: Type[T],
         *,
         default_dialect: Optional[Type[Dialect]] = None,
+        only: Optional[Collection[str]] = None,
     ): ...
 
     @overload
@@ -40,6 +45,7 @@ class TOMLDecoder(Generic[T]):
         shape_type: Any,
         *,
         default_dialect: Optional[Type[Dialect]] = None,
+        only: Optional[Collection[str]] = None,
     ): ...
 
     def __init__(
@@ -47,6 +53,7 @@ class TOMLDecoder(Generic[T]):
         shape_type: Union[Type[T], Any],
         *,
         default_dialect: Optional[Type[Dialect]] = None,
+        only: Optional[Collection[str]] = None,
     ):
         if default_dialect is not None:
             default_dialect = TOMLDialect.merge(default_dialect)
@@ -55,11 +62,16 @@ class TOMLDecoder(Generic[T]):
         code_builder = CodecCodeBuilder.new(
             type_args=get_args(shape_type), default_dialect=default_dialect
         )
-        code_builder.add_decode_method(shape_type, self, tomllib.loads)
+        code_builder.add_decode_method(shape_type, self, tomllib.loads, only)
 
     @final
     def decode(self, data: EncodedData) -> T: ...
 
+    @final
+    def decode_many(
+        self, values: Iterable[EncodedData], *, pause_gc: bool = False
+    ) -> List[T]: ...
+
 
 class TOMLEncoder(Generic[T]):
     @overload
@@ -68,6 +80,8 @@ class TOMLEncoder(Generic[T]):
         shape_type: Type[T],
         *,
         default_dialect: Optional[Type[Dialect]] = None,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
     ): ...
 
     @overload
@@ -76,6 +90,8 @@ class TOMLEncoder(Generic[T]):
         shape_type: Any,
         *,
         default_dialect: Optional[Type[Dialect]] = None,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
     ): ...
 
     def __init__(
@@ -83,6 +99,8 @@ class TOMLEncoder(Generic[T]):
         shape_type: Union[Type[T], Any],
         *,
         default_dialect: Optional[Type[Dialect]] = None,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
     ):
         if default_dialect is not None:
             default_dialect = TOMLDialect.merge(default_dialect)
@@ -91,18 +109,25 @@ class TOMLEncoder(Generic[T]):
         code_builder = CodecCodeBuilder.new(
             type_args=get_args(shape_type), default_dialect=default_dialect
         )
-        code_builder.add_encode_method(shape_type, self, tomli_w.dumps)
+        code_builder.add_encode_method(
+            shape_type, self, tomli_w.dumps, include, exclude
+        )
 
     @final
     def encode(self, obj: T) -> bytes: ...
 
+    @final
+    def encode_many(
+        self, values: Iterable[T], *, pause_gc: bool = False
+    ) -> List[bytes]: ...
+
 
 def toml_decode(data: EncodedData, shape_type: Type[T]) -> T:
-    return TOMLDecoder(shape_type).decode(data)
+    return get_codec(TOMLDecoder, shape_type).decode(data)
 
 
 def toml_encode(obj: T, shape_type: Union[Type[T], Any]) -> bytes:
-    return TOMLEncoder(shape_type).encode(obj)
+    return get_codec(TOMLEncoder, shape_type).encode(obj)
 
 
 decode = toml_decode
@@ -1,7 +1,10 @@
 from typing import (
     Any,
     Callable,
+    Collection,
     Generic,
+    Iterable,
+    List,
     Optional,
     Type,
     TypeVar,
@@ -13,6 +16,7 @@ from typing import (
 import yaml
 
 from mashumaro.codecs._builder import CodecCodeBuilder
+from mashumaro.codecs._cache import get_codec
 from mashumaro.core.meta.helpers import get_args
 from mashumaro.dialect import Dialect
 
@@ -44,6 +48,7 @@ class YAMLDecoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         pre_decoder_func: Optional[PreDecoderFunc] = _default_decoder,
+        only: Optional[Collection[str]] = None,
     ): ...
 
     @overload
@@ -53,6 +58,7 @@ class YAMLDecoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         pre_decoder_func: Optional[PreDecoderFunc] = _default_decoder,
+        only: Optional[Collection[str]] = None,
     ): ...
 
     def __init__(
@@ -61,15 +67,23 @@ class YAMLDecoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         pre_decoder_func: Optional[PreDecoderFunc] = _default_decoder,
+        only: Optional[Collection[str]] = None,
     ):
         code_builder = CodecCodeBuilder.new(
             type_args=get_args(shape_type), default_dialect=default_dialect
         )
-        code_builder.add_decode_method(shape_type, self, pre_decoder_func)
+        code_builder.add_decode_method(
+            shape_type, self, pre_decoder_func, only
+        )
 
     @final
     def decode(self, data: EncodedData) -> T: ...
 
+    @final
+    def decode_many(
+        self, values: Iterable[EncodedData], *, pause_gc: bool = False
+    ) -> List[T]: ...
+
 
 class YAMLEncoder(Generic[T]):
     @overload
@@ -79,6 +93,8 @@ class YAMLEncoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         post_encoder_func: Optional[PostEncoderFunc] = _default_encoder,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
     ): ...
 
     @overload
@@ -88,6 +104,8 @@ class YAMLEncoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         post_encoder_func: Optional[PostEncoderFunc] = _default_encoder,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
     ): ...
 
     def __init__(
@@ -96,22 +114,31 @@ class YAMLEncoder(Generic[T]):
         *,
         default_dialect: Optional[Type[Dialect]] = None,
         post_encoder_func: Optional[PostEncoderFunc] = _default_encoder,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
     ):
         code_builder = CodecCodeBuilder.new(
             type_args=get_args(shape_type), default_dialect=default_dialect
         )
-        code_builder.add_encode_method(shape_type, self, post_encoder_func)
+        code_builder.add_encode_method(
+            shape_type, self, post_encoder_func, include, exclude
+        )
 
     @final
     def encode(self, obj: T) -> EncodedData: ...
 
+    @final
+    def encode_many(
+        self, values: Iterable[T], *, pause_gc: bool = False
+    ) -> List[EncodedData]: ...
+
 
 def yaml_decode(data: EncodedData, shape_type: Union[Type[T], Any]) -> T:
-    return YAMLDecoder(shape_type).decode(data)
+    return get_codec(YAMLDecoder, shape_type).decode(data)
 
 
 def yaml_encode(obj: T, shape_type: Union[Type[T], Any]) -> EncodedData:
-    return YAMLEncoder(shape_type).encode(obj)
+    return get_codec(YAMLEncoder, shape_type).encode(obj)
 
 
 decode = yaml_decode
@@ -64,8 +64,11 @@ class BaseConfig:
     omit_none: Union[bool, Literal[Sentinel.MISSING]] = Sentinel.MISSING
     omit_default: Union[bool, Literal[Sentinel.MISSING]] = Sentinel.MISSING
     orjson_options: Optional[int] = 0
+    orjson_native: Union[bool, Literal[Sentinel.MISSING]] = Sentinel.MISSING
     json_schema: Dict[str, Any] = {}
     discriminator: Optional[Discriminator] = None
     lazy_compilation: bool = False
     sort_keys: bool = False
     allow_deserialization_not_by_alias: bool = False
+    trusted_input: Union[bool, Literal[Sentinel.MISSING]] = Sentinel.MISSING
+    construct_without_init: bool = False
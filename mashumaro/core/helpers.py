@@ -1,8 +1,12 @@
 import datetime
 import re
+from typing import Any
 
 __all__ = [
     "parse_timezone",
+    "datetime_to_timestamp_ms",
+    "timestamp_ms_to_datetime",
+    "copy_raw_value",
     "ConfigValue",
     "UTC_OFFSET_PATTERN",
 ]
@@ -10,6 +14,8 @@ __all__ = [
 
 UTC_OFFSET_PATTERN = r"^UTC(([+-][0-2][0-9]):([0-5][0-9]))?$"
 UTC_OFFSET_RE = re.compile(UTC_OFFSET_PATTERN)
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+MILLISECOND = datetime.timedelta(milliseconds=1)
 
 
 def parse_timezone(s: str) -> datetime.timezone:
@@ -30,6 +36,33 @@ def parse_timezone(s: str) -> datetime.timezone:
         return datetime.timezone.utc
 
 
+def datetime_to_timestamp_ms(value: datetime.datetime) -> int:
+    # integer arithmetic on timedelta doesn't lose precision like
+    # multiplying the float timestamp does
+    if value.tzinfo is None:
+        value = value.astimezone()
+    return (value - EPOCH) // MILLISECOND
+
+
+def timestamp_ms_to_datetime(value: int) -> datetime.datetime:
+    return EPOCH + datetime.timedelta(milliseconds=value)
+
+
+def copy_raw_value(value: Any, copy_lists: bool, copy_dicts: bool) -> Any:
+    # raw values come from decoders, so only lists and dicts are copied
+    value_type = type(value)
+    if value_type is list:
+        if copy_lists:
+            return [copy_raw_value(v, copy_lists, copy_dicts) for v in value]
+    elif value_type is dict:
+        if copy_dicts:
+            return {
+                k: copy_raw_value(v, copy_lists, copy_dicts)
+                for k, v in value.items()
+            }
+    return value
+
+
 class ConfigValue:
     def __init__(self, name: str):
         self.name = name
@@ -2,14 +2,22 @@ import enum
 import importlib
 import inspect
 import math
+import threading
 import types
 import typing
-import uuid
+import weakref
 from contextlib import contextmanager
 
 # noinspection PyProtectedMember
-from dataclasses import _FIELDS  # type: ignore
-from dataclasses import MISSING, Field, is_dataclass
+from dataclasses import (  # type: ignore
+    _FIELD_INITVAR,
+    _FIELDS,
+    _PARAMS,
+    MISSING,
+    Field,
+    fields,
+    is_dataclass,
+)
 from functools import lru_cache
 
 try:
@@ -29,6 +37,7 @@ from mashumaro.config import (
 )
 from mashumaro.core.const import Sentinel
 from mashumaro.core.helpers import ConfigValue
+from mashumaro.core.meta.code.cache import compile_source
 from mashumaro.core.meta.code.lines import CodeLines
 from mashumaro.core.meta.helpers import (
     evaluate_forward_ref,
@@ -59,6 +68,7 @@ from mashumaro.core.meta.types.common import (
     NoneType,
     ValueSpec,
     clean_id,
+    stable_hex,
 )
 from mashumaro.core.meta.types.pack import PackerRegistry
 from mashumaro.core.meta.types.unpack import (
@@ -80,6 +90,7 @@ from mashumaro.exceptions import (  # noqa
     UnsupportedDeserializationEngine,
     UnsupportedSerializationEngine,
 )
+from mashumaro.stats import codegen_stats
 from mashumaro.types import Discriminator
 
 __PRE_SERIALIZE__ = "__pre_serialize__"
@@ -90,6 +101,25 @@ __POST_DESERIALIZE__ = "__post_deserialize__"
 
 SIMPLE_TYPES = (int, float, bool, str, NoneType)
 
+LAZY_METHODS_ATTR = "__mashumaro_lazy_methods__"
+
+_compile_locks: typing.MutableMapping[
+    typing.Type, typing.Dict[str, threading.RLock]
+] = weakref.WeakKeyDictionary()
+_compile_locks_guard = threading.Lock()
+_orjson_native_checks: typing.Set[typing.Type] = set()
+
+
+def get_compile_lock(cls: typing.Type, method_name: str) -> threading.RLock:
+    with _compile_locks_guard:
+        locks = _compile_locks.get(cls)
+        if locks is None:
+            locks = _compile_locks[cls] = {}
+        lock = locks.get(method_name)
+        if lock is None:
+            lock = locks[method_name] = threading.RLock()
+        return lock
+
 
 class InternalMethodName(str):
     _PREFIX = "__mashumaro_"
@@ -121,6 +151,7 @@ class CodeBuilder:
         attrs_registry: typing.Optional[
             typing.Dict[typing.Any, typing.Any]
         ] = None,
+        only: typing.Optional[typing.FrozenSet[str]] = None,
     ):
         self.cls = cls
         self.lines: CodeLines = CodeLines()
@@ -129,6 +160,8 @@ class CodeBuilder:
             typing.Type, typing.Dict[typing.Type, typing.Type]
         ] = {}
         self.field_classes: typing.Dict = {}
+        self.is_lazy = False
+        self.stats_target: typing.Any = cls
         self.initial_type_args = type_args
         if dialect is not None and not is_dialect_subclass(dialect):
             raise BadDialect(
@@ -142,6 +175,8 @@ class CodeBuilder:
         self.decoder = decoder
         self.encoder = encoder
         self.encoder_kwargs = encoder_kwargs or {}
+        self.only = only
+        self._helper_name_digest: typing.Optional[str] = None
 
         if attrs is not None:
             self.attrs = attrs
@@ -155,10 +190,14 @@ class CodeBuilder:
     def reset(self) -> None:
         self.lines.reset()
         self.globals = globals().copy()
-        self.resolved_type_params = resolve_type_params(
-            self.cls, self.initial_type_args
-        )
+        with codegen_stats.measure(
+            self.stats_target, self.format_name, "resolve"
+        ):
+            self.resolved_type_params = resolve_type_params(
+                self.cls, self.initial_type_args
+            )
         self.field_classes = {}
+        self.is_lazy = False
 
     @property
     def namespace(self) -> typing.Mapping[typing.Any, typing.Any]:
@@ -172,14 +211,32 @@ class CodeBuilder:
     def is_nailed(self) -> bool:
         return self.attrs is self.cls
 
+    def get_helper_name_digest(self) -> str:
+        # helpers of the builders that share a holder are told apart by
+        # this digest, and the helpers of one builder are numbered in the
+        # order they are generated, so the names don't depend on what else
+        # was compiled before
+        if self._helper_name_digest is None:
+            self._helper_name_digest = stable_hex(
+                type_name(self.cls),
+                *map(type_name, self.initial_type_args),
+                self.format_name,
+                type_name(self.dialect),
+                type_name(self.default_dialect),
+            )
+        return self._helper_name_digest
+
     def __get_field_types(
         self, recursive: bool = True, include_extras: bool = False
     ) -> typing.Dict[str, typing.Any]:
         fields = {}
         try:
-            field_type_hints = typing_extensions.get_type_hints(
-                self.cls, include_extras=include_extras
-            )
+            with codegen_stats.measure(
+                self.stats_target, self.format_name, "resolve"
+            ):
+                field_type_hints = typing_extensions.get_type_hints(
+                    self.cls, include_extras=include_extras
+                )
         except NameError as e:
             name = get_name_error_name(e)
             raise UnresolvedTypeReferenceError(self.cls, name) from None
@@ -326,7 +383,22 @@ class CodeBuilder:
             else:
                 print(f"{type_name(self.cls)}:")
             print(code)
-        exec(code, self.globals, self.__dict__)
+        with codegen_stats.measure(
+            self.stats_target, self.format_name, "compile"
+        ):
+            exec(compile_source(code), self.globals, self.__dict__)
+        codegen_stats.count(self.stats_target, self.format_name, "methods")
+
+    def compile_helper(self, lines: CodeLines) -> None:
+        code = lines.as_text()
+        if self.get_config().debug:
+            print(f"{type_name(self.cls)}:")
+            print(code)
+        with codegen_stats.measure(
+            self.stats_target, self.format_name, "compile"
+        ):
+            exec(compile_source(code), self.globals, self.__dict__)
+        codegen_stats.count(self.stats_target, self.format_name, "helpers")
 
     def evaluate_forward_ref(
         self,
@@ -344,18 +416,23 @@ class CodeBuilder:
             return cls.__dict__[method_name]
 
     def _add_unpack_method_lines_lazy(self, method_name: str) -> None:
+        self.is_lazy = True
         if self.default_dialect is not None:
             self.add_type_modules(self.default_dialect)
-        self.add_line(
-            f"CodeBuilder("
-            f"cls,"
-            f"first_method='{method_name}',"
-            f"allow_postponed_evaluation=False,"
-            f"format_name='{self.format_name}',"
-            f"decoder={type_name(self.decoder)},"
-            f"default_dialect={type_name(self.default_dialect)}"
-            f").add_unpack_method()"
-        )
+        with self.indent(f"with get_compile_lock(cls, '{method_name}'):"):
+            with self.indent(
+                self._get_lazy_method_condition("cls", method_name)
+            ):
+                self.add_line(
+                    f"CodeBuilder("
+                    f"cls,"
+                    f"first_method='{method_name}',"
+                    f"allow_postponed_evaluation=False,"
+                    f"format_name='{self.format_name}',"
+                    f"decoder={type_name(self.decoder)},"
+                    f"default_dialect={type_name(self.default_dialect)}"
+                    f").add_unpack_method()"
+                )
         unpacker_args = [
             "d",
             self.get_unpack_method_flags(pass_decoder=True),
@@ -363,12 +440,31 @@ class CodeBuilder:
         unpacker_args_s = ", ".join(filter(None, unpacker_args))
         self.add_line(f"return cls.{method_name}({unpacker_args_s})")
 
+    @staticmethod
+    def _get_lazy_method_condition(cls_expr: str, method_name: str) -> str:
+        # the method could be compiled by another thread while we were
+        # waiting for the lock
+        return (
+            f"if '{method_name}' not in {cls_expr}.__dict__ or "
+            f"'{method_name}' in "
+            f"{cls_expr}.__dict__.get('{LAZY_METHODS_ATTR}', ()):"
+        )
+
     def _add_unpack_method_lines(self, method_name: str) -> None:
         config = self.get_config()
         if (
-            config.lazy_compilation
+            (
+                config.lazy_compilation
+                or (
+                    # the dataclass decorator hasn't been applied yet
+                    config.construct_without_init
+                    and _FIELDS not in self.namespace
+                    and "__init__" not in self.namespace
+                )
+            )
             and self.allow_postponed_evaluation
             and self.is_nailed
+            and self.dialect is None
         ):
             self._add_unpack_method_lines_lazy(method_name)
             return
@@ -426,12 +522,11 @@ class CodeBuilder:
                         f"{type_name(self.cls)}] signature"
                     )
             filtered_fields = []
-            pos_args = []
-            kw_args = []
+            pos_args: typing.List[str] = []
+            kw_args: typing.List[str] = []
             missing_kw_only = False
             add_kwargs = False
             kw_only_fields = set()
-            field_blocks = []
             for fname, ftype in field_types.items():
                 field = self.dataclass_fields.get(fname)
                 if field and not field.init:
@@ -449,62 +544,186 @@ class CodeBuilder:
                     missing_kw_only = True
                     kw_only_fields.add(fname)
                 filtered_fields.append((fname, ftype))
+            projected_fields = []
+            if self.only is not None:
+                unknown_fields = self.only.difference(
+                    fname for fname, _ in filtered_fields
+                )
+                if unknown_fields:
+                    raise ValueError(
+                        f"{type_name(self.cls)} doesn't have fields "
+                        f"{', '.join(sorted(unknown_fields))} to deserialize"
+                    )
+                filtered_fields = [
+                    (fname, ftype)
+                    for fname, ftype in filtered_fields
+                    if fname in self.only
+                ]
+                projected_fields = self._add_projected_defaults_lines()
+            without_init = self.only is not None or (
+                config.construct_without_init
+                and self._can_construct_without_init()
+            )
             if filtered_fields:
-                with self.indent("try:"):
-                    for fname, ftype in filtered_fields:
-                        self.add_type_modules(ftype)
-                        metadata = self.metadatas.get(fname, {})
-                        alias = metadata.get("alias")
-                        if alias is None:
-                            alias = config.aliases.get(fname)
-                        field_block = FieldUnpackerCodeBlockBuilder(
-                            self, self.lines.branch_off()
-                        ).build(
-                            fname=fname,
-                            ftype=ftype,
-                            metadata=metadata,
-                            alias=alias,
-                        )
-                        if field_block.in_kwargs:
-                            add_kwargs = True
-                        field_blocks.append(field_block)
-                    if add_kwargs:
-                        self.add_line("kwargs = {}")
-                    in_kwargs = False
-                    for field_block in field_blocks:
-                        self.lines.extend(field_block.lines)
-                        if field_block.in_kwargs:
-                            in_kwargs = True
-                        else:
-                            if (
-                                field_block.fname in kw_only_fields
-                                or in_kwargs
-                            ):
-                                kw_args.append(field_block.fname)
-                            else:
-                                pos_args.append(field_block.fname)
-                with self.indent("except AttributeError:"):
-                    with self.indent("if not isinstance(d, dict):"):
-                        self.add_line(
-                            "raise ValueError('Argument for "
-                            f"{type_name(self.cls)}.{method_name} method "
-                            "should be a dict instance') from None"
+                if self.get_dialect_or_config_option("trusted_input", False):
+                    add_kwargs = self._add_unpack_fields_lines(
+                        filtered_fields,
+                        kw_only_fields,
+                        pos_args,
+                        kw_args,
+                        without_init,
+                    )
+                else:
+                    with self.indent("try:"):
+                        add_kwargs = self._add_unpack_fields_lines(
+                            filtered_fields,
+                            kw_only_fields,
+                            pos_args,
+                            kw_args,
+                            without_init,
                         )
-                    with self.indent("else:"):
-                        self.add_line("raise")
+                    self._add_unpack_not_dict_check_lines(method_name)
 
-            args = [f"__{f}" for f in pos_args]
-            for kw_arg in kw_args:
-                args.append(f"{kw_arg}=__{kw_arg}")
-            if add_kwargs:
-                args.append("**kwargs")
-            cls_inst = f"cls({', '.join(args)})"
+            if without_init:
+                self._add_construct_without_init_lines(
+                    [fname for fname, _ in filtered_fields] + projected_fields
+                )
+                cls_inst = "inst"
+            else:
+                args = [f"__{f}" for f in pos_args]
+                for kw_arg in kw_args:
+                    args.append(f"{kw_arg}=__{kw_arg}")
+                if add_kwargs:
+                    args.append("**kwargs")
+                cls_inst = f"cls({', '.join(args)})"
 
             if post_deserialize:
                 self.add_line(f"return cls.{__POST_DESERIALIZE__}({cls_inst})")
             else:
                 self.add_line(f"return {cls_inst}")
 
+    def _add_unpack_fields_lines(
+        self,
+        fields: typing.List[typing.Tuple[str, typing.Any]],
+        kw_only_fields: typing.Set[str],
+        pos_args: typing.List[str],
+        kw_args: typing.List[str],
+        defaults_in_locals: bool = False,
+    ) -> bool:
+        config = self.get_config()
+        add_kwargs = False
+        field_blocks = []
+        for fname, ftype in fields:
+            self.add_type_modules(ftype)
+            metadata = self.metadatas.get(fname, {})
+            alias = metadata.get("alias")
+            if alias is None:
+                alias = config.aliases.get(fname)
+            field_block = FieldUnpackerCodeBlockBuilder(
+                self, self.lines.branch_off(), defaults_in_locals
+            ).build(
+                fname=fname,
+                ftype=ftype,
+                metadata=metadata,
+                alias=alias,
+            )
+            if field_block.in_kwargs:
+                add_kwargs = True
+            field_blocks.append(field_block)
+        if add_kwargs:
+            self.add_line("kwargs = {}")
+        in_kwargs = False
+        for field_block in field_blocks:
+            self.lines.extend(field_block.lines)
+            if field_block.in_kwargs:
+                in_kwargs = True
+            else:
+                if field_block.fname in kw_only_fields or in_kwargs:
+                    kw_args.append(field_block.fname)
+                else:
+                    pos_args.append(field_block.fname)
+        return add_kwargs
+
+    def _can_construct_without_init(self) -> bool:
+        # the instance must be the same as the one created by __init__
+        # generated by the dataclass decorator for this very class
+        params = self.namespace.get(_PARAMS)
+        init_code = getattr(self.namespace.get("__init__"), "__code__", None)
+        if (
+            params is None
+            or not params.init
+            or init_code is None
+            or init_code.co_filename != "<string>"
+            or hasattr(self.cls, "__post_init__")
+            or self.cls.__new__ is not object.__new__
+            or not (
+                params.frozen or self.cls.__setattr__ is object.__setattr__
+            )
+        ):
+            return False
+        in_dict = False
+        for field in self.namespace[_FIELDS].values():
+            if field._field_type is _FIELD_INITVAR:
+                return False
+            elif field.name not in self.dataclass_fields:
+                continue
+            elif not field.init:
+                return False
+            elif not isinstance(
+                getattr(self.cls, field.name, None), types.MemberDescriptorType
+            ):
+                in_dict = True
+        # __init__ is faster than updating __dict__ of a non-frozen instance
+        return params.frozen or not in_dict
+
+    def _add_projected_defaults_lines(self) -> typing.List[str]:
+        # the fields that weren't requested get their default values
+        # or are left unset
+        fields = []
+        for fname, field in self.dataclass_fields.items():
+            if fname in self.only:  # type: ignore[operator]
+                continue
+            if (
+                field.default is not MISSING
+                or field.default_factory is not MISSING
+            ):
+                default = self.get_field_default_expression(fname)
+                self.add_line(f"__{fname} = {default}")
+                fields.append(fname)
+        return fields
+
+    def _add_construct_without_init_lines(
+        self, fields: typing.List[str]
+    ) -> None:
+        self.ensure_object_imported(object.__new__, "object_new")
+        self.add_line("inst = object_new(cls)")
+        dict_fields = []
+        for fname in fields:
+            descriptor = getattr(self.cls, fname, None)
+            if isinstance(descriptor, types.MemberDescriptorType):
+                # also bypasses __setattr__ of frozen dataclasses
+                self.ensure_object_imported(
+                    descriptor.__set__, f"{fname}__set"
+                )
+                self.add_line(f"{fname}__set(inst, __{fname})")
+            else:
+                dict_fields.append(f"'{fname}': __{fname}")
+        if dict_fields:
+            self.add_line(
+                f"inst.__dict__.update({{{', '.join(dict_fields)}}})"
+            )
+
+    def _add_unpack_not_dict_check_lines(self, method_name: str) -> None:
+        with self.indent("except AttributeError:"):
+            with self.indent("if not isinstance(d, dict):"):
+                self.add_line(
+                    "raise ValueError('Argument for "
+                    f"{type_name(self.cls)}.{method_name} method "
+                    "should be a dict instance') from None"
+                )
+            with self.indent("else:"):
+                self.add_line("raise")
+
     def _add_unpack_method_with_dialect_lines(self, method_name: str) -> None:
         if self.decoder is not None:
             self.add_line("d = decoder(d)")
@@ -517,46 +736,52 @@ class CodeBuilder:
             self.add_line(f"return unpacker({unpacker_args})")
         if self.default_dialect:
             self.add_type_modules(self.default_dialect)
-        self.add_line(
-            "CodeBuilder("
-            "cls,dialect=dialect,"
-            f"first_method='{method_name}',"
-            f"format_name='{self.format_name}',"
-            f"default_dialect={type_name(self.default_dialect)}"
-            ").add_unpack_method()"
-        )
+        with self.indent(f"with get_compile_lock(cls, '{method_name}'):"):
+            with self.indent(f"if dialect not in cls.{cache_name}:"):
+                self.add_line(
+                    "CodeBuilder("
+                    "cls,dialect=dialect,"
+                    f"first_method='{method_name}',"
+                    f"format_name='{self.format_name}',"
+                    f"default_dialect={type_name(self.default_dialect)}"
+                    ").add_unpack_method()"
+                )
         self.add_line(f"return cls.{cache_name}[dialect]({unpacker_args})")
 
     def add_unpack_method(self) -> None:
-        self.reset()
-        method_name = self.get_unpack_method_name(
-            type_args=self.initial_type_args,
-            format_name=self.format_name,
-            decoder=self.decoder,
-        )
-        if self.decoder is not None:
-            self.add_type_modules(self.decoder)
-        dialects_feature = self.is_code_generation_option_enabled(
-            ADD_DIALECT_SUPPORT
-        )
-        cache_name = f"__dialect_{self.format_name}_unpacker_cache__"
-        if dialects_feature:
-            with self.indent(f"if not '{cache_name}' in cls.__dict__:"):
-                self.add_line(f"cls.{cache_name} = {{}}")
-
-        if self.dialect is None and self.is_nailed:
-            self.add_line("@classmethod")
-        self._add_unpack_method_definition(method_name)
-        with self.indent():
-            if dialects_feature and self.dialect is None:
-                with self.indent("if dialect is None:"):
+        with codegen_stats.measure(
+            self.stats_target, self.format_name, "generate"
+        ):
+            self.reset()
+            method_name = self.get_unpack_method_name(
+                type_args=self.initial_type_args,
+                format_name=self.format_name,
+                decoder=self.decoder,
+            )
+            if self.decoder is not None:
+                self.add_type_modules(self.decoder)
+            dialects_feature = self.is_code_generation_option_enabled(
+                ADD_DIALECT_SUPPORT
+            )
+            cache_name = f"__dialect_{self.format_name}_unpacker_cache__"
+            if dialects_feature:
+                with self.indent(f"if not '{cache_name}' in cls.__dict__:"):
+                    self.add_line(f"cls.{cache_name} = {{}}")
+
+            if self.dialect is None and self.is_nailed:
+                self.add_line("@classmethod")
+            self._add_unpack_method_definition(method_name)
+            with self.indent():
+                if dialects_feature and self.dialect is None:
+                    with self.indent("if dialect is None:"):
+                        self._add_unpack_method_lines(method_name)
+                    with self.indent("else:"):
+                        self._add_unpack_method_with_dialect_lines(method_name)
+                else:
                     self._add_unpack_method_lines(method_name)
-                with self.indent("else:"):
-                    self._add_unpack_method_with_dialect_lines(method_name)
-            else:
-                self._add_unpack_method_lines(method_name)
-        self._add_setattr_method(method_name, cache_name)
-        self.compile()
+            self._add_setattr_method(method_name, cache_name)
+            self.compile()
+        self._update_lazy_methods(method_name)
 
     def _add_unpack_method_definition(self, method_name: str) -> None:
         kwargs = ""
@@ -766,19 +991,26 @@ class CodeBuilder:
             return InternalMethodName.from_public(f"{method_name}")
 
     def _add_pack_method_lines_lazy(self, method_name: str) -> None:
+        self.is_lazy = True
         if self.default_dialect is not None:
             self.add_type_modules(self.default_dialect)
-        self.add_line(
-            "CodeBuilder("
-            "self.__class__,"
-            f"first_method='{method_name}',"
-            "allow_postponed_evaluation=False,"
-            f"format_name='{self.format_name}',"
-            f"encoder={type_name(self.encoder)},"
-            f"encoder_kwargs={self._get_encoder_kwargs()},"
-            f"default_dialect={type_name(self.default_dialect)}"
-            ").add_pack_method()"
-        )
+        with self.indent(
+            f"with get_compile_lock(self.__class__, '{method_name}'):"
+        ):
+            with self.indent(
+                self._get_lazy_method_condition("self.__class__", method_name)
+            ):
+                self.add_line(
+                    "CodeBuilder("
+                    "self.__class__,"
+                    f"first_method='{method_name}',"
+                    "allow_postponed_evaluation=False,"
+                    f"format_name='{self.format_name}',"
+                    f"encoder={type_name(self.encoder)},"
+                    f"encoder_kwargs={self._get_encoder_kwargs()},"
+                    f"default_dialect={type_name(self.default_dialect)}"
+                    ").add_pack_method()"
+                )
         packer_args = self.get_pack_method_flags(pass_encoder=True)
         self.add_line(f"return self.{method_name}({packer_args})")
 
@@ -788,6 +1020,7 @@ class CodeBuilder:
             config.lazy_compilation
             and self.allow_postponed_evaluation
             and self.is_nailed
+            and self.dialect is None
         ):
             self._add_pack_method_lines_lazy(method_name)
             return
@@ -801,6 +1034,13 @@ class CodeBuilder:
                 raise
             self._add_pack_method_lines_lazy(method_name)
         else:
+            if self.is_orjson_native():
+                # instances of subclasses could have other fields
+                self.ensure_object_imported(self.cls, "native_cls")
+                with self.indent("if self.__class__ is native_cls:"):
+                    self.add_line(
+                        self._get_pack_return_statement().format("self")
+                    )
             pre_serialize = self.get_declared_hook(__PRE_SERIALIZE__)
             if pre_serialize:
                 if self.is_code_generation_option_enabled(
@@ -837,6 +1077,8 @@ class CodeBuilder:
                 fnames_and_types = sorted(fnames_and_types, key=lambda x: x[0])
 
             for fname, ftype in fnames_and_types:
+                if self.only is not None and fname not in self.only:
+                    continue
                 if self.metadatas.get(fname, {}).get("serialize") == "omit":
                     continue
                 packer, alias, could_be_none = self._get_field_packer(
@@ -945,18 +1187,7 @@ class CodeBuilder:
                 kwargs = ", ".join(f"'{k}': {v}" for k, v in kwargs_parts)
                 kwargs = f"{{{kwargs}}}"
             post_serialize = self.get_declared_hook(__POST_SERIALIZE__)
-            if self.encoder is not None:
-                if self.encoder_kwargs:
-                    encoder_options = ", ".join(
-                        f"{k}={v[0]}" for k, v in self.encoder_kwargs.items()
-                    )
-                    return_statement = (
-                        f"return encoder({{}}, {encoder_options})"
-                    )
-                else:
-                    return_statement = "return encoder({})"
-            else:
-                return_statement = "return {}"
+            return_statement = self._get_pack_return_statement()
             if post_serialize:
                 if self.is_code_generation_option_enabled(
                     ADD_SERIALIZATION_CONTEXT
@@ -970,6 +1201,82 @@ class CodeBuilder:
             else:
                 self.add_line(return_statement.format(kwargs))
 
+    def _get_pack_return_statement(self) -> str:
+        if self.encoder is None:
+            return "return {}"
+        elif self.encoder_kwargs:
+            encoder_options = ", ".join(
+                f"{k}={v[0]}" for k, v in self.encoder_kwargs.items()
+            )
+            return f"return encoder({{}}, {encoder_options})"
+        else:
+            return "return encoder({})"
+
+    def is_orjson_native_enabled(self) -> bool:
+        # only the methods whose result goes to orjson can leave the values
+        # to it, they are built with a dialect that has this option
+        if (
+            getattr(self.default_dialect, "orjson_native", Sentinel.MISSING)
+            is Sentinel.MISSING
+        ):
+            return False
+        return bool(self.get_dialect_or_config_option("orjson_native", False))
+
+    def is_orjson_native(self) -> bool:
+        # orjson serializes an instance of a slotted dataclass as a dict
+        # of the fields, except for the ones starting with an underscore,
+        # so an instance that needs no transformation can be passed to it
+        # as it is. Instances with __dict__ are serialized by their
+        # attributes, which could include anything else.
+        if (
+            not self.is_orjson_native_enabled()
+            or not is_dataclass(self.cls)
+            or "__dataclass_fields__" not in self.cls.__dict__
+            or getattr(self.cls, "__dictoffset__", 0) != 0
+            or self.cls in _orjson_native_checks
+            or self.only is not None
+            or self.get_declared_hook(__PRE_SERIALIZE__)
+            or self.get_declared_hook(__POST_SERIALIZE__)
+            or self.is_code_generation_option_enabled(
+                TO_DICT_ADD_BY_ALIAS_FLAG
+            )
+            or self.is_code_generation_option_enabled(
+                TO_DICT_ADD_OMIT_NONE_FLAG
+            )
+            or self.get_dialect_or_config_option("omit_none", False)
+            or self.get_dialect_or_config_option("omit_default", False)
+            or self.get_config().sort_keys
+        ):
+            return False
+        # non-init fields may be missing in the instance __dict__
+        if not all(f.init for f in fields(self.cls)):
+            return False
+        try:
+            field_types = self.get_field_types(include_extras=True)
+        except UnresolvedTypeReferenceError:
+            return False
+        config = self.get_config()
+        serialize_by_alias = self.get_dialect_or_config_option(
+            "serialize_by_alias", False
+        )
+        _orjson_native_checks.add(self.cls)
+        try:
+            for fname, ftype in field_types.items():
+                if fname.startswith("_"):
+                    return False
+                if self.metadatas.get(fname, {}).get("serialize") == "omit":
+                    return False
+                packer, alias, could_be_none = self._get_field_packer(
+                    fname, ftype, config
+                )
+                if serialize_by_alias and alias is not None:
+                    return False
+                if packer != ("value" if could_be_none else f"self.{fname}"):
+                    return False
+        finally:
+            _orjson_native_checks.discard(self.cls)
+        return True
+
     def _pack_method_set_value(
         self,
         fname: str,
@@ -1036,14 +1343,20 @@ class CodeBuilder:
             self.add_line(return_statement.format(f"packer({packer_args})"))
         if self.default_dialect:
             self.add_type_modules(self.default_dialect)
-        self.add_line(
-            "CodeBuilder("
-            "self.__class__,dialect=dialect,"
-            f"first_method='{method_name}',"
-            f"format_name='{self.format_name}',"
-            f"default_dialect={type_name(self.default_dialect)}"
-            ").add_pack_method()"
-        )
+        with self.indent(
+            f"with get_compile_lock(self.__class__, '{method_name}'):"
+        ):
+            with self.indent(
+                f"if dialect not in self.__class__.{cache_name}:"
+            ):
+                self.add_line(
+                    "CodeBuilder("
+                    "self.__class__,dialect=dialect,"
+                    f"first_method='{method_name}',"
+                    f"format_name='{self.format_name}',"
+                    f"default_dialect={type_name(self.default_dialect)}"
+                    ").add_pack_method()"
+                )
         self.add_line(
             return_statement.format(
                 f"self.__class__.{cache_name}[dialect]({packer_args})"
@@ -1072,33 +1385,55 @@ class CodeBuilder:
         self.add_line(f"def {method_name}(self{kwargs}):")
 
     def add_pack_method(self) -> None:
-        self.reset()
-        method_name = self.get_pack_method_name(
-            type_args=self.initial_type_args,
-            format_name=self.format_name,
-            encoder=self.encoder,
-        )
-        if self.encoder is not None:
-            self.add_type_modules(self.encoder)
-        dialects_feature = self.is_code_generation_option_enabled(
-            ADD_DIALECT_SUPPORT
-        )
-        cache_name = f"__dialect_{self.format_name}_packer_cache__"
-        if dialects_feature:
-            with self.indent(f"if not '{cache_name}' in cls.__dict__:"):
-                self.add_line(f"cls.{cache_name} = {{}}")
-
-        self._add_pack_method_definition(method_name)
-        with self.indent():
-            if dialects_feature and self.dialect is None:
-                with self.indent("if dialect is None:"):
+        with codegen_stats.measure(
+            self.stats_target, self.format_name, "generate"
+        ):
+            self.reset()
+            method_name = self.get_pack_method_name(
+                type_args=self.initial_type_args,
+                format_name=self.format_name,
+                encoder=self.encoder,
+            )
+            if self.encoder is not None:
+                self.add_type_modules(self.encoder)
+            dialects_feature = self.is_code_generation_option_enabled(
+                ADD_DIALECT_SUPPORT
+            )
+            cache_name = f"__dialect_{self.format_name}_packer_cache__"
+            if dialects_feature:
+                with self.indent(f"if not '{cache_name}' in cls.__dict__:"):
+                    self.add_line(f"cls.{cache_name} = {{}}")
+
+            self._add_pack_method_definition(method_name)
+            with self.indent():
+                if dialects_feature and self.dialect is None:
+                    with self.indent("if dialect is None:"):
+                        self._add_pack_method_lines(method_name)
+                    with self.indent("else:"):
+                        self._add_pack_method_with_dialect_lines(method_name)
+                else:
                     self._add_pack_method_lines(method_name)
-                with self.indent("else:"):
-                    self._add_pack_method_with_dialect_lines(method_name)
-            else:
-                self._add_pack_method_lines(method_name)
-        self._add_setattr_method(method_name, cache_name)
-        self.compile()
+            self._add_setattr_method(method_name, cache_name)
+            self.compile()
+        self._update_lazy_methods(method_name)
+
+    def _update_lazy_methods(self, method_name: InternalMethodName) -> None:
+        if self.is_nailed and (
+            not self.allow_postponed_evaluation or self.dialect is not None
+        ):
+            codegen_stats.count(
+                self.stats_target, self.format_name, "lazy_compilations"
+            )
+        if self.dialect is not None or not self.is_nailed:
+            return
+        lazy_methods = self.cls.__dict__.get(LAZY_METHODS_ATTR)
+        if self.is_lazy:
+            if lazy_methods is None:
+                lazy_methods = set()
+                setattr(self.cls, LAZY_METHODS_ATTR, lazy_methods)
+            lazy_methods.add(method_name)
+        elif lazy_methods:
+            lazy_methods.discard(method_name)
 
     def _add_setattr_method(
         self, method_name: InternalMethodName, cache_name: str
@@ -1209,10 +1544,20 @@ class CodeBuilder:
         elif isinstance(value, tuple) and not is_named_tuple(type(value)):
             return repr(value)
         else:
-            name = f"v_{uuid.uuid4().hex}"
+            idx = 0
+            while f"v_{idx}" in self.globals:
+                idx += 1
+            name = f"v_{idx}"
             self.ensure_object_imported(value, name)
             return name
 
+    def get_field_default_expression(self, name: str) -> str:
+        field = self.dataclass_fields[name]
+        if field.default is not MISSING:
+            return self.get_field_default_literal(field.default)
+        factory = self.get_field_default_literal(field.default_factory)
+        return f"{factory}()"
+
 
 class FieldUnpackerCodeBlock:
     def __init__(self, lines: CodeLines, fname: str, in_kwargs: bool):
@@ -1222,9 +1567,18 @@ class FieldUnpackerCodeBlock:
 
 
 class FieldUnpackerCodeBlockBuilder:
-    def __init__(self, parent: CodeBuilder, lines: CodeLines):
+    def __init__(
+        self,
+        parent: CodeBuilder,
+        lines: CodeLines,
+        defaults_in_locals: bool = False,
+    ):
         self.parent = parent
         self.lines = lines
+        self.defaults_in_locals = defaults_in_locals
+        self.trusted_input = parent.get_dialect_or_config_option(
+            "trusted_input", False
+        )
 
     def _try_set_value(
         self,
@@ -1233,6 +1587,9 @@ class FieldUnpackerCodeBlockBuilder:
         unpacked_value: str,
         in_kwargs: bool,
     ) -> None:
+        if self.trusted_input:
+            self._set_value(field_name, unpacked_value, in_kwargs)
+            return
         with self.lines.indent("try:"):
             self._set_value(field_name, unpacked_value, in_kwargs)
         with self.lines.indent("except:"):
@@ -1259,6 +1616,8 @@ class FieldUnpackerCodeBlockBuilder:
     ) -> FieldUnpackerCodeBlock:
         default = self.parent.get_field_default(fname)
         has_default = default is not MISSING
+        # without __init__ the default values are assigned here
+        in_kwargs = has_default and not self.defaults_in_locals
         field_type = self.parent.get_type_name_identifier(
             ftype,
             resolved_type_params=self.parent.get_field_resolved_type_params(
@@ -1285,7 +1644,22 @@ class FieldUnpackerCodeBlockBuilder:
                 could_be_none=False if could_be_none else True,
             )
         )
-        if self.parent.get_config().allow_deserialization_not_by_alias:
+        # trusted input has all the required keys, so they're accessed
+        # directly without checking for MISSING
+        direct_access = (
+            self.trusted_input
+            and not has_default
+            and not self.parent.get_config().allow_deserialization_not_by_alias
+        )
+        if direct_access:
+            if unpacked_value != "value":
+                self.add_line(f"value = d['{alias or fname}']")
+                packed_value = "value"
+            else:
+                self.add_line(f"__{fname} = d['{alias or fname}']")
+                packed_value = f"__{fname}"
+                unpacked_value = packed_value
+        elif self.parent.get_config().allow_deserialization_not_by_alias:
             if unpacked_value != "value":
                 self.add_line(f"value = d.get('{alias}', MISSING)")
                 with self.indent("if value is MISSING:"):
@@ -1316,21 +1690,23 @@ class FieldUnpackerCodeBlockBuilder:
                 packed_value = f"__{fname}"
                 unpacked_value = packed_value
         if not has_default:
-            with self.indent(f"if {packed_value} is MISSING:"):
-                self.add_line(
-                    f"raise MissingField('{fname}',{field_type},cls) from None"
-                )
+            if not direct_access:
+                with self.indent(f"if {packed_value} is MISSING:"):
+                    self.add_line(
+                        f"raise MissingField('{fname}',{field_type},cls) "
+                        "from None"
+                    )
             if packed_value != unpacked_value:
                 if could_be_none:
                     with self.indent(f"if {packed_value} is not None:"):
                         self._try_set_value(
-                            fname, field_type, unpacked_value, has_default
+                            fname, field_type, unpacked_value, in_kwargs
                         )
                     with self.indent("else:"):
-                        self._set_value(fname, "None", has_default)
+                        self._set_value(fname, "None", in_kwargs)
                 else:
                     self._try_set_value(
-                        fname, field_type, unpacked_value, has_default
+                        fname, field_type, unpacked_value, in_kwargs
                     )
         else:
             with self.indent(f"if {packed_value} is not MISSING:"):
@@ -1338,21 +1714,26 @@ class FieldUnpackerCodeBlockBuilder:
                     if unpacked_value != "value":
                         with self.indent(f"if {packed_value} is not None:"):
                             self._try_set_value(
-                                fname, field_type, unpacked_value, has_default
+                                fname, field_type, unpacked_value, in_kwargs
                             )
-                        if default is not None:
+                        if default is not None or not in_kwargs:
                             with self.indent("else:"):
-                                self._set_value(fname, "None", has_default)
+                                self._set_value(fname, "None", in_kwargs)
                     else:
-                        self._set_value(fname, unpacked_value, has_default)
+                        self._set_value(fname, unpacked_value, in_kwargs)
                 else:
                     if unpacked_value != "value":
                         self._try_set_value(
-                            fname, field_type, unpacked_value, has_default
+                            fname, field_type, unpacked_value, in_kwargs
                         )
                     else:
-                        self._set_value(fname, unpacked_value, has_default)
-        return FieldUnpackerCodeBlock(self.lines, fname, has_default)
+                        self._set_value(fname, unpacked_value, in_kwargs)
+            if not in_kwargs:
+                with self.indent("else:"):
+                    self._set_value(
+                        fname, self.parent.get_field_default_expression(fname)
+                    )
+        return FieldUnpackerCodeBlock(self.lines, fname, in_kwargs)
 
     def add_line(self, line: str) -> None:
         self.lines.append(line)
@@ -0,0 +1,87 @@
+import importlib.util
+import marshal
+import os
+import tempfile
+import types
+from hashlib import sha256
+from typing import Dict, Optional
+
+__all__ = ["CodeCache", "code_cache", "compile_source"]
+
+
+CODE_CACHE_DIR_ENV_VAR = "MASHUMARO_CODE_CACHE_DIR"
+
+
+class CodeCache:
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory
+        self.in_memory: Dict[str, bytes] = {}
+        self.recorder: Optional[Dict[str, types.CodeType]] = None
+
+    @staticmethod
+    def get_key(source: str) -> str:
+        h = sha256(importlib.util.MAGIC_NUMBER)
+        h.update(source.encode())
+        return h.hexdigest()
+
+    def get_path(self, key: str) -> str:
+        assert self.directory is not None
+        return os.path.join(self.directory, f"{key}.bin")
+
+    def load(
+        self, source: str, key: Optional[str] = None
+    ) -> Optional[types.CodeType]:
+        if key is None:
+            key = self.get_key(source)
+        data = self.in_memory.get(key)
+        if data is None:
+            if self.directory is None:
+                return None
+            try:
+                with open(self.get_path(key), "rb") as f:
+                    data = f.read()
+            except OSError:
+                return None
+        try:
+            code = marshal.loads(data)
+        except (EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(code, types.CodeType):
+            return None
+        return code
+
+    def store(
+        self, source: str, code: types.CodeType, key: Optional[str] = None
+    ) -> None:
+        if self.directory is None:
+            return
+        path = self.get_path(key or self.get_key(source))
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(marshal.dumps(code))
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+
+    def get_code(self, source: str) -> types.CodeType:
+        key = self.get_key(source)
+        code = self.load(source, key)
+        if code is None:
+            code = compile(source, "<string>", "exec")
+            self.store(source, code, key)
+        if self.recorder is not None:
+            self.recorder[key] = code
+        return code
+
+
+code_cache = CodeCache(os.environ.get(CODE_CACHE_DIR_ENV_VAR) or None)
+
+
+def compile_source(source: str) -> types.CodeType:
+    return code_cache.get_code(source)
@@ -80,6 +80,8 @@ __all__ = [
     "is_type_var_tuple",
     "hash_type_args",
     "iter_all_subclasses",
+    "get_subclasses_generation",
+    "bump_subclasses_generation",
     "is_hashable",
     "is_hashable_type",
     "evaluate_forward_ref",
@@ -738,6 +740,20 @@ def iter_all_subclasses(cls: Type) -> typing.Iterator[Type]:
         yield from iter_all_subclasses(subclass)
 
 
+_subclasses_generation = 0
+
+
+def get_subclasses_generation() -> int:
+    return _subclasses_generation
+
+
+def bump_subclasses_generation() -> None:
+    # called when a new subclass of DataClassDictMixin is created, so that
+    # the lookup tables of discriminated unions could be updated
+    global _subclasses_generation
+    _subclasses_generation += 1
+
+
 def is_hashable(value: Any) -> bool:
     try:
         hash(value)
@@ -1,12 +1,26 @@
-from typing import Any, Dict, Optional, Tuple, Type
+from dataclasses import is_dataclass
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 
-from mashumaro.core.meta.code.builder import CodeBuilder
+from mashumaro.config import ADD_DIALECT_SUPPORT
+from mashumaro.core.meta.code.builder import LAZY_METHODS_ATTR, CodeBuilder
+from mashumaro.core.meta.helpers import iter_all_subclasses
 from mashumaro.dialect import Dialect
 from mashumaro.exceptions import UnresolvedTypeReferenceError
 
 __all__ = [
     "compile_mixin_packer",
     "compile_mixin_unpacker",
+    "iter_mixin_builder_params",
+    "warmup",
 ]
 
 
@@ -50,3 +64,131 @@ def compile_mixin_unpacker(
     except UnresolvedTypeReferenceError:
         if not config.allow_postponed_evaluation:
             raise
+
+
+def iter_mixin_builder_params(cls: Type) -> Iterator[Dict[str, Any]]:
+    for ancestor in cls.__mro__[-1:0:-1]:
+        builder_params_ = f"_{ancestor.__name__}__mashumaro_builder_params"
+        builder_params = getattr(ancestor, builder_params_, None)
+        if builder_params:
+            yield builder_params
+
+
+def _warmup_unpacker(
+    cls: Type,
+    dialects: Sequence[Type[Dialect]],
+    format_name: str = "dict",
+    dialect: Optional[Type[Dialect]] = None,
+    decoder: Any = None,
+) -> None:
+    method_name = CodeBuilder.get_unpack_method_name(
+        format_name=format_name, decoder=decoder
+    )
+    if method_name in cls.__dict__.get(LAZY_METHODS_ATTR, ()):
+        CodeBuilder(
+            cls,
+            first_method=method_name,
+            allow_postponed_evaluation=False,
+            format_name=format_name,
+            decoder=decoder,
+            default_dialect=dialect,
+        ).add_unpack_method()
+    builder = CodeBuilder(cls)
+    if not dialects or not builder.is_code_generation_option_enabled(
+        ADD_DIALECT_SUPPORT
+    ):
+        return
+    cache = cls.__dict__.get(f"__dialect_{format_name}_unpacker_cache__", {})
+    for dialect_ in dialects:
+        if dialect_ not in cache:
+            CodeBuilder(
+                cls,
+                dialect=dialect_,
+                first_method=method_name,
+                allow_postponed_evaluation=False,
+                format_name=format_name,
+                default_dialect=dialect,
+            ).add_unpack_method()
+
+
+def _warmup_packer(
+    cls: Type,
+    dialects: Sequence[Type[Dialect]],
+    format_name: str = "dict",
+    dialect: Optional[Type[Dialect]] = None,
+    encoder: Any = None,
+    encoder_kwargs: Optional[Dict[str, Dict[str, Tuple[str, Any]]]] = None,
+) -> None:
+    method_name = CodeBuilder.get_pack_method_name(
+        format_name=format_name, encoder=encoder
+    )
+    if method_name in cls.__dict__.get(LAZY_METHODS_ATTR, ()):
+        CodeBuilder(
+            cls,
+            first_method=method_name,
+            allow_postponed_evaluation=False,
+            format_name=format_name,
+            encoder=encoder,
+            encoder_kwargs=encoder_kwargs,
+            default_dialect=dialect,
+        ).add_pack_method()
+    builder = CodeBuilder(cls)
+    if not dialects or not builder.is_code_generation_option_enabled(
+        ADD_DIALECT_SUPPORT
+    ):
+        return
+    cache = cls.__dict__.get(f"__dialect_{format_name}_packer_cache__", {})
+    for dialect_ in dialects:
+        if dialect_ not in cache:
+            CodeBuilder(
+                cls,
+                dialect=dialect_,
+                first_method=method_name,
+                allow_postponed_evaluation=False,
+                format_name=format_name,
+                default_dialect=dialect,
+            ).add_pack_method()
+
+
+def warmup(
+    classes: Optional[Iterable[Type]] = None,
+    dialects: Sequence[Type[Dialect]] = (),
+    formats: Optional[Sequence[str]] = None,
+) -> None:
+    skip_unresolved = classes is None
+    if classes is None:
+        from mashumaro.mixins.dict import DataClassDictMixin
+
+        classes = iter_all_subclasses(DataClassDictMixin)
+    seen = set()
+    for cls in classes:
+        if cls in seen or not is_dataclass(cls):
+            continue
+        seen.add(cls)
+        try:
+            _warmup_class(cls, dialects, formats)
+        except UnresolvedTypeReferenceError:
+            # a class found by itself may refer to a type that isn't
+            # defined yet, it'll be compiled on the first use
+            if not skip_unresolved or not (
+                CodeBuilder(cls).get_config().allow_postponed_evaluation
+            ):
+                raise
+
+
+def _warmup_class(
+    cls: Type,
+    dialects: Sequence[Type[Dialect]],
+    formats: Optional[Sequence[str]],
+) -> None:
+    for builder_params in iter_mixin_builder_params(cls):
+        unpacker_params = builder_params["unpacker"]
+        if formats is None or (
+            unpacker_params.get("format_name", "dict") in formats
+        ):
+            _warmup_unpacker(cls, dialects, **unpacker_params)
+        packer_params = builder_params["packer"]
+        if formats is None or (
+            packer_params.get("format_name", "dict") in formats
+        ):
+            _warmup_packer(cls, dialects, **packer_params)
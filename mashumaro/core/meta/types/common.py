@@ -1,15 +1,16 @@
 import collections.abc
 import re
-import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field, replace
 from functools import cached_property
+from hashlib import sha256
 from types import new_class
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Hashable,
     List,
     Mapping,
     Optional,
@@ -32,6 +33,8 @@ from mashumaro.core.meta.helpers import (
     type_name,
 )
 from mashumaro.exceptions import UnserializableField
+from mashumaro.helper import pass_through
+from mashumaro.types import SerializationStrategy
 
 if TYPE_CHECKING:  # pragma: no cover
     from mashumaro.core.meta.code.builder import CodeBuilder
@@ -47,15 +50,13 @@ T = TypeVar("T")
 
 _PY_VALID_ID_RE = re.compile(r"\W|^(?=\d)")
 
+HELPERS_CACHE_ATTR = "__mashumaro_helpers__"
+RESERVED_NAMES_ATTR = "__mashumaro_reserved_names__"
+
 
 class AttrsHolder:
-    def __new__(
-        cls, name: Optional[str] = None, *args: Any, **kwargs: Any
-    ) -> Any:
+    def __new__(cls, name: str = "attrs", *args: Any, **kwargs: Any) -> Any:
         ah = new_class("AttrsHolder")
-        ah_id = id(ah)
-        if not name:
-            name = f"attrs_{ah_id}"
         ah.__name__ = ah.__qualname__ = name
         return ah
 
@@ -122,7 +123,15 @@ class ValueSpec:
             typ = self.origin_type
         attrs = self.attrs_registry.get(typ)
         if attrs is None:
-            attrs = AttrsHolder()
+            # the name is used in the generated code, so it's derived from
+            # the type instead of the number of holders created before
+            taken = {a.__name__ for a in self.attrs_registry.values()}
+            base_name = name = f"attrs_{clean_id(type_name(typ, short=True))}"
+            idx = 0
+            while name in taken:
+                idx += 1
+                name = f"{base_name}_{idx}"
+            attrs = AttrsHolder(name)
             self.attrs_registry[typ] = attrs
         return attrs
 
@@ -148,10 +157,63 @@ class ValueSpec:
 
     @cached_property
     def attrs_registry_name(self) -> str:
-        name = f"attrs_registry_{id(self.attrs_registry)}"
+        name = "attrs_registry"
         self.builder.ensure_object_imported(self.attrs_registry, name)
         return name
 
+    def get_unique_attr_name(self, prefix: str, suffix: str = "") -> str:
+        # a helper is set on the holder after the helpers it calls are
+        # generated, so the names are reserved right away
+        reserved = self.attrs.__dict__.get(RESERVED_NAMES_ATTR)
+        if reserved is None:
+            reserved = set()
+            setattr(self.attrs, RESERVED_NAMES_ATTR, reserved)
+        name = f"{prefix}__{self.builder.get_helper_name_digest()}"
+        unique_name = f"{name}{suffix}"
+        idx = 0
+        while unique_name in reserved or hasattr(self.attrs, unique_name):
+            idx += 1
+            unique_name = f"{name}_{idx}{suffix}"
+        reserved.add(unique_name)
+        return unique_name
+
+    def get_helper_cache_key(self, kind: str) -> Optional[Hashable]:
+        builder = self.builder
+        key = (
+            kind,
+            builder.cls,
+            builder.initial_type_args,
+            builder.format_name,
+            builder.dialect,
+            builder.default_dialect,
+            builder._get_field_class(self.field_ctx.name),
+            self.type,
+            self.annotated_type,
+            tuple(self.field_ctx.metadata.items()),
+            self.could_be_none,
+            tuple(self.no_copy_collections),
+            self.owner,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get_cached_helper(self, key: Optional[Hashable]) -> Optional[str]:
+        if key is None:
+            return None
+        return self.attrs.__dict__.get(HELPERS_CACHE_ATTR, {}).get(key)
+
+    def cache_helper(self, key: Optional[Hashable], method_name: str) -> None:
+        if key is None:
+            return
+        helpers = self.attrs.__dict__.get(HELPERS_CACHE_ATTR)
+        if helpers is None:
+            helpers = {}
+            setattr(self.attrs, HELPERS_CACHE_ATTR, helpers)
+        helpers[key] = method_name
+
 
 class AbstractMethodBuilder(ABC):
     @abstractmethod
@@ -168,7 +230,9 @@ class AbstractMethodBuilder(ABC):
             suffix = f"_{spec.field_ctx.name}"
         else:
             suffix = ""
-        return f"__{prefix}{spec.builder.cls.__name__}{suffix}__{random_hex()}"
+        return spec.get_unique_attr_name(
+            f"__{prefix}{spec.builder.cls.__name__}{suffix}"
+        )
 
     @abstractmethod
     def _add_definition(self, spec: ValueSpec, lines: CodeLines) -> str:
@@ -192,10 +256,7 @@ class AbstractMethodBuilder(ABC):
         )
 
     def _compile(self, spec: ValueSpec, lines: CodeLines) -> None:
-        if spec.builder.get_config().debug:
-            print(f"{type_name(spec.builder.cls)}:")
-            print(lines.as_text())
-        exec(lines.as_text(), spec.builder.globals, spec.builder.__dict__)
+        spec.builder.compile_helper(lines)
 
     @abstractmethod
     def _get_call_expr(self, spec: ValueSpec, method_name: str) -> str:
@@ -204,14 +265,21 @@ class AbstractMethodBuilder(ABC):
     def _before_build(self, spec: ValueSpec) -> None:
         pass
 
+    def _get_cache_key(self, spec: ValueSpec) -> Optional[Hashable]:
+        return None
+
     def build(self, spec: ValueSpec) -> str:
         self._before_build(spec)
-        lines = CodeLines()
-        method_name = self._add_definition(spec, lines)
-        with lines.indent():
-            self._add_body(spec, lines)
-        self._add_setattr(spec, method_name, lines)
-        self._compile(spec, lines)
+        cache_key = self._get_cache_key(spec)
+        method_name = spec.get_cached_helper(cache_key)
+        if method_name is None:
+            lines = CodeLines()
+            method_name = self._add_definition(spec, lines)
+            with lines.indent():
+                self._add_body(spec, lines)
+            self._add_setattr(spec, method_name, lines)
+            self._compile(spec, lines)
+            spec.cache_helper(cache_key, method_name)
         return self._get_call_expr(spec, method_name)
 
 
@@ -227,12 +295,7 @@ class Registry:
         return function
 
     def get(self, spec: ValueSpec) -> Expression:
-        if is_annotated(spec.type):
-            spec.annotated_type = spec.builder.get_real_type(
-                spec.field_ctx.name, spec.type
-            )
-            spec.type = get_type_origin(spec.type)
-        spec.type = spec.builder.get_real_type(spec.field_ctx.name, spec.type)
+        resolve_spec_type(spec)
         spec.builder.add_type_modules(spec.type)
         for packer in self._registry:
             expr = packer(spec)
@@ -243,6 +306,36 @@ class Registry:
         )
 
 
+def resolve_spec_type(spec: ValueSpec) -> None:
+    if is_annotated(spec.type):
+        spec.annotated_type = spec.builder.get_real_type(
+            spec.field_ctx.name, spec.type
+        )
+        spec.type = get_type_origin(spec.type)
+    spec.type = spec.builder.get_real_type(spec.field_ctx.name, spec.type)
+
+
+def has_overridden_method(spec: ValueSpec, method: str) -> bool:
+    # the same lookup as in get_overridden_(de)serialization_method
+    # without creating anything
+    if spec.field_ctx.metadata.get(method) is not None:
+        return True
+    checking_types = [spec.type, spec.origin_type]
+    if spec.annotated_type:
+        checking_types.insert(0, spec.annotated_type)
+    for typ in checking_types:
+        for strategy in spec.builder.iter_serialization_strategies(
+            spec.field_ctx.metadata, typ
+        ):
+            if strategy is pass_through or isinstance(
+                strategy, SerializationStrategy
+            ):
+                return True
+            elif isinstance(strategy, dict) and strategy.get(method):
+                return True
+    return False
+
+
 def ensure_generic_collection(spec: ValueSpec) -> bool:
     if not PEP_585_COMPATIBLE and not get_args(spec.type):
         proper_type = PROPER_COLLECTION_TYPES.get(spec.type)
@@ -299,8 +392,9 @@ def expr_or_maybe_none(spec: ValueSpec, new_expr: Expression) -> Expression:
         return new_expr
 
 
-def random_hex() -> str:
-    return str(uuid.uuid4().hex)
+def stable_hex(*parts: Any) -> str:
+    # sha256 is available on FIPS builds, where md5 is not allowed
+    return sha256("|".join(map(str, parts)).encode()).hexdigest()[:32]
 
 
 def clean_id(value: str) -> str:
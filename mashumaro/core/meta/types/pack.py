@@ -1,3 +1,5 @@
+import collections
+import collections.abc
 import datetime
 import enum
 import ipaddress
@@ -6,12 +8,13 @@ import typing
 import uuid
 from base64 import encodebytes
 from contextlib import suppress
-from dataclasses import is_dataclass
+from dataclasses import fields, is_dataclass
 from decimal import Decimal
 from fractions import Fraction
 from typing import (
     Any,
     Callable,
+    Dict,
     ForwardRef,
     List,
     Optional,
@@ -23,14 +26,18 @@ from typing import (
 import typing_extensions
 
 from mashumaro.core.const import PY_39_MIN, PY_311_MIN
+from mashumaro.core.helpers import copy_raw_value, datetime_to_timestamp_ms
 from mashumaro.core.meta.code.lines import CodeLines
 from mashumaro.core.meta.helpers import (
     get_args,
     get_class_that_defines_method,
     get_function_return_annotation,
     get_literal_values,
+    get_type_origin,
+    is_dataclass_dict_mixin,
     is_final,
     is_generic,
+    is_hashable,
     is_literal,
     is_named_tuple,
     is_new_type,
@@ -61,7 +68,7 @@ from mashumaro.core.meta.types.common import (
     ensure_generic_collection_subclass,
     ensure_generic_mapping,
     expr_or_maybe_none,
-    random_hex,
+    has_overridden_method,
 )
 from mashumaro.exceptions import (
     UnserializableDataError,
@@ -71,6 +78,7 @@ from mashumaro.exceptions import (
 from mashumaro.helper import pass_through
 from mashumaro.types import (
     GenericSerializableType,
+    Lazy,
     SerializableType,
     SerializationStrategy,
 )
@@ -105,7 +113,9 @@ def _pack_with_annotated_serialization_strategy(
         value_type,  # type: ignore
         resolve_type_params(strategy_type, get_args(spec.type))[strategy_type],
     )
-    overridden_fn = f"__{spec.field_ctx.name}_serialize_{random_hex()}"
+    overridden_fn = spec.get_unique_attr_name(
+        f"__{spec.field_ctx.name}_serialize"
+    )
     setattr(spec.attrs, overridden_fn, strategy.serialize)
     return PackerRegistry.get(
         spec.copy(
@@ -158,7 +168,9 @@ def pack_type_with_overridden_serialization(
     elif isinstance(serialization_method, ExpressionWrapper):
         return serialization_method.expression
     elif callable(serialization_method):
-        overridden_fn = f"__{spec.field_ctx.name}_serialize_{random_hex()}"
+        overridden_fn = spec.get_unique_attr_name(
+            f"__{spec.field_ctx.name}_serialize"
+        )
         setattr(spec.attrs, overridden_fn, staticmethod(serialization_method))
         return f"{spec.self_attrs_name}.{overridden_fn}({spec.expression})"
 
@@ -222,6 +234,30 @@ def pack_generic_serializable_type(spec: ValueSpec) -> Optional[Expression]:
             return f"{spec.expression}._serialize([{type_arg_names}])"
 
 
+@register
+def pack_lazy(spec: ValueSpec) -> Optional[Expression]:
+    if spec.origin_type is Lazy:
+        args = get_args(spec.type)
+        packer = PackerRegistry.get(
+            spec.copy(
+                type=args[0] if args else Any,
+                expression=f"{spec.expression}._value",
+            )
+        )
+        # the raw value of an untouched field is passed through, and it's
+        # copied as other collections are
+        raw = f"{spec.expression}._pending[0]"
+        copy_lists = list not in spec.no_copy_collections
+        copy_dicts = dict not in spec.no_copy_collections
+        if copy_lists or copy_dicts:
+            spec.builder.ensure_object_imported(copy_raw_value)
+            raw = f"copy_raw_value({raw}, {copy_lists}, {copy_dicts})"
+        return (
+            f"({raw} if {spec.expression}._pending is not None "
+            f"else {packer})"
+        )
+
+
 @register
 def pack_dataclass(spec: ValueSpec) -> Optional[Expression]:
     if is_dataclass(spec.origin_type):
@@ -230,6 +266,21 @@ def pack_dataclass(spec: ValueSpec) -> Optional[Expression]:
             type_args, spec.builder.format_name
         )
         method_loc = spec.origin_type if spec.builder.is_nailed else spec.attrs
+        native = False
+        if spec.builder.is_orjson_native_enabled():
+            builder = spec.builder.__class__(
+                spec.origin_type,
+                type_args,
+                dialect=spec.builder.dialect,
+                format_name=spec.builder.format_name,
+                default_dialect=spec.builder.default_dialect,
+                attrs=method_loc,
+                attrs_registry=(
+                    spec.attrs_registry if not spec.builder.is_nailed else None
+                ),
+            )
+            builder.reset()
+            native = builder.is_orjson_native()
         if get_class_that_defines_method(
             method_name, method_loc
         ) != method_loc and (
@@ -254,16 +305,23 @@ def pack_dataclass(spec: ValueSpec) -> Optional[Expression]:
             )
             builder.add_pack_method()
         flags = spec.builder.get_pack_method_flags(spec.type)
+        cls_alias = clean_id(type_name(spec.origin_type))
         if spec.builder.is_nailed:
-            return f"{spec.expression}.{method_name}({flags})"
+            packer = f"{spec.expression}.{method_name}({flags})"
         else:
-            cls_alias = clean_id(type_name(spec.origin_type))
             method_name_alias = f"{cls_alias}_{method_name}"
             spec.builder.ensure_object_imported(
                 getattr(spec.attrs, method_name), method_name_alias
             )
-            method_args = spec.expression
-            return f"{method_name_alias}({method_args})"
+            packer = f"{method_name_alias}({spec.expression})"
+        if native:
+            # instances of subclasses could have other fields
+            spec.builder.ensure_object_imported(spec.origin_type, cls_alias)
+            return (
+                f"{spec.expression} if {spec.expression}.__class__ "
+                f"is {cls_alias} else {packer}"
+            )
+        return packer
 
 
 @register
@@ -281,25 +339,88 @@ def pack_any(spec: ValueSpec) -> Optional[Expression]:
 def pack_union(
     spec: ValueSpec, args: Tuple[Type, ...], prefix: str = "union"
 ) -> Expression:
+    cache_key = spec.get_helper_cache_key(f"pack_{prefix}")
+    method_name = spec.get_cached_helper(cache_key)
+    if method_name is None:
+        method_name = _add_pack_union_method(spec, args, prefix)
+        spec.cache_helper(cache_key, method_name)
+    method_args = ", ".join(
+        filter(
+            None,
+            (
+                spec.expression,
+                f"'{spec.field_ctx.name}'",
+                spec.builder.get_pack_method_flags(),
+            ),
+        )
+    )
+    if spec.builder.is_nailed:
+        return f"{spec.self_attrs_name}.{method_name}({method_args})"
+    else:
+        spec.builder.ensure_object_imported(
+            getattr(spec.attrs, method_name), method_name
+        )
+        return f"{method_name}({method_args})"
+
+
+def _add_pack_union_method(
+    spec: ValueSpec, args: Tuple[Type, ...], prefix: str
+) -> str:
     lines = CodeLines()
-    method_name = (
-        f"__pack_{prefix}_{spec.builder.cls.__name__}_{spec.field_ctx.name}__"
-        f"{random_hex()}"
+    method_name = spec.get_unique_attr_name(
+        f"__pack_{prefix}_{spec.builder.cls.__name__}_{spec.field_ctx.name}"
+    )
+    method_args = (
+        "self, value, field_name"
+        if spec.builder.is_nailed
+        else "value, field_name"
     )
-    method_args = "self, value" if spec.builder.is_nailed else "value"
     default_kwargs = spec.builder.get_pack_method_default_flag_values()
     if default_kwargs:
         lines.append(f"def {method_name}({method_args}, {default_kwargs}):")
     else:
         lines.append(f"def {method_name}({method_args}):")
+    packers = []
+    checkers = []
+    for type_arg in args:
+        # the arm spec is resolved by the registry
+        arm_spec = spec.copy(type=type_arg, expression="value")
+        packer = PackerRegistry.get(arm_spec)
+        if packer == "value" and spec.builder.is_orjson_native_enabled():
+            packer = _get_orjson_native_union_arm_packer(arm_spec)
+        packers.append(packer)
+        checkers.append(_get_union_arm_checker(arm_spec, packer))
+    # dispatch on the exact type of the value, skipping the arms
+    # that would certainly fail on it
+    known_types = list(UNION_DISPATCH_TYPES)
+    for type_arg in args:
+        origin = get_type_origin(type_arg)
+        if isinstance(origin, type) and origin not in known_types:
+            known_types.append(origin)
+    branches: Dict[Tuple[int, ...], List[Type]] = {}
+    for value_type in known_types:
+        candidates = _get_union_candidates(checkers, value_type)
+        branches.setdefault(candidates, []).append(value_type)
+    all_arms = tuple(range(len(args)))
+    branches.setdefault(all_arms, [])
     with lines.indent():
-        for packer in (
-            PackerRegistry.get(spec.copy(type=type_arg, expression="value"))
-            for type_arg in args
-        ):
-            with lines.indent("try:"):
-                lines.append(f"return {packer}")
-            lines.append("except Exception: pass")
+        if len(branches) > 1:
+            branches[all_arms] = branches.pop(all_arms)  # the last one
+            table = UnionDispatchTable(checkers, list(branches))
+            for idx, value_types in enumerate(branches.values()):
+                table.update(dict.fromkeys(value_types, idx))
+            table_name = f"{method_name}_dispatch"
+            spec.builder.ensure_object_imported(table, table_name)
+            lines.append(f"branch = {table_name}[type(value)]")
+            for idx, candidates in enumerate(branches):
+                if candidates == all_arms:
+                    expr = "else:"
+                else:
+                    expr = f"{'elif' if idx else 'if'} branch == {idx}:"
+                with lines.indent(expr):
+                    _add_union_arms([packers[i] for i in candidates], lines)
+        else:
+            _add_union_arms(packers, lines)
         field_type = spec.builder.get_type_name_identifier(
             typ=spec.type,
             resolved_type_params=spec.builder.get_field_resolved_type_params(
@@ -309,37 +430,238 @@ def pack_union(
         if spec.builder.is_nailed:
             lines.append(
                 "raise InvalidFieldValue("
-                f"'{spec.field_ctx.name}',{field_type},value,type(self))"
+                f"field_name,{field_type},value,type(self))"
             )
         else:
             lines.append("raise ValueError(value)")
     lines.append(
         f"setattr({spec.cls_attrs_name}, '{method_name}', {method_name})"
     )
-    if spec.builder.get_config().debug:
-        print(f"{type_name(spec.builder.cls)}:")
-        print(lines.as_text())
-    exec(lines.as_text(), spec.builder.globals, spec.builder.__dict__)
-    method_args = ", ".join(
-        filter(None, (spec.expression, spec.builder.get_pack_method_flags()))
+    spec.builder.compile_helper(lines)
+    return method_name
+
+
+def _get_orjson_native_union_arm_packer(arm_spec: ValueSpec) -> Expression:
+    # a value left to orjson would be accepted by the arm as it is, so the
+    # following arms would never be tried
+    if has_overridden_method(arm_spec, "serialize"):
+        return "value"
+    origin_type = arm_spec.origin_type
+    if origin_type in (int, float):
+        return f"{type_name(origin_type)}(value)"
+    elif isinstance(origin_type, type) and issubclass(origin_type, enum.Enum):
+        return "value.value"
+    return "value"
+
+
+def _add_union_arms(packers: List[str], lines: CodeLines) -> None:
+    for packer in packers:
+        if packer == "value":
+            # the following arms are unreachable
+            lines.append("return value")
+            return
+        with lines.indent("try:"):
+            lines.append(f"return {packer}")
+        lines.append("except Exception: pass")
+    if not packers:
+        lines.append("pass")
+
+
+UNION_DISPATCH_TYPES = (
+    NoneType,
+    bool,
+    int,
+    float,
+    str,
+    bytes,
+    list,
+    tuple,
+    set,
+    frozenset,
+    dict,
+)
+UNION_DISPATCH_CACHE_SIZE = 256
+
+TypeChecker = Callable[[Type], bool]
+
+_NUMBER_LIKE_TYPES = (str, bytes, bytearray, memoryview)
+_SEQUENCE_ORIGINS = (
+    list,
+    set,
+    frozenset,
+    collections.deque,
+    collections.abc.Sequence,
+    collections.abc.MutableSequence,
+    collections.abc.Set,
+    collections.abc.MutableSet,
+)
+_MAPPING_ORIGINS = (
+    dict,
+    collections.OrderedDict,
+    collections.Counter,
+    collections.abc.Mapping,
+    collections.abc.MutableMapping,
+)
+_DATE_ORIGINS = (datetime.datetime, datetime.date, datetime.time)
+
+
+def _has_attribute(typ: Type, name: str) -> bool:
+    # instances of types with __dict__ could get any attribute in __init__
+    return (
+        hasattr(typ, name)
+        or hasattr(typ, "__getattr__")
+        or getattr(typ, "__dictoffset__", 0) != 0
     )
-    if spec.builder.is_nailed:
-        return f"{spec.self_attrs_name}.{method_name}({method_args})"
-    else:
-        spec.builder.ensure_object_imported(
-            getattr(spec.attrs, method_name), method_name
+
+
+def _is_iterable(typ: Type) -> bool:
+    return hasattr(typ, "__iter__") or hasattr(typ, "__getitem__")
+
+
+def _is_variadic_tuple(typ: Type) -> bool:
+    args = get_args(typ)
+    if not args:
+        return typ in (Tuple, tuple)
+    return len(args) == 2 and args[1] is Ellipsis
+
+
+def _get_union_arm_checker(
+    arm_spec: ValueSpec, packer: Expression
+) -> Optional[TypeChecker]:
+    # Returns a function that tells if the packer of the union arm could
+    # succeed for a value of the given type, judging by the arm type.
+    # None means that any value could be accepted, which is what we assume
+    # for anything not recognized here.
+    if packer == "value":
+        return None
+    if has_overridden_method(arm_spec, "serialize"):
+        return None
+    origin_type = arm_spec.origin_type
+    if origin_type is int:
+        return lambda t: issubclass(t, _NUMBER_LIKE_TYPES) or any(
+            hasattr(t, m) for m in ("__int__", "__index__", "__trunc__")
         )
-        return f"{method_name}({method_args})"
+    elif origin_type is float:
+        return lambda t: issubclass(t, _NUMBER_LIKE_TYPES) or any(
+            hasattr(t, m) for m in ("__float__", "__index__")
+        )
+    elif origin_type in _DATE_ORIGINS:
+        return lambda t: _has_attribute(t, "isoformat")
+    elif origin_type is datetime.timedelta:
+        return lambda t: _has_attribute(t, "total_seconds")
+    elif origin_type in _SEQUENCE_ORIGINS or (
+        origin_type is tuple and _is_variadic_tuple(arm_spec.type)
+    ):
+        # collections of values packed as they are could be copied
+        return lambda t: _is_iterable(t) or _has_attribute(t, "copy")
+    elif origin_type in _MAPPING_ORIGINS:
+        return lambda t: _has_attribute(t, "items") or _has_attribute(
+            t, "copy"
+        )
+    elif isinstance(origin_type, type) and issubclass(origin_type, enum.Enum):
+        return lambda t: _has_attribute(t, "value")
+    elif (
+        is_dataclass(origin_type)
+        and isinstance(origin_type, type)
+        and not issubclass(
+            origin_type, (SerializableType, GenericSerializableType)
+        )
+    ):
+        if arm_spec.builder.is_nailed:
+            # the method of the value itself is called
+            method_name = arm_spec.builder.get_pack_method_name(
+                get_args(arm_spec.type), arm_spec.builder.format_name
+            )
+            return lambda t: _has_attribute(t, method_name)
+        hook_owner = get_class_that_defines_method(
+            "__pre_serialize__", origin_type
+        )
+        if hook_owner is not None and not is_dataclass_dict_mixin(hook_owner):
+            # the hook could return an object of another type
+            return None
+        names = [f.name for f in fields(origin_type)]
+        return lambda t: issubclass(t, origin_type) or all(
+            _has_attribute(t, name) for name in names
+        )
+    return None
+
+
+def _get_union_candidates(
+    checkers: List[Optional[TypeChecker]], value_type: Type
+) -> Tuple[int, ...]:
+    candidates = []
+    for idx, checker in enumerate(checkers):
+        try:
+            if checker is None or checker(value_type):
+                candidates.append(idx)
+        except Exception:
+            candidates.append(idx)
+    return tuple(candidates)
+
+
+class UnionDispatchTable(Dict[Type, int]):
+    """
+    Maps the exact type of a value to the number of the branch
+    in the generated union packer that has all the arms that could
+    serialize this value. The table is filled in on the first lookup
+    of every new type, such as a subclass of one of the union arms.
+    """
+
+    def __init__(
+        self,
+        checkers: List[Optional[TypeChecker]],
+        branches: List[Tuple[int, ...]],
+    ):
+        super().__init__()
+        self.checkers = checkers
+        self.branches = branches
+
+    def __missing__(self, value_type: Type) -> int:
+        candidates = set(_get_union_candidates(self.checkers, value_type))
+        # the last branch has all the arms, so there is always a match
+        branch = min(
+            (
+                idx
+                for idx, arms in enumerate(self.branches)
+                if candidates.issubset(arms)
+            ),
+            key=lambda idx: len(self.branches[idx]),
+        )
+        if len(self) < UNION_DISPATCH_CACHE_SIZE:
+            self[value_type] = branch
+        return branch
 
 
 def pack_literal(spec: ValueSpec) -> Expression:
     spec.builder.add_type_modules(spec.type)
+    cache_key = spec.get_helper_cache_key("pack_literal")
+    method_name = spec.get_cached_helper(cache_key)
+    if method_name is None:
+        method_name = _add_pack_literal_method(spec)
+        spec.cache_helper(cache_key, method_name)
+    method_args = ", ".join(
+        filter(
+            None,
+            (
+                spec.expression,
+                f"'{spec.field_ctx.name}'",
+                spec.builder.get_pack_method_flags(),
+            ),
+        )
+    )
+    return f"{spec.self_attrs_name}.{method_name}({method_args})"
+
+
+def _add_pack_literal_method(spec: ValueSpec) -> str:
     lines = CodeLines()
-    method_name = (
-        f"__pack_literal_{spec.builder.cls.__name__}_{spec.field_ctx.name}__"
-        f"{random_hex()}"
+    method_name = spec.get_unique_attr_name(
+        f"__pack_literal_{spec.builder.cls.__name__}_{spec.field_ctx.name}"
+    )
+    method_args = (
+        "self, value, field_name"
+        if spec.builder.is_nailed
+        else "value, field_name"
     )
-    method_args = "self, value" if spec.builder.is_nailed else "value"
     default_kwargs = spec.builder.get_pack_method_default_flag_values()
     if default_kwargs:
         lines.append(f"def {method_name}({method_args}, {default_kwargs}):")
@@ -348,34 +670,49 @@ def pack_literal(spec: ValueSpec) -> Expression:
     resolved_type_params = spec.builder.get_field_resolved_type_params(
         spec.field_ctx.name
     )
+    literal_values = [
+        v
+        for v in get_literal_values(spec.type)
+        if isinstance(
+            v, (enum.Enum, int, str, bytes, bool, NoneType)  # type: ignore
+        )
+    ]
     with lines.indent():
-        for literal_value in get_literal_values(spec.type):
-            value_type = type(literal_value)
-            packer = PackerRegistry.get(
-                spec.copy(type=value_type, expression="value")
-            )
-            if isinstance(literal_value, enum.Enum):
-                enum_type_name = spec.builder.get_type_name_identifier(
-                    typ=value_type,
-                    resolved_type_params=resolved_type_params,
+        if all(map(is_hashable, literal_values)):
+            # look up the packer of the first matching value in Literal
+            packers: List[Expression] = []
+            packer_indexes: Dict[Any, int] = {}
+            for literal_value in literal_values:
+                packer = PackerRegistry.get(
+                    spec.copy(type=type(literal_value), expression="value")
                 )
-                with lines.indent(
-                    f"if value == {enum_type_name}.{literal_value.name}:"
-                ):
-                    lines.append(f"return {packer}")
-            elif isinstance(
-                literal_value,
-                (int, str, bytes, bool, NoneType),  # type: ignore
-            ):
-                with lines.indent(f"if value == {literal_value!r}:"):
-                    lines.append(f"return {packer}")
+                if packer not in packers:
+                    packers.append(packer)
+                packer_indexes.setdefault(literal_value, packers.index(packer))
+            values_name = f"{method_name}_values"
+            spec.builder.ensure_object_imported(packer_indexes, values_name)
+            with lines.indent("try:"):
+                lines.append(f"packer_idx = {values_name}[value]")
+            lines.append("except KeyError: pass")
+            with lines.indent("except TypeError:"):
+                # unhashable values can still be equal to literal values
+                _add_pack_literal_comparisons(spec, literal_values, lines)
+            with lines.indent("else:"):
+                for idx, packer in enumerate(packers):
+                    if idx == len(packers) - 1:
+                        lines.append(f"return {packer}")
+                    else:
+                        with lines.indent(f"if packer_idx == {idx}:"):
+                            lines.append(f"return {packer}")
+        else:
+            _add_pack_literal_comparisons(spec, literal_values, lines)
         field_type = spec.builder.get_type_name_identifier(
             typ=spec.type,
             resolved_type_params=resolved_type_params,
         )
         if spec.builder.is_nailed:
             lines.append(
-                f"raise InvalidFieldValue('{spec.field_ctx.name}',"
+                f"raise InvalidFieldValue(field_name,"
                 f"{field_type},value,type(self))"
             )
         else:
@@ -383,14 +720,33 @@ def pack_literal(spec: ValueSpec) -> Expression:
     lines.append(
         f"setattr({spec.cls_attrs_name}, '{method_name}', {method_name})"
     )
-    if spec.builder.get_config().debug:
-        print(f"{type_name(spec.builder.cls)}:")
-        print(lines.as_text())
-    exec(lines.as_text(), spec.builder.globals, spec.builder.__dict__)
-    method_args = ", ".join(
-        filter(None, (spec.expression, spec.builder.get_pack_method_flags()))
+    spec.builder.compile_helper(lines)
+    return method_name
+
+
+def _add_pack_literal_comparisons(
+    spec: ValueSpec, literal_values: List[Any], lines: CodeLines
+) -> None:
+    resolved_type_params = spec.builder.get_field_resolved_type_params(
+        spec.field_ctx.name
     )
-    return f"{spec.self_attrs_name}.{method_name}({method_args})"
+    for literal_value in literal_values:
+        value_type = type(literal_value)
+        packer = PackerRegistry.get(
+            spec.copy(type=value_type, expression="value")
+        )
+        if isinstance(literal_value, enum.Enum):
+            enum_type_name = spec.builder.get_type_name_identifier(
+                typ=value_type,
+                resolved_type_params=resolved_type_params,
+            )
+            with lines.indent(
+                f"if value == {enum_type_name}.{literal_value.name}:"
+            ):
+                lines.append(f"return {packer}")
+        else:
+            with lines.indent(f"if value == {literal_value!r}:"):
+                lines.append(f"return {packer}")
 
 
 @register
@@ -486,6 +842,8 @@ def pack_special_typing_primitive(spec: ValueSpec) -> Optional[Expression]:
 @register
 def pack_number(spec: ValueSpec) -> Optional[Expression]:
     if spec.origin_type in (int, float):
+        if spec.builder.is_orjson_native_enabled():
+            return spec.expression
         return f"{type_name(spec.origin_type)}({spec.expression})"
 
 
@@ -498,6 +856,22 @@ def pack_bool_and_none(spec: ValueSpec) -> Optional[Expression]:
 @register
 def pack_date_objects(spec: ValueSpec) -> Optional[Expression]:
     if spec.origin_type in (datetime.datetime, datetime.date, datetime.time):
+        serialize_option = get_overridden_serialization_method(spec)
+        if serialize_option in ("timestamp", "timestamp_ms"):
+            if spec.origin_type is not datetime.datetime:
+                raise UnsupportedSerializationEngine(
+                    field_name=spec.field_ctx.name,
+                    field_type=spec.type,
+                    holder_class=spec.builder.cls,
+                    engine=serialize_option,
+                )
+            if serialize_option == "timestamp":
+                return f"{spec.expression}.timestamp()"
+            method = "__datetime_to_timestamp_ms"
+            spec.builder.ensure_object_imported(
+                datetime_to_timestamp_ms, method
+            )
+            return f"{method}({spec.expression})"
         return f"{spec.expression}.isoformat()"
 
 
@@ -658,9 +1032,9 @@ def pack_typed_dict(spec: ValueSpec) -> Expression:
     required_keys = getattr(spec.type, "__required_keys__", all_keys)
     optional_keys = getattr(spec.type, "__optional_keys__", [])
     lines = CodeLines()
-    method_name = (
+    method_name = spec.get_unique_attr_name(
         f"__pack_typed_dict_{spec.builder.cls.__name__}_"
-        f"{spec.field_ctx.name}__{random_hex()}"
+        f"{spec.field_ctx.name}"
     )
     method_args = "self, value" if spec.builder.is_nailed else "value"
     default_kwargs = spec.builder.get_pack_method_default_flag_values()
@@ -696,10 +1070,7 @@ def pack_typed_dict(spec: ValueSpec) -> Expression:
     lines.append(
         f"setattr({spec.cls_attrs_name}, '{method_name}', {method_name})"
     )
-    if spec.builder.get_config().debug:
-        print(f"{type_name(spec.builder.cls)}:")
-        print(lines.as_text())
-    exec(lines.as_text(), spec.builder.globals, spec.builder.__dict__)
+    spec.builder.compile_helper(lines)
     method_args = ", ".join(
         filter(None, (spec.expression, spec.builder.get_pack_method_flags()))
     )
@@ -802,4 +1173,6 @@ def pack_pathlike(spec: ValueSpec) -> Optional[Expression]:
 @register
 def pack_enum(spec: ValueSpec) -> Optional[Expression]:
     if issubclass(spec.origin_type, enum.Enum):
+        if spec.builder.is_orjson_native_enabled():
+            return spec.expression
         return f"{spec.expression}.value"
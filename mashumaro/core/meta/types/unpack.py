@@ -11,16 +11,21 @@ import uuid
 from abc import ABC
 from base64 import decodebytes
 from contextlib import suppress
-from dataclasses import is_dataclass
+from dataclasses import MISSING, fields, is_dataclass
 from decimal import Decimal
 from fractions import Fraction
 from typing import (
     Any,
     Callable,
+    Dict,
     ForwardRef,
+    FrozenSet,
+    Hashable,
     Iterable,
     List,
     Optional,
+    Sequence,
+    Set,
     Tuple,
     Type,
     Union,
@@ -28,16 +33,21 @@ from typing import (
 
 import typing_extensions
 
+from mashumaro.config import ADD_DIALECT_SUPPORT
 from mashumaro.core.const import PY_39_MIN, PY_311_MIN
-from mashumaro.core.helpers import parse_timezone
+from mashumaro.core.helpers import parse_timezone, timestamp_ms_to_datetime
 from mashumaro.core.meta.code.lines import CodeLines
 from mashumaro.core.meta.helpers import (
     get_args,
     get_class_that_defines_method,
     get_function_arg_annotation,
     get_literal_values,
+    get_subclasses_generation,
+    is_dataclass_dict_mixin,
+    is_dataclass_dict_mixin_subclass,
     is_final,
     is_generic,
+    is_hashable,
     is_literal,
     is_named_tuple,
     is_new_type,
@@ -71,7 +81,8 @@ from mashumaro.core.meta.types.common import (
     ensure_generic_collection_subclass,
     ensure_generic_mapping,
     expr_or_maybe_none,
-    random_hex,
+    has_overridden_method,
+    stable_hex,
 )
 from mashumaro.exceptions import (
     ThirdPartyModuleNotFoundError,
@@ -83,6 +94,7 @@ from mashumaro.helper import pass_through
 from mashumaro.types import (
     Discriminator,
     GenericSerializableType,
+    Lazy,
     SerializableType,
     SerializationStrategy,
 )
@@ -116,9 +128,8 @@ class AbstractUnpackerBuilder(AbstractMethodBuilder, ABC):
             suffix = f"_{spec.field_ctx.name}"
         else:
             suffix = ""
-        return (
+        return spec.get_unique_attr_name(
             f"__unpack_{prefix}{spec.builder.cls.__name__}{suffix}"
-            f"__{random_hex()}"
         )
 
     def _add_definition(self, spec: ValueSpec, lines: CodeLines) -> str:
@@ -158,6 +169,10 @@ class AbstractUnpackerBuilder(AbstractMethodBuilder, ABC):
         return f"{spec.cls_attrs_name}.{method_name}({method_args})"
 
 
+# values of the tag fields and the required keys of a dataclass variant
+VariantKeys = Tuple[Dict[str, FrozenSet[Hashable]], Tuple[str, ...]]
+
+
 class UnionUnpackerBuilder(AbstractUnpackerBuilder):
     def __init__(self, args: Tuple[Type, ...]):
         self.union_args = args
@@ -165,14 +180,63 @@ class UnionUnpackerBuilder(AbstractUnpackerBuilder):
     def get_method_prefix(self) -> str:
         return "union"
 
+    def _get_cache_key(self, spec: ValueSpec) -> Optional[Hashable]:
+        return spec.get_helper_cache_key(f"unpack_{self.get_method_prefix()}")
+
+    def _get_extra_method_args(self) -> List[str]:
+        return ["field_name"]
+
     def _add_body(self, spec: ValueSpec, lines: CodeLines) -> None:
-        for unpacker in (
-            UnpackerRegistry.get(spec.copy(type=type_arg, expression="value"))
-            for type_arg in self.union_args
-        ):
-            with lines.indent("try:"):
-                lines.append(f"return {unpacker}")
-            lines.append("except Exception: pass")
+        unpackers = []
+        rejected_types = []
+        variants = []
+        for type_arg in self.union_args:
+            # the arm spec is resolved by the registry
+            arm_spec = spec.copy(type=type_arg, expression="value")
+            unpackers.append(UnpackerRegistry.get(arm_spec))
+            rejected_types.append(_get_rejected_value_types(arm_spec))
+            variants.append(_get_variant_keys(spec, arm_spec))
+        all_arms = tuple(range(len(unpackers)))
+        # dispatch on the exact type of the value, skipping the arms
+        # that would certainly fail on it, and on the keys of a dict
+        # if there are dataclasses in the union
+        branches: Dict[Tuple[Tuple[int, ...], bool], List[Type]] = {}
+        for value_type in UNION_DISPATCH_TYPES:
+            candidates = tuple(
+                idx
+                for idx in all_arms
+                if value_type not in rejected_types[idx]
+            )
+            is_dict = value_type is dict and any(
+                variants[idx] is not None for idx in candidates
+            )
+            if len(candidates) < len(all_arms) or is_dict:
+                branches.setdefault((candidates, is_dict), []).append(
+                    value_type
+                )
+        if branches:
+            lines.append("value_type = type(value)")
+            for idx, ((candidates, is_dict), value_types) in enumerate(
+                branches.items()
+            ):
+                condition = " or ".join(
+                    f"value_type is {t.__name__}" for t in value_types
+                )
+                with lines.indent(f"{'elif' if idx else 'if'} {condition}:"):
+                    if is_dict:
+                        self._add_dict_unpackers(
+                            spec,
+                            [(unpackers[i], variants[i]) for i in candidates],
+                            lines,
+                        )
+                    else:
+                        self._add_unpackers(
+                            [unpackers[i] for i in candidates], lines
+                        )
+            with lines.indent("else:"):
+                self._add_unpackers(unpackers, lines)
+        else:
+            self._add_unpackers(unpackers, lines)
         field_type = spec.builder.get_type_name_identifier(
             typ=spec.type,
             resolved_type_params=spec.builder.get_field_resolved_type_params(
@@ -181,12 +245,256 @@ class UnionUnpackerBuilder(AbstractUnpackerBuilder):
         )
         if spec.builder.is_nailed:
             lines.append(
-                "raise InvalidFieldValue("
-                f"'{spec.field_ctx.name}',{field_type},value,cls)"
+                f"raise InvalidFieldValue(field_name,{field_type},value,cls)"
             )
         else:
             lines.append("raise ValueError(value)")
 
+    @staticmethod
+    def _add_unpackers(unpackers: Sequence[str], lines: CodeLines) -> None:
+        for unpacker in unpackers:
+            if unpacker == "value":
+                # the following arms are unreachable
+                lines.append("return value")
+                return
+            with lines.indent("try:"):
+                lines.append(f"return {unpacker}")
+            lines.append("except Exception: pass")
+        if not unpackers:
+            lines.append("pass")
+
+    def _add_dict_unpackers(
+        self,
+        spec: ValueSpec,
+        arms: Sequence[Tuple[str, Optional[VariantKeys]]],
+        lines: CodeLines,
+    ) -> None:
+        # the leading dataclass variants could be told apart by a tag field
+        tagged_arms: List[Tuple[str, VariantKeys]] = []
+        for unpacker, variant in arms:
+            if variant is None:
+                break
+            tagged_arms.append((unpacker, variant))
+        tag_field = _get_tag_field([variant for _, variant in tagged_arms])
+        if tag_field is not None:
+            # only one of them could succeed, so we try it first
+            tags = {}
+            for idx, (_, variant) in enumerate(tagged_arms):
+                tags.update(dict.fromkeys(variant[0][tag_field], idx))
+            tags_attr = spec.get_unique_attr_name(
+                f"__mashumaro_{spec.field_ctx.name}_tags", "__"
+            )
+            setattr(spec.attrs, tags_attr, tags)
+            with lines.indent("try:"):
+                lines.append(
+                    f"variant = {spec.cls_attrs_name}.{tags_attr}"
+                    f".get(value.get('{tag_field}'))"
+                )
+            with lines.indent("except TypeError:"):
+                lines.append("variant = None")
+            for idx, (unpacker, _) in enumerate(tagged_arms):
+                with lines.indent(
+                    f"{'elif' if idx else 'if'} variant == {idx}:"
+                ):
+                    with lines.indent("try:"):
+                        lines.append(f"return {unpacker}")
+                    lines.append("except Exception: pass")
+        for unpacker, variant in arms:
+            if unpacker == "value":
+                lines.append("return value")
+                return
+            if variant is not None and variant[1]:
+                condition = " and ".join(f"'{k}' in value" for k in variant[1])
+                with lines.indent(f"if {condition}:"):
+                    with lines.indent("try:"):
+                        lines.append(f"return {unpacker}")
+                    lines.append("except Exception: pass")
+            else:
+                with lines.indent("try:"):
+                    lines.append(f"return {unpacker}")
+                lines.append("except Exception: pass")
+        if not arms:
+            lines.append("pass")
+
+    def _get_call_expr(self, spec: ValueSpec, method_name: str) -> str:
+        method_args = ", ".join(
+            filter(
+                None,
+                (
+                    spec.expression,
+                    f"'{spec.field_ctx.name}'",
+                    spec.builder.get_unpack_method_flags(),
+                ),
+            )
+        )
+        return f"{spec.cls_attrs_name}.{method_name}({method_args})"
+
+
+UNION_DISPATCH_TYPES = (NoneType, bool, int, float, str, list, dict)
+
+_NOT_NUMBER: FrozenSet[Type] = frozenset((NoneType, list, dict))
+_NOT_ITERABLE: FrozenSet[Type] = frozenset((NoneType, bool, int, float))
+_NOT_STR: FrozenSet[Type] = frozenset((NoneType, bool, int, float, list, dict))
+_NOT_DICT: FrozenSet[Type] = frozenset((NoneType, bool, int, float, str, list))
+
+_ITERABLE_ORIGINS: FrozenSet[Type] = frozenset(
+    (
+        list,
+        set,
+        frozenset,
+        collections.abc.Sequence,
+        collections.abc.MutableSequence,
+        collections.abc.Set,
+        collections.abc.MutableSet,
+    )
+)
+_MAPPING_ORIGINS: FrozenSet[Type] = frozenset(
+    (dict, collections.abc.Mapping, collections.abc.MutableMapping)
+)
+_DATE_ORIGINS: FrozenSet[Type] = frozenset(
+    (datetime.datetime, datetime.date, datetime.time)
+)
+
+
+def _has_default_unpacker(spec: ValueSpec) -> bool:
+    return not has_overridden_method(spec, "deserialize") and not any(
+        isinstance(a, Discriminator) for a in spec.annotations
+    )
+
+
+def _is_variadic_tuple(typ: Type) -> bool:
+    args = get_args(typ)
+    if not args:
+        return typ in (Tuple, tuple)
+    return len(args) == 2 and args[1] is Ellipsis
+
+
+def _get_rejected_value_types(arm_spec: ValueSpec) -> FrozenSet[Type]:
+    # Returns the value types on which the unpacker of the union arm is
+    # guaranteed to raise an exception. Anything not recognized here is
+    # treated as an arm that can accept any value.
+    if not _has_default_unpacker(arm_spec):
+        return frozenset()
+    origin_type = arm_spec.origin_type
+    if origin_type in (int, float):
+        return _NOT_NUMBER
+    elif origin_type in _DATE_ORIGINS:
+        return _NOT_STR
+    elif origin_type in _ITERABLE_ORIGINS or (
+        origin_type is tuple and _is_variadic_tuple(arm_spec.type)
+    ):
+        return _NOT_ITERABLE
+    elif origin_type in _MAPPING_ORIGINS:
+        return _NOT_DICT
+    elif _is_strict_from_dict(origin_type):
+        return _NOT_DICT
+    return frozenset()
+
+
+def _is_strict_from_dict(typ: Type) -> bool:
+    # from_dict calls d.get for each init field unless the data is changed
+    # by a hook or the class is a discriminated union base
+    if not is_dataclass(typ) or not any(f.init for f in fields(typ)):
+        return False
+    elif issubclass(typ, (SerializableType, GenericSerializableType)):
+        return False
+    hook_owner = get_class_that_defines_method("__pre_deserialize__", typ)
+    if hook_owner is not None and not is_dataclass_dict_mixin(hook_owner):
+        return False
+    config = typ.__dict__.get("Config")
+    return getattr(config, "discriminator", None) is None
+
+
+def _get_variant_keys(
+    spec: ValueSpec, arm_spec: ValueSpec
+) -> Optional[VariantKeys]:
+    # Returns the keys without which the generated unpacker for a dataclass
+    # is guaranteed to fail, as well as the only values of the keys that
+    # are accepted by Literal or single-member Enum fields
+    typ = arm_spec.origin_type
+    if not _has_default_unpacker(arm_spec) or not _is_strict_from_dict(typ):
+        return None
+    try:
+        field_types = typing_extensions.get_type_hints(typ)
+    except Exception:
+        return None
+    config = getattr(typ, "Config", None)
+    aliases = getattr(config, "aliases", None) or {}
+    tags = {}
+    required_keys = []
+    for f in fields(typ):
+        if not f.init or "alias" in f.metadata or f.name in aliases:
+            continue
+        if f.default is MISSING and f.default_factory is MISSING:
+            required_keys.append(f.name)
+        if (
+            "deserialize" in f.metadata
+            or "serialization_strategy" in f.metadata
+        ):
+            continue
+        values = _get_tag_values(spec, typ, field_types.get(f.name), config)
+        if values:
+            tags[f.name] = values
+    return tags, tuple(required_keys)
+
+
+def _get_tag_values(
+    spec: ValueSpec, owner: Type, typ: Any, config: Any
+) -> FrozenSet[Hashable]:
+    if is_literal(typ):
+        values = []
+        for value in get_literal_values(typ):
+            if isinstance(value, enum.Enum):
+                value = value.value
+            if type(value) not in (str, int):
+                return frozenset()
+            values.append(value)
+        return frozenset(values)
+    elif (
+        isinstance(typ, type)
+        and issubclass(typ, enum.Enum)
+        and not issubclass(typ, (SerializableType, GenericSerializableType))
+        and typ._missing_.__func__ is enum.Enum._missing_.__func__  # type: ignore
+    ):
+        # a dialect passed at runtime could change the enum values
+        if spec.builder.is_code_generation_option_enabled(
+            ADD_DIALECT_SUPPORT, owner
+        ) and spec.builder.is_code_generation_option_enabled(
+            ADD_DIALECT_SUPPORT
+        ):
+            return frozenset()
+        strategies = [getattr(config, "serialization_strategy", {})]
+        for dialect in (
+            getattr(config, "dialect", None),
+            spec.builder.dialect,
+            spec.builder.default_dialect,
+        ):
+            strategies.append(getattr(dialect, "serialization_strategy", {}))
+        if any(typ in strategy for strategy in strategies):
+            return frozenset()
+        member_values = frozenset(member.value for member in typ)
+        if len(member_values) == 1 and all(
+            type(v) in (str, int) for v in member_values
+        ):
+            return member_values
+    return frozenset()
+
+
+def _get_tag_field(variants: Sequence[VariantKeys]) -> Optional[str]:
+    # Returns a field whose values tell apart all the dataclass variants
+    if len(variants) < 2:
+        return None
+    for field_name in variants[0][0]:
+        seen: Set[Hashable] = set()
+        for tags, _ in variants:
+            values = tags.get(field_name)
+            if not values or not seen.isdisjoint(values):
+                break
+            seen.update(values)
+        else:
+            return field_name
+    return None
+
 
 class TypeVarUnpackerBuilder(UnionUnpackerBuilder):
     def get_method_prefix(self) -> str:
@@ -200,7 +508,83 @@ class LiteralUnpackerBuilder(AbstractUnpackerBuilder):
     def get_method_prefix(self) -> str:
         return "literal"
 
+    def _get_cache_key(self, spec: ValueSpec) -> Optional[Hashable]:
+        return spec.get_helper_cache_key("unpack_literal")
+
     def _add_body(self, spec: ValueSpec, lines: CodeLines) -> None:
+        literal_values = get_literal_values(spec.type)
+        if not all(
+            is_hashable(v.value if isinstance(v, enum.Enum) else v)
+            for v in literal_values
+        ):
+            self._add_comparisons(spec, lines)
+            return
+        # the first matching value in Literal wins, so we keep the positions
+        values: Dict[Any, Tuple[int, Any]] = {}
+        bytes_values: Dict[bytes, Tuple[int, bytes]] = {}
+        for idx, literal_value in enumerate(literal_values):
+            if isinstance(literal_value, enum.Enum):
+                values.setdefault(literal_value.value, (idx, literal_value))
+            elif isinstance(literal_value, bytes):
+                bytes_values.setdefault(literal_value, (idx, literal_value))
+            elif isinstance(
+                literal_value,
+                (int, str, bool, NoneType),  # type: ignore
+            ):
+                values.setdefault(literal_value, (idx, literal_value))
+        values_attr = spec.get_unique_attr_name(
+            f"__mashumaro_{spec.field_ctx.name}_literal_values", "__"
+        )
+        values_map = f"{spec.cls_attrs_name}.{values_attr}"
+        if not bytes_values:
+            setattr(
+                spec.attrs,
+                values_attr,
+                {k: result for k, (_, result) in values.items()},
+            )
+            with lines.indent("try:"):
+                lines.append(f"return {values_map}[value]")
+            lines.append("except KeyError: pass")
+            with lines.indent("except TypeError:"):
+                # unhashable values can still be equal to literal values
+                self._add_comparisons(spec, lines)
+            lines.append("raise ValueError(value)")
+            return
+        unpacker = UnpackerRegistry.get(
+            spec.copy(type=bytes, expression="value")
+        )
+        bytes_values_attr = spec.get_unique_attr_name(
+            f"__mashumaro_{spec.field_ctx.name}_literal_bytes", "__"
+        )
+        bytes_values_map = f"{spec.cls_attrs_name}.{bytes_values_attr}"
+        setattr(spec.attrs, bytes_values_attr, bytes_values)
+        if not values:
+            with lines.indent("try:"):
+                lines.append(f"return {bytes_values_map}[{unpacker}][1]")
+            lines.append("except Exception: pass")
+            lines.append("raise ValueError(value)")
+            return
+        setattr(spec.attrs, values_attr, values)
+        with lines.indent("try:"):
+            lines.append(f"found = {values_map}[value]")
+        with lines.indent("except KeyError:"):
+            lines.append("found = None")
+        with lines.indent("except TypeError:"):
+            self._add_comparisons(spec, lines)
+        with lines.indent("try:"):
+            lines.append(f"found_bytes = {bytes_values_map}[{unpacker}]")
+        lines.append("except Exception: pass")
+        with lines.indent("else:"):
+            with lines.indent(
+                "if found is None or found_bytes[0] < found[0]:"
+            ):
+                lines.append("return found_bytes[1]")
+        with lines.indent("if found is not None:"):
+            lines.append("return found[1]")
+        lines.append("raise ValueError(value)")
+
+    @staticmethod
+    def _add_comparisons(spec: ValueSpec, lines: CodeLines) -> None:
         for literal_value in get_literal_values(spec.type):
             if isinstance(literal_value, enum.Enum):
                 lit_type = type(literal_value)
@@ -239,6 +623,7 @@ class DiscriminatedUnionUnpackerBuilder(AbstractUnpackerBuilder):
         self.discriminator = discriminator
         self.base_variants = base_variants or tuple()
         self._variants_attr: Optional[str] = None
+        self._variants_generation_attr: Optional[str] = None
 
     def get_method_prefix(self) -> str:
         return ""
@@ -248,18 +633,38 @@ class DiscriminatedUnionUnpackerBuilder(AbstractUnpackerBuilder):
 
     def _get_variants_attr(self, spec: ValueSpec) -> str:
         if self._variants_attr is None:
-            self._variants_attr = (
-                f"__mashumaro_{spec.field_ctx.name}_variants_{random_hex()}__"
+            self._variants_attr = spec.get_unique_attr_name(
+                f"__mashumaro_{spec.field_ctx.name}_variants", "__"
             )
         return self._variants_attr
 
-    def _get_variants_map(self, spec: ValueSpec) -> str:
-        variants_attr = self._get_variants_attr(spec)
+    def _get_variants_generation_attr(self, spec: ValueSpec) -> str:
+        if self._variants_generation_attr is None:
+            self._variants_generation_attr = spec.get_unique_attr_name(
+                f"__mashumaro_{spec.field_ctx.name}_variants_generation", "__"
+            )
+        return self._variants_generation_attr
+
+    @staticmethod
+    def _get_variants_holder_attr(spec: ValueSpec, attr: str) -> str:
         if spec.builder.is_nailed:
             typ_name = spec.builder.get_type_name_identifier(spec.builder.cls)
-            return f"{typ_name}.{variants_attr}"
+            return f"{typ_name}.{attr}"
         else:
-            return f"{spec.cls_attrs_name}.{variants_attr}"
+            return f"{spec.cls_attrs_name}.{attr}"
+
+    def _get_variants_map(self, spec: ValueSpec) -> str:
+        return self._get_variants_holder_attr(
+            spec, self._get_variants_attr(spec)
+        )
+
+    def _are_variants_tracked(self, spec: ValueSpec) -> bool:
+        # new subclasses of DataClassDictMixin bump the subclasses generation,
+        # so we know when the variants need to be collected again
+        if not self.discriminator.include_subtypes:
+            return True
+        base_variants = self.base_variants or (spec.origin_type,)
+        return all(map(is_dataclass_dict_mixin_subclass, base_variants))
 
     def _get_variant_names(self, spec: ValueSpec) -> List[str]:
         base_variants = self.base_variants or (spec.origin_type,)
@@ -309,6 +714,12 @@ class DiscriminatedUnionUnpackerBuilder(AbstractUnpackerBuilder):
 
         if variants_attr not in variants_attr_holder.__dict__:
             setattr(variants_attr_holder, variants_attr, {})
+        variants_generation_attr = self._get_variants_generation_attr(spec)
+        if variants_generation_attr not in variants_attr_holder.__dict__:
+            setattr(variants_attr_holder, variants_generation_attr, None)
+        variants_generation = self._get_variants_holder_attr(
+            spec, variants_generation_attr
+        )
         variant_method_name = spec.builder.get_unpack_method_name(
             format_name=spec.builder.format_name
         )
@@ -352,7 +763,22 @@ class DiscriminatedUnionUnpackerBuilder(AbstractUnpackerBuilder):
                         f"[{chosen_cls}].{variant_method_call}"
                     )
             with lines.indent("except (KeyError, AttributeError):"):
+                spec.builder.ensure_object_imported(get_subclasses_generation)
                 lines.append(f"variants_map = {variants_map}")
+                if self._are_variants_tracked(spec):
+                    # all the variants were collected and there were no new
+                    # subclasses since then, so the value is unknown
+                    with lines.indent(
+                        f"if {variants_generation} == "
+                        "get_subclasses_generation() "
+                        "and discriminator not in variants_map:"
+                    ):
+                        lines.append(
+                            "raise SuitableVariantNotFoundError("
+                            f"{variants_type_expr}, '{discriminator.field}', "
+                            "discriminator) from None"
+                        )
+                lines.append("generation = get_subclasses_generation()")
                 with lines.indent(f"for variant in {variants}:"):
                     if discriminator.variant_tagger_fn is not None:
                         self._add_register_variant_tags(
@@ -368,6 +794,7 @@ class DiscriminatedUnionUnpackerBuilder(AbstractUnpackerBuilder):
                     self._add_build_variant_unpacker(
                         spec, lines, variant_method_name, variant_method_call
                     )
+                lines.append(f"{variants_generation} = generation")
                 with lines.indent("try:"):
                     if spec.builder.is_nailed:
                         lines.append(
@@ -452,7 +879,9 @@ class DiscriminatedUnionUnpackerBuilder(AbstractUnpackerBuilder):
                     lines.append("except Exception: pass")
         else:
             spec.builder.ensure_object_imported(AttrsHolder)
-            attrs = f"attrs_{random_hex()}"
+            attrs = "attrs_" + stable_hex(
+                spec.attrs.__name__, spec.field_ctx.name, variant_method_name
+            )
             lines.append(f"{attrs} = AttrsHolder('{attrs}')")
             lines.append(f"{spec.attrs_registry_name}[variant] = {attrs}")
             lines.append(
@@ -490,6 +919,9 @@ class SubtypeUnpackerBuilder(DiscriminatedUnionUnpackerBuilder):
             self._variants_attr = "__mashumaro_subtype_variants__"
         return self._variants_attr
 
+    def _get_variants_generation_attr(self, spec: ValueSpec) -> str:
+        return "__mashumaro_subtype_variants_generation__"
+
 
 def _unpack_with_annotated_serialization_strategy(
     spec: ValueSpec,
@@ -510,7 +942,9 @@ def _unpack_with_annotated_serialization_strategy(
         value_type,  # type: ignore
         resolve_type_params(strategy_type, get_args(spec.type))[strategy_type],
     )
-    overridden_fn = f"__{spec.field_ctx.name}_deserialize_{random_hex()}"
+    overridden_fn = spec.get_unique_attr_name(
+        f"__{spec.field_ctx.name}_deserialize"
+    )
     setattr(spec.attrs, overridden_fn, strategy.deserialize)
     unpacker = UnpackerRegistry.get(spec.copy(type=value_type))
     return f"{spec.cls_attrs_name}.{overridden_fn}({unpacker})"
@@ -556,7 +990,9 @@ def unpack_type_with_overridden_deserialization(
     elif isinstance(deserialization_method, ExpressionWrapper):
         return deserialization_method.expression
     elif callable(deserialization_method):
-        overridden_fn = f"__{spec.field_ctx.name}_deserialize_{random_hex()}"
+        overridden_fn = spec.get_unique_attr_name(
+            f"__{spec.field_ctx.name}_deserialize"
+        )
         setattr(spec.attrs, overridden_fn, deserialization_method)
         return f"{spec.cls_attrs_name}.{overridden_fn}({spec.expression})"
 
@@ -627,6 +1063,17 @@ def unpack_generic_serializable_type(spec: ValueSpec) -> Optional[Expression]:
             )
 
 
+@register
+def unpack_lazy(spec: ValueSpec) -> Optional[Expression]:
+    if spec.origin_type is Lazy:
+        args = get_args(spec.type)
+        unpacker = UnpackerRegistry.get(
+            spec.copy(type=args[0] if args else Any, expression="value")
+        )
+        spec.builder.ensure_object_imported(Lazy)
+        return f"Lazy._from_raw({spec.expression}, lambda value: {unpacker})"
+
+
 @register
 def unpack_dataclass(spec: ValueSpec) -> Optional[Expression]:
     if is_dataclass(spec.origin_type):
@@ -824,6 +1271,26 @@ def unpack_bool_and_none(spec: ValueSpec) -> Optional[Expression]:
 def unpack_date_objects(spec: ValueSpec) -> Optional[Expression]:
     if spec.origin_type in (datetime.datetime, datetime.date, datetime.time):
         deserialize_option = get_overridden_deserialization_method(spec)
+        if spec.origin_type is datetime.datetime and deserialize_option in (
+            "timestamp",
+            "timestamp_ms",
+        ):
+            if deserialize_option == "timestamp_ms":
+                method = "__timestamp_ms_to_datetime"
+                spec.builder.ensure_object_imported(
+                    timestamp_ms_to_datetime, method
+                )
+                return f"{method}({spec.expression})"
+            spec.builder.ensure_object_imported(
+                datetime.datetime.fromtimestamp, "__datetime_fromtimestamp"
+            )
+            spec.builder.ensure_object_imported(
+                datetime.timezone.utc, "__datetime_timezone_utc"
+            )
+            return (
+                f"__datetime_fromtimestamp({spec.expression}, "
+                "__datetime_timezone_utc)"
+            )
         if deserialize_option is not None:
             if deserialize_option == "ciso8601":
                 if ciso8601:
@@ -1027,9 +1494,9 @@ def unpack_named_tuple(spec: ValueSpec) -> Expression:
         return f"{field_type}({', '.join(unpackers)})"
 
     lines = CodeLines()
-    method_name = (
+    method_name = spec.get_unique_attr_name(
         f"__unpack_named_tuple_{spec.builder.cls.__name__}_"
-        f"{spec.field_ctx.name}__{random_hex()}"
+        f"{spec.field_ctx.name}"
     )
     default_kwargs = spec.builder.get_unpack_method_default_flag_values()
     if spec.builder.is_nailed:
@@ -1054,10 +1521,7 @@ def unpack_named_tuple(spec: ValueSpec) -> Expression:
     lines.append(
         f"setattr({spec.cls_attrs_name}, '{method_name}', {method_name})"
     )
-    if spec.builder.get_config().debug:
-        print(f"{type_name(spec.builder.cls)}:")
-        print(lines.as_text())
-    exec(lines.as_text(), spec.builder.globals, spec.builder.__dict__)
+    spec.builder.compile_helper(lines)
     method_args = ", ".join(
         filter(None, (spec.expression, spec.builder.get_unpack_method_flags()))
     )
@@ -1076,9 +1540,9 @@ def unpack_typed_dict(spec: ValueSpec) -> Expression:
     required_keys = getattr(spec.type, "__required_keys__", all_keys)
     optional_keys = getattr(spec.type, "__optional_keys__", [])
     lines = CodeLines()
-    method_name = (
+    method_name = spec.get_unique_attr_name(
         f"__unpack_typed_dict_{spec.builder.cls.__name__}_"
-        f"{spec.field_ctx.name}__{random_hex()}"
+        f"{spec.field_ctx.name}"
     )
     default_kwargs = spec.builder.get_unpack_method_default_flag_values()
     if spec.builder.is_nailed:
@@ -1119,10 +1583,7 @@ def unpack_typed_dict(spec: ValueSpec) -> Expression:
     lines.append(
         f"setattr({spec.cls_attrs_name}, '{method_name}', {method_name})"
     )
-    if spec.builder.get_config().debug:
-        print(f"{type_name(spec.builder.cls)}:")
-        print(lines.as_text())
-    exec(lines.as_text(), spec.builder.globals, spec.builder.__dict__)
+    spec.builder.compile_helper(lines)
     method_args = ", ".join(
         filter(None, (spec.expression, spec.builder.get_unpack_method_flags()))
     )
@@ -1233,8 +1694,26 @@ def unpack_pathlike(spec: ValueSpec) -> Optional[Expression]:
         return f"{field_type}({spec.expression})"
 
 
+def _get_enum_loader(enum_type: Type[enum.Enum]) -> Callable[[Any], Any]:
+    # calling the enum class looks up the same map, but only after some
+    # overhead, so we call it only for the values that aren't there
+    value2member_map = enum_type._value2member_map_
+
+    def load_enum(value: Any) -> Any:
+        try:
+            return value2member_map[value]
+        except (KeyError, TypeError):
+            pass
+        return enum_type(value)
+
+    return load_enum
+
+
 @register
 def unpack_enum(spec: ValueSpec) -> Optional[Expression]:
     if issubclass(spec.origin_type, enum.Enum):
-        field_type = spec.builder.get_type_name_identifier(spec.origin_type)
-        return f"{field_type}({spec.expression})"
+        loader_name = f"__{clean_id(type_name(spec.origin_type))}_from_value"
+        spec.builder.ensure_object_imported(
+            _get_enum_loader(spec.origin_type), loader_name
+        )
+        return f"{loader_name}({spec.expression})"
@@ -27,6 +27,8 @@ class Dialect:
     no_copy_collections: Union[Sequence[Any], Literal[Sentinel.MISSING]] = (
         Sentinel.MISSING
     )
+    trusted_input: Union[bool, Literal[Sentinel.MISSING]] = Sentinel.MISSING
+    orjson_native: Union[bool, Literal[Sentinel.MISSING]] = Sentinel.MISSING
 
     @classmethod
     def merge(cls, other: Type["Dialect"]) -> Type["Dialect"]:
@@ -53,7 +55,13 @@ class Dialect:
                 )
         new_dialect = cast(Type[Dialect], new_class("Dialect", (Dialect,)))
         new_dialect.serialization_strategy = serialization_strategy
-        for key in ("omit_none", "omit_default", "no_copy_collections"):
+        for key in (
+            "omit_none",
+            "omit_default",
+            "no_copy_collections",
+            "trusted_input",
+            "orjson_native",
+        ):
             if (others_value := getattr(other, key)) is not Sentinel.MISSING:
                 setattr(new_dialect, key, others_value)
             else:
@@ -11,15 +11,20 @@ __all__ = [
 
 
 NamedTupleDeserializationEngine = Literal["as_dict", "as_list"]
-DateTimeDeserializationEngine = Literal["ciso8601", "pendulum"]
+DateTimeDeserializationEngine = Literal[
+    "ciso8601", "pendulum", "timestamp", "timestamp_ms"
+]
 AnyDeserializationEngine = Literal[
     NamedTupleDeserializationEngine, DateTimeDeserializationEngine
 ]
 
 NamedTupleSerializationEngine = Literal["as_dict", "as_list"]
+DateTimeSerializationEngine = Literal["timestamp", "timestamp_ms"]
 OmitSerializationEngine = Literal["omit"]
 AnySerializationEngine = Union[
-    NamedTupleSerializationEngine, OmitSerializationEngine
+    NamedTupleSerializationEngine,
+    DateTimeSerializationEngine,
+    OmitSerializationEngine,
 ]
 
 
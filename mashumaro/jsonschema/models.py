@@ -62,6 +62,8 @@ class JSONSchemaStringFormat(JSONSchemaInstanceFormat):
 
 class JSONSchemaInstanceFormatExtension(JSONSchemaInstanceFormat):
     TIMEDELTA = "time-delta"
+    TIMESTAMP = "timestamp"
+    TIMESTAMP_MS = "timestamp-ms"
     TIME_ZONE = "time-zone"
     IPV4NETWORK = "ipv4network"
     IPV6NETWORK = "ipv6network"
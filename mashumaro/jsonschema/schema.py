@@ -85,7 +85,7 @@ from mashumaro.jsonschema.models import (
     JSONSchemaInstanceType,
     JSONSchemaStringFormat,
 )
-from mashumaro.types import SerializationStrategy
+from mashumaro.types import Lazy, RawBytes, RawJSON, SerializationStrategy
 
 if PY_39_MIN:
     from zoneinfo import ZoneInfo
@@ -383,6 +383,19 @@ def on_dataclass(instance: Instance, ctx: Context) -> Optional[JSONSchema]:
             return schema
 
 
+@register
+def on_lazy(instance: Instance, ctx: Context) -> Optional[JSONSchema]:
+    if instance.origin_type is Lazy:
+        args = get_args(instance.type)
+        return get_schema(instance.derive(type=args[0] if args else Any), ctx)
+
+
+@register
+def on_raw(instance: Instance, ctx: Context) -> Optional[JSONSchema]:
+    if instance.origin_type in (RawJSON, RawBytes):
+        return EmptyJSONSchema()
+
+
 @register
 def on_any(instance: Instance, ctx: Context) -> Optional[JSONSchema]:
     if instance.type is Any:
@@ -498,6 +511,18 @@ def on_date_objects(instance: Instance, ctx: Context) -> Optional[JSONSchema]:
         datetime.date,
         datetime.time,
     ):
+        serialize_option = instance.get_overridden_serialization_method()
+        if instance.origin_type is datetime.datetime:
+            if serialize_option == "timestamp":
+                return JSONSchema(
+                    type=JSONSchemaInstanceType.NUMBER,
+                    format=JSONSchemaInstanceFormatExtension.TIMESTAMP,
+                )
+            elif serialize_option == "timestamp_ms":
+                return JSONSchema(
+                    type=JSONSchemaInstanceType.INTEGER,
+                    format=JSONSchemaInstanceFormatExtension.TIMESTAMP_MS,
+                )
         return JSONSchema(
             type=JSONSchemaInstanceType.STRING,
             format=DATETIME_FORMATS[instance.origin_type],
@@ -1,8 +1,10 @@
 from typing import Any, Dict, Mapping, Type, TypeVar, final
 
+from mashumaro.core.meta.helpers import bump_subclasses_generation
 from mashumaro.core.meta.mixin import (
     compile_mixin_packer,
     compile_mixin_unpacker,
+    iter_mixin_builder_params,
 )
 
 __all__ = ["DataClassDictMixin"]
@@ -17,12 +19,10 @@ class DataClassDictMixin:
     __mashumaro_builder_params = {"packer": {}, "unpacker": {}}  # type: ignore
 
     def __init_subclass__(cls: Type[T], **kwargs: Any):
-        for ancestor in cls.__mro__[-1:0:-1]:
-            builder_params_ = f"_{ancestor.__name__}__mashumaro_builder_params"
-            builder_params = getattr(ancestor, builder_params_, None)
-            if builder_params:
-                compile_mixin_unpacker(cls, **builder_params["unpacker"])
-                compile_mixin_packer(cls, **builder_params["packer"])
+        bump_subclasses_generation()
+        for builder_params in iter_mixin_builder_params(cls):
+            compile_mixin_unpacker(cls, **builder_params["unpacker"])
+            compile_mixin_packer(cls, **builder_params["packer"])
 
     @final
     def to_dict(
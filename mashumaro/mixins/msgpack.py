@@ -1,10 +1,16 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from fractions import Fraction
 from typing import Any, Callable, Dict, Type, TypeVar, final
+from uuid import UUID
 
 import msgpack
 
 from mashumaro.dialect import Dialect
 from mashumaro.helper import pass_through
 from mashumaro.mixins.dict import DataClassDictMixin
+from mashumaro.types import RawBytes
 
 T = TypeVar("T", bound="DataClassMessagePackMixin")
 
@@ -14,6 +20,16 @@ Encoder = Callable[[Any], EncodedData]
 Decoder = Callable[[EncodedData], Dict[Any, Any]]
 
 
+def _dump_raw_bytes(value: RawBytes) -> Any:
+    # msgpack can't embed packed data, so it's unpacked by the C extension
+    # without going through the generated packers
+    return msgpack.unpackb(value.data, raw=False)
+
+
+def _load_raw_bytes(value: Any) -> RawBytes:
+    return RawBytes(msgpack.packb(value, use_bin_type=True))
+
+
 class MessagePackDialect(Dialect):
     no_copy_collections = (list, dict)
     serialization_strategy = {
@@ -22,11 +38,127 @@ class MessagePackDialect(Dialect):
             "deserialize": bytearray,
             "serialize": pass_through,
         },
+        RawBytes: {
+            "serialize": _dump_raw_bytes,
+            "deserialize": _load_raw_bytes,
+        },
     }
 
 
+DECIMAL_EXT_TYPE = 1
+FRACTION_EXT_TYPE = 2
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _pack_datetime(value: datetime) -> Any:
+    # the timedelta arithmetic keeps the microseconds exact
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - _EPOCH
+    return msgpack.Timestamp(
+        delta.days * 86400 + delta.seconds, delta.microseconds * 1000
+    )
+
+
+def _unpack_datetime(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    elif isinstance(value, msgpack.Timestamp):
+        return _EPOCH + timedelta(0, value.seconds, value.nanoseconds // 1000)
+    return datetime.fromisoformat(value)
+
+
+def _pack_uuid(value: UUID) -> bytes:
+    return value.bytes
+
+
+def _unpack_uuid(value: Any) -> UUID:
+    if isinstance(value, bytes):
+        return UUID(bytes=value)
+    return UUID(value)
+
+
+def _pack_decimal(value: Decimal) -> msgpack.ExtType:
+    return msgpack.ExtType(DECIMAL_EXT_TYPE, str(value).encode())
+
+
+def _unpack_decimal(value: Any) -> Decimal:
+    if isinstance(value, Decimal):
+        return value
+    elif isinstance(value, msgpack.ExtType):
+        if value.code != DECIMAL_EXT_TYPE:
+            raise ValueError(f"Unexpected ext type {value.code}")
+        return Decimal(value.data.decode())
+    return Decimal(value)
+
+
+def _pack_fraction(value: Fraction) -> msgpack.ExtType:
+    return msgpack.ExtType(FRACTION_EXT_TYPE, str(value).encode())
+
+
+def _unpack_fraction(value: Any) -> Fraction:
+    if isinstance(value, Fraction):
+        return value
+    elif isinstance(value, msgpack.ExtType):
+        if value.code != FRACTION_EXT_TYPE:
+            raise ValueError(f"Unexpected ext type {value.code}")
+        return Fraction(value.data.decode())
+    return Fraction(value)
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    if code == DECIMAL_EXT_TYPE:
+        return Decimal(data.decode())
+    elif code == FRACTION_EXT_TYPE:
+        return Fraction(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+def ext_decoder(data: EncodedData) -> Dict[Any, Any]:
+    # the extension types are converted by the unpacker without creating
+    # intermediate Timestamp and ExtType objects
+    return msgpack.unpackb(data, raw=False, timestamp=3, ext_hook=_ext_hook)
+
+
+class MessagePackExtDialect(Dialect):
+    serialization_strategy = {
+        datetime: {
+            "serialize": _pack_datetime,
+            "deserialize": _unpack_datetime,
+        },
+        UUID: {"serialize": _pack_uuid, "deserialize": _unpack_uuid},
+        Decimal: {"serialize": _pack_decimal, "deserialize": _unpack_decimal},
+        Fraction: {
+            "serialize": _pack_fraction,
+            "deserialize": _unpack_fraction,
+        },
+    }
+
+
+PACKER_BUFFER_LIMIT = 1024 * 1024
+
+
+class _ThreadPacker(threading.local):
+    # msgpack.packb creates a new Packer on each call, and a Packer can't be
+    # shared between threads
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.pack = msgpack.Packer(use_bin_type=True).pack
+
+
+_thread_packer = _ThreadPacker()
+
+
 def default_encoder(data: Any) -> EncodedData:
-    return msgpack.packb(data, use_bin_type=True)
+    result = _thread_packer.pack(data)
+    if len(result) > PACKER_BUFFER_LIMIT:
+        # the buffer of a Packer never shrinks, so it's not kept for
+        # big values
+        _thread_packer.reset()
+    return result
 
 
 def default_decoder(data: EncodedData) -> Dict[Any, Any]:
@@ -8,6 +8,7 @@ from mashumaro.core.helpers import ConfigValue
 from mashumaro.dialect import Dialect
 from mashumaro.helper import pass_through
 from mashumaro.mixins.dict import DataClassDictMixin
+from mashumaro.types import RawJSON
 
 T = TypeVar("T", bound="DataClassORJSONMixin")
 
@@ -17,13 +18,31 @@ Encoder = Callable[[Any], EncodedData]
 Decoder = Callable[[EncodedData], Dict[Any, Any]]
 
 
+if hasattr(orjson, "Fragment"):
+
+    def _dump_raw_json(value: RawJSON) -> Any:
+        return orjson.Fragment(value.data)
+
+else:
+
+    def _dump_raw_json(value: RawJSON) -> Any:
+        # orjson < 3.9 can't embed encoded JSON
+        return orjson.loads(value.data)
+
+
+def _load_raw_json(value: Any) -> RawJSON:
+    return RawJSON(orjson.dumps(value))
+
+
 class OrjsonDialect(Dialect):
     no_copy_collections = (list, dict)
+    orjson_native = False
     serialization_strategy = {
         datetime: {"serialize": pass_through},
         date: {"serialize": pass_through},
         time: {"serialize": pass_through},
         UUID: {"serialize": pass_through},
+        RawJSON: {"serialize": _dump_raw_json, "deserialize": _load_raw_json},
     }
 
 
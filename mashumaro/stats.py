@@ -0,0 +1,121 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Generator, List, Tuple
+
+__all__ = [
+    "CodegenStats",
+    "codegen_report",
+    "disable",
+    "enable",
+    "is_enabled",
+    "reset",
+]
+
+
+ENV_VAR = "MASHUMARO_CODEGEN_STATS"
+
+
+@dataclass
+class CodegenStats:
+    target: Any
+    format_name: str
+    resolve_time: float = 0.0
+    generate_time: float = 0.0
+    compile_time: float = 0.0
+    methods: int = 0
+    helpers: int = 0
+    lazy_compilations: int = 0
+
+    @property
+    def total_time(self) -> float:
+        return self.resolve_time + self.generate_time + self.compile_time
+
+
+class CodegenStatsCollector:
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats: Dict[Tuple[Any, str], CodegenStats] = {}
+
+    def _get_stats(self, target: Any, format_name: str) -> CodegenStats:
+        try:
+            hash(target)
+        except TypeError:
+            target = repr(target)
+        key = (target, format_name)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = CodegenStats(target, format_name)
+        return stats
+
+    @contextmanager
+    def measure(
+        self, target: Any, format_name: str, phase: str
+    ) -> Generator[None, None, None]:
+        if not self.enabled:
+            yield
+            return
+        # time spent in nested phases is counted only once, so that
+        # the phases of a report add up to the real time
+        stack = self._local.__dict__.setdefault("stack", [])
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            attr = f"{phase}_time"
+            with self._lock:
+                stats = self._get_stats(target, format_name)
+                setattr(stats, attr, getattr(stats, attr) + elapsed - nested)
+
+    def count(
+        self, target: Any, format_name: str, counter: str, n: int = 1
+    ) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self._get_stats(target, format_name)
+            setattr(stats, counter, getattr(stats, counter) + n)
+
+    def report(self) -> List[CodegenStats]:
+        with self._lock:
+            result = [replace(stats) for stats in self._stats.values()]
+        result.sort(key=lambda s: s.total_time, reverse=True)
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+codegen_stats = CodegenStatsCollector(
+    os.environ.get(ENV_VAR, "").lower() in ("1", "true", "yes", "on")
+)
+
+
+def enable() -> None:
+    codegen_stats.enabled = True
+
+
+def disable() -> None:
+    codegen_stats.enabled = False
+
+
+def is_enabled() -> bool:
+    return codegen_stats.enabled
+
+
+def reset() -> None:
+    codegen_stats.reset()
+
+
+def codegen_report() -> List[CodegenStats]:
+    return codegen_stats.report()
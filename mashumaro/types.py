@@ -1,6 +1,17 @@
 import decimal
+import json
 from dataclasses import dataclass
-from typing import Any, Callable, List, Optional, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from typing_extensions import Literal
 
@@ -12,9 +23,15 @@ __all__ = [
     "SerializationStrategy",
     "RoundedDecimal",
     "Discriminator",
+    "Lazy",
+    "RawJSON",
+    "RawBytes",
 ]
 
 
+T = TypeVar("T")
+
+
 class SerializableType:
     __slots__ = ()
 
@@ -105,3 +122,93 @@ class Discriminator:
                 "Either 'include_supertypes' or 'include_subtypes' "
                 "must be enabled"
             )
+
+
+class Lazy(Generic[T]):
+    __slots__ = ("_value", "_pending")
+
+    def __init__(self, value: T):
+        self._value = value
+        self._pending: Optional[Tuple[Any, Callable[[Any], T]]] = None
+
+    @classmethod
+    def _from_raw(cls, raw: Any, unpacker: Callable[[Any], T]) -> "Lazy[T]":
+        lazy = cls.__new__(cls)
+        lazy._pending = (raw, unpacker)
+        return lazy
+
+    @property
+    def value(self) -> T:
+        pending = self._pending
+        if pending is not None:
+            self._value = pending[1](pending[0])
+            self._pending = None
+        return self._value
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Lazy):
+            return self.value == other.value
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # the pending unpacker is a local function of the generated code
+        # that can't be pickled, so the value is loaded beforehand
+        return type(self), (self.value,)
+
+    def __repr__(self) -> str:
+        if self._pending is not None:
+            return f"{type(self).__name__}(<not loaded>)"
+        return f"{type(self).__name__}({self._value!r})"
+
+
+class RawJSON(SerializableType):
+    __slots__ = ("data",)
+
+    def __init__(self, data: Union[str, bytes]):
+        self.data = data.encode() if isinstance(data, str) else data
+
+    def _serialize(self) -> Any:
+        return json.loads(self.data)
+
+    @classmethod
+    def _deserialize(cls, value: Any) -> "RawJSON":
+        return cls(json.dumps(value))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, RawJSON):
+            return self.data == other.data
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.data!r})"
+
+
+class RawBytes(SerializableType):
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def _serialize(self) -> Any:
+        return self.data
+
+    @classmethod
+    def _deserialize(cls, value: Any) -> "RawBytes":
+        return cls(value)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, RawBytes):
+            return self.data == other.data
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.data!r})"
@@ -0,0 +1,103 @@
+import importlib
+import importlib.util
+import sys
+import textwrap
+
+import pytest
+
+from mashumaro.bytecode_cache import (
+    add_cached_bytecode,
+    generate_bytecode_cache_module,
+    main,
+)
+from mashumaro.core.meta.code.cache import code_cache
+
+MODELS_SOURCE = textwrap.dedent(
+    """
+    from dataclasses import dataclass
+    from typing import List, Optional, Union
+
+    from mashumaro import DataClassDictMixin
+    from mashumaro.config import BaseConfig
+
+
+    @dataclass
+    class Item(DataClassDictMixin):
+        value: Union[int, str]
+
+
+    @dataclass
+    class Order(DataClassDictMixin):
+        items: List[Item]
+        comment: Optional[str] = None
+
+
+    @dataclass
+    class LazyOrder(DataClassDictMixin):
+        items: List[Item]
+
+        class Config(BaseConfig):
+            lazy_compilation = True
+    """
+)
+
+
+@pytest.fixture
+def models_module(tmp_path, monkeypatch):
+    module_name = f"bytecode_cache_models_{abs(hash(str(tmp_path)))}"
+    (tmp_path / f"{module_name}.py").write_text(MODELS_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(code_cache, "in_memory", {})
+    yield module_name
+    sys.modules.pop(module_name, None)
+
+
+def test_generate_bytecode_cache_module(models_module):
+    source = generate_bytecode_cache_module([models_module])
+    assert source.startswith(
+        "# Bytecode cache generated by mashumaro.bytecode_cache"
+    )
+    assert f"# Source modules: {models_module}" in source
+    namespace = {}
+    exec(source, namespace)
+    assert code_cache.in_memory
+
+
+def test_cached_bytecode_is_used(models_module, mocker):
+    source = generate_bytecode_cache_module([models_module])
+    exec(source, {})
+    sys.modules.pop(models_module)
+    mocked_compile = mocker.patch(
+        "mashumaro.core.meta.code.cache.compile", create=True
+    )
+    module = importlib.import_module(models_module)
+    mocked_compile.assert_not_called()
+    order = module.Order.from_dict({"items": [{"value": "a"}]})
+    assert order == module.Order([module.Item("a")])
+    assert order.to_dict() == {"items": [{"value": "a"}], "comment": None}
+    lazy_order = module.LazyOrder.from_dict({"items": [{"value": 1}]})
+    assert lazy_order.to_dict() == {"items": [{"value": 1}]}
+    mocked_compile.assert_not_called()
+
+
+def test_cached_bytecode_of_other_python_versions_is_ignored(monkeypatch):
+    monkeypatch.setattr(code_cache, "in_memory", {})
+    add_cached_bytecode(b"\x00\x00\r\n", {"key": b"data"})
+    assert code_cache.in_memory == {}
+    add_cached_bytecode(importlib.util.MAGIC_NUMBER, {"key": b"data"})
+    assert code_cache.in_memory == {"key": b"data"}
+
+
+def test_main_writes_output_file(models_module, tmp_path):
+    output = tmp_path / "_mashumaro_bytecode.py"
+    main([models_module, "-o", str(output)])
+    assert output.read_text().startswith(
+        "# Bytecode cache generated by mashumaro.bytecode_cache"
+    )
+
+
+def test_main_writes_to_stdout(models_module, capsys):
+    main([models_module])
+    assert capsys.readouterr().out.startswith(
+        "# Bytecode cache generated by mashumaro.bytecode_cache"
+    )
@@ -0,0 +1,111 @@
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+
+import pytest
+
+from mashumaro import DataClassDictMixin
+from mashumaro.codecs import BasicDecoder, BasicEncoder
+from mashumaro.core.meta.code.cache import CodeCache, code_cache
+
+
+def make_class():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Union[int, str]
+        y: Optional[Union[List[int], Dict[str, int]]] = None
+
+    return DataClass
+
+
+def get_generated_names(cls):
+    return sorted(name for name in vars(cls) if name.startswith("__"))
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(code_cache, "directory", str(tmp_path))
+    return tmp_path
+
+
+def test_generated_names_are_deterministic():
+    assert get_generated_names(make_class()) == get_generated_names(
+        make_class()
+    )
+
+
+@dataclass
+class Leaf:
+    x: Union[int, str]
+
+
+@dataclass
+class Node:
+    leaves: List[Leaf]
+    leaf: Optional[Union[Leaf, Dict[str, Leaf]]] = None
+
+
+def get_cache_keys(create_codec):
+    recorder = {}
+    code_cache.recorder = recorder
+    try:
+        create_codec()
+    finally:
+        code_cache.recorder = None
+    return set(recorder)
+
+
+def test_codec_code_does_not_depend_on_previous_codecs():
+    keys = get_cache_keys(lambda: BasicDecoder(Node))
+    BasicDecoder(List[Leaf])
+    BasicEncoder(Union[Leaf, Node])
+    assert get_cache_keys(lambda: BasicDecoder(Node)) == keys
+
+
+def test_code_is_stored_in_cache_dir(cache_dir):
+    cls = make_class()
+    assert os.listdir(cache_dir)
+    assert cls.from_dict({"x": "a", "y": [1]}).to_dict() == {
+        "x": "a",
+        "y": [1],
+    }
+
+
+def test_code_is_loaded_from_cache_dir(cache_dir, mocker):
+    make_class()
+    files = set(os.listdir(cache_dir))
+    mocked_compile = mocker.patch(
+        "mashumaro.core.meta.code.cache.compile", create=True
+    )
+    cls = make_class()
+    mocked_compile.assert_not_called()
+    assert set(os.listdir(cache_dir)) == files
+    assert cls.from_dict({"x": 1}) == cls(1)
+
+
+def test_broken_cache_entry_is_ignored(tmp_path):
+    cache = CodeCache(str(tmp_path))
+    source = "x = 1"
+    with open(cache.get_path(cache.get_key(source)), "wb") as f:
+        f.write(b"garbage")
+    namespace = {}
+    exec(cache.get_code(source), namespace)
+    assert namespace["x"] == 1
+    exec(cache.load(source), namespace)
+
+
+def test_cache_is_disabled_without_directory():
+    cache = CodeCache()
+    assert cache.load("x = 1") is None
+    namespace = {}
+    exec(cache.get_code("x = 1"), namespace)
+    assert namespace["x"] == 1
+
+
+def test_unwritable_cache_dir_is_ignored(tmp_path):
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_text("")
+    cache = CodeCache(str(not_a_dir))
+    namespace = {}
+    exec(cache.get_code("x = 1"), namespace)
+    assert namespace["x"] == 1
@@ -1,13 +1,16 @@
-from dataclasses import dataclass
+import gc
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from typing import Generic, List, Optional, TypeVar, Union
 
 import pytest
-from typing_extensions import Literal
+from typing_extensions import Annotated, Literal
 
+import mashumaro.codecs._cache as codecs_cache
 from mashumaro.codecs import BasicDecoder, BasicEncoder
 from mashumaro.codecs.basic import decode, encode
 from mashumaro.dialect import Dialect
+from mashumaro.exceptions import MissingField
 from tests.entities import (
     DataClassWithoutMixin,
     GenericNamedTuple,
@@ -28,6 +31,15 @@ class Bar:
     bar: str
 
 
+@dataclass
+class Record:
+    id: int
+    foo: Foo
+    tags: List[str] = field(default_factory=list)
+    created_at: Optional[datetime] = None
+    note: str = ""
+
+
 class MyDialect(Dialect):
     serialization_strategy = {
         date: {
@@ -245,3 +257,131 @@ def test_with_two_generic_dataclass_fields():
     )
     assert decoder.decode(data) == obj
     assert encoder.encode(obj) == data
+
+
+def test_decode_encode_reuse_compiled_codecs(mocker):
+    get_codec = mocker.spy(codecs_cache, "_get_cached_codec")
+    assert decode(["2023-09-22"], List[date]) == [date(2023, 9, 22)]
+    assert decode(["2023-09-22"], List[date]) == [date(2023, 9, 22)]
+    assert encode([date(2023, 9, 22)], List[date]) == ["2023-09-22"]
+    assert encode([date(2023, 9, 22)], List[date]) == ["2023-09-22"]
+    assert get_codec.spy_return_list[0] is get_codec.spy_return_list[1]
+    assert get_codec.spy_return_list[2] is get_codec.spy_return_list[3]
+
+
+def test_decode_respects_union_args_order():
+    assert decode("1", Union[int, str]) == 1
+    assert decode("1", Union[str, int]) == "1"
+
+
+def test_decode_with_unhashable_shape_type():
+    shape_type = Annotated[int, {"unhashable": []}]
+    assert decode("1", shape_type) == 1
+    assert decode("2", shape_type) == 2
+
+
+@pytest.mark.parametrize(
+    ("shape_type", "values", "objs"),
+    (
+        (Foo, [{"foo": "a"}, {"foo": "b"}], [Foo("a"), Foo("b")]),
+        (List[date], [["2023-09-22"], []], [[date(2023, 9, 22)], []]),
+        (Optional[int], [1, None], [1, None]),
+        (date, (v for v in ["2023-09-22"]), [date(2023, 9, 22)]),
+    ),
+)
+def test_decode_many_and_encode_many(shape_type, values, objs):
+    values = list(values)
+    assert BasicDecoder(shape_type).decode_many(iter(values)) == objs
+    assert BasicEncoder(shape_type).encode_many(iter(objs)) == values
+
+
+def test_decode_many_and_encode_many_with_default_dialect():
+    decoder = BasicDecoder(date, default_dialect=MyDialect)
+    encoder = BasicEncoder(date, default_dialect=MyDialect)
+    assert decoder.decode_many([738785, 738786]) == [
+        date(2023, 9, 22),
+        date(2023, 9, 23),
+    ]
+    assert encoder.encode_many([date(2023, 9, 22)]) == [738785]
+
+
+def test_decode_many_pause_gc():
+    decoder = BasicDecoder(Foo)
+    assert decoder.decode_many([{"foo": "a"}], pause_gc=True) == [Foo("a")]
+    assert gc.isenabled()
+    with pytest.raises(MissingField):
+        decoder.decode_many([{"foo": "a"}, {}], pause_gc=True)
+    assert gc.isenabled()
+    gc.disable()
+    try:
+        assert decoder.decode_many([{"foo": "a"}], pause_gc=True)
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
+
+
+def test_decode_only_some_fields():
+    decoder = BasicDecoder(Record, only={"id", "note"})
+    obj = decoder.decode(
+        {
+            "id": "1",
+            "foo": {"invalid": "value"},
+            "tags": ["a"],
+            "created_at": "invalid",
+            "note": "note",
+        }
+    )
+    assert (obj.id, obj.tags, obj.created_at, obj.note) == (
+        1,
+        [],
+        None,
+        "note",
+    )
+    assert obj.tags is not decoder.decode({"id": 2}).tags
+    with pytest.raises(AttributeError):
+        obj.foo
+    with pytest.raises(AttributeError):
+        repr(obj)
+    assert decoder.decode_many([{"id": 1}, {"id": 2}])[1].id == 2
+    with pytest.raises(MissingField):
+        decoder.decode({})
+
+    obj = BasicDecoder(Record, only=["foo"]).decode({"foo": {"foo": "foo"}})
+    assert obj.foo == Foo("foo")
+    with pytest.raises(AttributeError):
+        obj.id
+
+
+def test_decode_only_some_fields_of_generic_dataclass():
+    decoder = BasicDecoder(MyGenericDataClass[date], only={"x"})
+    assert decoder.decode({"x": "2023-09-22"}).x == date(2023, 9, 22)
+
+
+def test_decode_only_invalid_fields():
+    with pytest.raises(ValueError, match="doesn't have fields bar, baz"):
+        BasicDecoder(Foo, only={"foo", "bar", "baz"})
+    with pytest.raises(ValueError, match="it's not a dataclass"):
+        BasicDecoder(List[Foo], only={"foo"})
+
+
+def test_encode_only_some_fields():
+    obj = Record(1, Foo("foo"), ["a"], datetime(2024, 1, 1), "note")
+    encoder = BasicEncoder(Record, include={"id", "foo", "note"})
+    assert encoder.encode(obj) == {
+        "id": 1,
+        "foo": {"foo": "foo"},
+        "note": "note",
+    }
+    encoder = BasicEncoder(Record, exclude={"foo", "created_at"})
+    assert encoder.encode(obj) == {"id": 1, "tags": ["a"], "note": "note"}
+    encoder = BasicEncoder(Record, include={"id", "foo"}, exclude={"foo"})
+    assert encoder.encode_many([obj, obj]) == [{"id": 1}, {"id": 1}]
+    # fields outside the view aren't read at all
+    assert BasicEncoder(Foo, include=()).encode(object()) == {}
+
+
+def test_encode_only_invalid_fields():
+    with pytest.raises(ValueError, match="doesn't have fields bar, baz"):
+        BasicEncoder(Foo, include={"foo", "bar"}, exclude={"baz"})
+    with pytest.raises(ValueError, match="it's not a dataclass"):
+        BasicEncoder(List[Foo], exclude={"foo"})
@@ -1,6 +1,10 @@
+import io
 import json
+from dataclasses import dataclass
 from datetime import date
-from typing import List
+from typing import Any, List
+
+import pytest
 
 from mashumaro.codecs.json import (
     JSONDecoder,
@@ -63,6 +67,14 @@ def test_pre_decoder_func():
     ]
 
 
+def test_decode_many_and_encode_many():
+    decoder = JSONDecoder(List[date], default_dialect=MyDialect)
+    encoder = JSONEncoder(List[date], default_dialect=MyDialect)
+    objs = [[date(2023, 9, 22)], [date(2023, 9, 23), date(2023, 9, 24)]]
+    assert decoder.decode_many(["[738785]", "[738786, 738787]"]) == objs
+    assert encoder.encode_many(objs) == ["[738785]", "[738786, 738787]"]
+
+
 def test_post_encoder_func():
     encoder = JSONEncoder(
         List[date],
@@ -77,3 +89,101 @@ def test_post_encoder_func():
         )
         == '["2023-09-22","2023-09-23"]'
     )
+
+
+@dataclass
+class Event:
+    day: date
+    tags: List[str]
+
+
+EVENTS = [
+    Event(date(2023, 9, 22), ['a"b', "[,]"]),
+    Event(date(2023, 9, 23), ["{", "\\"]),
+    Event(date(2023, 9, 24), []),
+]
+
+
+def test_iter_decode_ndjson():
+    data = "\n".join(json.dumps(e.__dict__, default=str) for e in EVENTS)
+    decoder = JSONDecoder(Event)
+    assert list(decoder.iter_decode(io.StringIO(data + "\n\n"))) == EVENTS
+    assert list(decoder.iter_decode(io.BytesIO(data.encode()))) == EVENTS
+
+
+def test_iter_decode_array():
+    data = json.dumps([e.__dict__ for e in EVENTS], default=str, indent=2)
+    decoder = JSONDecoder(Event)
+    assert list(decoder.iter_decode(io.StringIO(data))) == EVENTS
+    for size in (1, 2, 3, 5, 8):
+        chunks = [data[i : i + size] for i in range(0, len(data), size)]
+        assert list(decoder.iter_decode(chunks)) == EVENTS
+        encoded = data.encode()
+        chunks = [encoded[i : i + size] for i in range(0, len(data), size)]
+        assert list(decoder.iter_decode(chunks)) == EVENTS
+
+
+def test_iter_decode_array_of_deeply_nested_values():
+    value = [{"a": [[[{"b": ["]"]}]]]}, 1, "x"]
+    data = json.dumps([value, [], 1.5, None])
+    decoder = JSONDecoder(Any)
+    for chunks in ([data], list(data)):
+        assert list(decoder.iter_decode(chunks)) == [value, [], 1.5, None]
+
+
+def test_iter_decode_long_string_split_into_many_chunks():
+    text = 'a\\"b' * 250_000
+    value = [text, {"x": [text]}]
+    data = json.dumps(value)
+    decoder = JSONDecoder(Any)
+    for size in (999, 1000):
+        chunks = [data[i : i + size] for i in range(0, len(data), size)]
+        assert list(decoder.iter_decode(chunks)) == value
+        encoded = data.encode()
+        chunks = [encoded[i : i + size] for i in range(0, len(data), size)]
+        assert list(decoder.iter_decode(chunks)) == value
+    with pytest.raises(ValueError, match="Unexpected end of JSON array"):
+        list(decoder.iter_decode(["[1, ", '"' + text, text]))
+
+
+def test_iter_decode_with_explicit_format():
+    decoder = JSONDecoder(List[int])
+    assert list(decoder.iter_decode(["[1, 2]\n[3]"], lines=True)) == [
+        [1, 2],
+        [3],
+    ]
+    assert list(decoder.iter_decode(["[[1, 2], [3]]"], lines=False)) == [
+        [1, 2],
+        [3],
+    ]
+    with pytest.raises(ValueError):
+        list(decoder.iter_decode(["[[1, 2]]\n[[3]]"], lines=False))
+    with pytest.raises(ValueError):
+        list(decoder.iter_decode(["{}"], lines=False))
+
+
+def test_iter_decode_empty_stream():
+    decoder = JSONDecoder(int)
+    assert list(decoder.iter_decode([])) == []
+    assert list(decoder.iter_decode(["  ", "\n"])) == []
+    assert list(decoder.iter_decode([" [ ", " ] "])) == []
+
+
+@pytest.mark.parametrize(
+    "data", ["[1", "[1}", "[1] 2", "[1,]", "[,1]", '["1]', "1\n2 2"]
+)
+def test_iter_decode_invalid_data(data):
+    with pytest.raises(ValueError):
+        list(JSONDecoder(int).iter_decode([data]))
+
+
+def test_iter_decode_only_some_fields():
+    data = "\n".join(json.dumps(e.__dict__, default=str) for e in EVENTS)
+    decoder = JSONDecoder(Event, only={"day"})
+    days = [event.day for event in decoder.iter_decode(io.StringIO(data))]
+    assert days == [event.day for event in EVENTS]
+
+
+def test_encode_only_some_fields():
+    encoder = JSONEncoder(Event, exclude={"tags"})
+    assert encoder.encode(EVENTS[0]) == '{"day": "2023-09-22"}'
@@ -1,7 +1,14 @@
-from datetime import date
+import io
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from fractions import Fraction
 from typing import List
+from uuid import UUID
 
 import msgpack
+import pytest
 
 from mashumaro.codecs.msgpack import (
     MessagePackDecoder,
@@ -10,6 +17,13 @@ from mashumaro.codecs.msgpack import (
     msgpack_encode,
 )
 from mashumaro.dialect import Dialect
+from mashumaro.exceptions import InvalidFieldValue
+from mashumaro.mixins.msgpack import (
+    DECIMAL_EXT_TYPE,
+    FRACTION_EXT_TYPE,
+    MessagePackExtDialect,
+    ext_decoder,
+)
 
 
 class MyDialect(Dialect):
@@ -95,3 +109,111 @@ def test_post_encoder_func():
         == data
     )
     assert calls == 1
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+def test_encode_batch():
+    encoder = MessagePackEncoder(Point)
+    data = encoder.encode_batch(Point(i, -i) for i in range(3))
+    assert data == b"".join(encoder.encode(Point(i, -i)) for i in range(3))
+    assert encoder.encode_batch([]) == b""
+    encoder = MessagePackEncoder(List[date], default_dialect=MyDialect)
+    assert encoder.encode_batch([[date(2023, 9, 22)]]) == msgpack.packb(
+        [738785]
+    )
+
+
+def test_iter_decode():
+    data = MessagePackEncoder(Point).encode_batch(
+        Point(i, -i) for i in range(3)
+    )
+    decoder = MessagePackDecoder(Point)
+    points = [Point(0, 0), Point(1, -1), Point(2, -2)]
+    assert list(decoder.iter_decode(io.BytesIO(data))) == points
+    chunks = [data[i : i + 3] for i in range(0, len(data), 3)]
+    assert list(decoder.iter_decode(chunks)) == points
+    assert list(decoder.iter_decode([])) == []
+    with pytest.raises(ValueError, match="Unexpected end"):
+        list(decoder.iter_decode([data[:-1]]))
+
+
+def test_encode_in_threads():
+    encoder = MessagePackEncoder(List[int])
+    results = {}
+
+    def encode(n):
+        results[n] = [encoder.encode(list(range(n))) for _ in range(100)]
+
+    threads = [threading.Thread(target=encode, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for n, data in results.items():
+        assert set(data) == {msgpack.packb(list(range(n)))}
+
+
+@dataclass
+class Payment:
+    id: UUID
+    created_at: datetime
+    amount: Decimal
+    share: Fraction
+
+
+PAYMENT = Payment(
+    id=UUID("8d9b2d6c-3f4e-4a53-9bd4-5a1c5a7f0f6e"),
+    created_at=datetime(1969, 12, 31, 23, 59, 59, 123456, timezone.utc),
+    amount=Decimal("1234.50"),
+    share=Fraction(1, 3),
+)
+
+
+def test_ext_dialect():
+    encoder = MessagePackEncoder(
+        Payment, default_dialect=MessagePackExtDialect
+    )
+    data = encoder.encode(PAYMENT)
+    assert msgpack.unpackb(data) == {
+        "id": PAYMENT.id.bytes,
+        "created_at": msgpack.Timestamp(-1, 123456000),
+        "amount": msgpack.ExtType(DECIMAL_EXT_TYPE, b"1234.50"),
+        "share": msgpack.ExtType(FRACTION_EXT_TYPE, b"1/3"),
+    }
+    for pre_decoder_func in (msgpack.unpackb, ext_decoder):
+        decoder = MessagePackDecoder(
+            Payment,
+            default_dialect=MessagePackExtDialect,
+            pre_decoder_func=pre_decoder_func,
+        )
+        assert decoder.decode(data) == PAYMENT
+
+
+def test_ext_dialect_with_naive_datetime_and_strings():
+    encoder = MessagePackEncoder(
+        List[datetime], default_dialect=MessagePackExtDialect
+    )
+    decoder = MessagePackDecoder(
+        Payment, default_dialect=MessagePackExtDialect
+    )
+    assert msgpack.unpackb(
+        encoder.encode([datetime(1970, 1, 1, 0, 0, 1)])
+    ) == [msgpack.Timestamp(1, 0)]
+    data = MessagePackEncoder(Payment).encode(PAYMENT)
+    assert decoder.decode(data) == PAYMENT
+    data = msgpack.packb(
+        {
+            "id": PAYMENT.id.bytes,
+            "created_at": msgpack.Timestamp(0, 0),
+            "amount": msgpack.ExtType(FRACTION_EXT_TYPE, b"1"),
+            "share": "1/3",
+        }
+    )
+    with pytest.raises(InvalidFieldValue) as exc_info:
+        decoder.decode(data)
+    assert exc_info.value.field_name == "amount"
@@ -1,5 +1,8 @@
+import io
+from dataclasses import dataclass
 from datetime import date
-from typing import List
+from enum import Enum
+from typing import List, Optional
 
 from mashumaro.codecs.orjson import (
     ORJSONDecoder,
@@ -10,6 +13,10 @@ from mashumaro.codecs.orjson import (
 from mashumaro.dialect import Dialect
 
 
+class NativeDialect(Dialect):
+    orjson_native = True
+
+
 class MyDialect(Dialect):
     serialization_strategy = {
         date: {
@@ -47,3 +54,69 @@ def test_encoder_with_default_dialect():
         encoder.encode([date(2023, 9, 22), date(2023, 9, 23)])
         == b"[738785,738786]"
     )
+
+
+def test_iter_decode():
+    decoder = ORJSONDecoder(List[date], default_dialect=MyDialect)
+    data = b"[738785]\n[738786, 738787]\n"
+    assert list(decoder.iter_decode(io.BytesIO(data), lines=True)) == [
+        [date(2023, 9, 22)],
+        [date(2023, 9, 23), date(2023, 9, 24)],
+    ]
+    decoder = ORJSONDecoder(date)
+    data = '["2023-09-22", "2023-09-23"]'
+    assert list(decoder.iter_decode(io.StringIO(data))) == [
+        date(2023, 9, 22),
+        date(2023, 9, 23),
+    ]
+
+
+def test_encoder_with_orjson_native():
+    class Color(Enum):
+        RED = "red"
+
+    @dataclass
+    class Point:
+        x: int
+        color: Color
+
+    @dataclass
+    class Private:
+        _x: int
+
+    @dataclass
+    class DataClass:
+        points: List[Point]
+        private: Private
+        point: Optional[Point] = None
+
+    encoder = ORJSONEncoder(DataClass, default_dialect=NativeDialect)
+    obj = DataClass([Point(1, Color.RED)], Private(2))
+    assert encoder.encode(obj) == (
+        b'{"points":[{"x":1,"color":"red"}],"private":{"_x":2},'
+        b'"point":null}'
+    )
+    assert encoder.encode(obj) == ORJSONEncoder(DataClass).encode(obj)
+    encoder = ORJSONEncoder(List[Point], default_dialect=NativeDialect)
+    assert encoder.encode([Point(True, Color.RED)]) == (
+        b'[{"x":true,"color":"red"}]'
+    )
+
+
+def test_encoder_with_orjson_native_and_subclass_instances():
+    @dataclass
+    class Point:
+        __slots__ = ("x",)
+        x: int
+
+    @dataclass
+    class Point3D(Point):
+        __slots__ = ("z",)
+        z: int
+
+    for shape_type, value, expected in (
+        (Point, Point3D(1, 2), b'{"x":1}'),
+        (List[Point], [Point(1), Point3D(1, 2)], b'[{"x":1},{"x":1}]'),
+    ):
+        encoder = ORJSONEncoder(shape_type, default_dialect=NativeDialect)
+        assert encoder.encode(value) == expected
@@ -0,0 +1,135 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from typing import List
+
+import pytest
+
+from mashumaro import DataClassDictMixin, stats
+from mashumaro.config import ADD_DIALECT_SUPPORT, BaseConfig
+from mashumaro.core.meta.code.builder import get_compile_lock
+from mashumaro.dialect import Dialect
+
+THREADS = 8
+
+
+class OrdinalDialect(Dialect):
+    serialization_strategy = {
+        date: {
+            "serialize": date.toordinal,
+            "deserialize": date.fromordinal,
+        }
+    }
+
+
+@pytest.fixture
+def enabled_stats():
+    stats.reset()
+    stats.enable()
+    yield
+    stats.disable()
+    stats.reset()
+
+
+def get_lazy_compilations(cls):
+    return sum(
+        item.lazy_compilations
+        for item in stats.codegen_report()
+        if item.target is cls
+    )
+
+
+def run_concurrently(func):
+    barrier = threading.Barrier(THREADS)
+
+    def target(_):
+        barrier.wait()
+        return func()
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        return list(executor.map(target, range(THREADS)))
+
+
+def test_lazy_methods_are_compiled_once(enabled_stats):
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: List[date]
+
+        class Config(BaseConfig):
+            lazy_compilation = True
+
+    obj = DataClass([date(2023, 1, 1)])
+    data = {"x": ["2023-01-01"]}
+    assert (
+        run_concurrently(lambda: DataClass.from_dict(data)) == [obj] * THREADS
+    )
+    assert run_concurrently(obj.to_dict) == [data] * THREADS
+    assert get_lazy_compilations(DataClass) == 2
+
+
+def test_dialect_methods_are_compiled_once(enabled_stats):
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: date
+
+        class Config(BaseConfig):
+            code_generation_options = [ADD_DIALECT_SUPPORT]
+
+    obj = DataClass(date(2023, 1, 1))
+    data = {"x": date(2023, 1, 1).toordinal()}
+    assert (
+        run_concurrently(
+            lambda: DataClass.from_dict(data, dialect=OrdinalDialect)
+        )
+        == [obj] * THREADS
+    )
+    assert (
+        run_concurrently(lambda: obj.to_dict(dialect=OrdinalDialect))
+        == [data] * THREADS
+    )
+    assert get_lazy_compilations(DataClass) == 2
+
+
+def test_lazy_compilation_with_dialect_support():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: date
+
+        class Config(BaseConfig):
+            lazy_compilation = True
+            code_generation_options = [ADD_DIALECT_SUPPORT]
+
+    obj = DataClass(date(2023, 1, 1))
+    ordinal = date(2023, 1, 1).toordinal()
+    assert obj.to_dict(dialect=OrdinalDialect) == {"x": ordinal}
+    assert obj.to_dict() == {"x": "2023-01-01"}
+    assert DataClass.from_dict({"x": ordinal}, dialect=OrdinalDialect) == obj
+    assert DataClass.from_dict({"x": "2023-01-01"}) == obj
+
+
+def test_lazy_method_inherited_by_non_dataclass():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int
+
+        class Config(BaseConfig):
+            lazy_compilation = True
+
+    class SubClass(DataClass):
+        pass
+
+    assert SubClass.from_dict({"x": 1}) == SubClass(1)
+    assert SubClass(1).to_dict() == {"x": 1}
+
+
+def test_get_compile_lock():
+    class A:
+        pass
+
+    class B:
+        pass
+
+    assert get_compile_lock(A, "x") is get_compile_lock(A, "x")
+    assert get_compile_lock(A, "x") is not get_compile_lock(A, "y")
+    assert get_compile_lock(A, "x") is not get_compile_lock(B, "x")
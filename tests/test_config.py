@@ -1,11 +1,12 @@
-from dataclasses import dataclass, field
-from typing import Optional, Union
+from dataclasses import InitVar, dataclass, field
+from typing import ClassVar, List, Optional, Union
 
 import pytest
 from typing_extensions import Literal
 
 from mashumaro import DataClassDictMixin
 from mashumaro.config import TO_DICT_ADD_OMIT_NONE_FLAG, BaseConfig
+from mashumaro.exceptions import InvalidFieldValue, MissingField
 from mashumaro.types import SerializationStrategy
 
 from .entities import (
@@ -322,3 +323,120 @@ def test_sort_keys_plain_dataclass():
         "{'unsorted_sub': {'foo': 1, 'bar': 2}, "
         "'sorted_sub': {'bar': 2, 'foo': 1}}"
     )
+
+
+def test_trusted_input():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int
+        y: Optional[str]
+        z: int = field(default=0, metadata={"alias": "Z"})
+
+        class Config(BaseConfig):
+            trusted_input = True
+
+    assert DataClass.from_dict({"x": 1, "y": None}) == DataClass(1, None)
+    assert DataClass.from_dict({"x": "1", "y": "a", "Z": 2}) == DataClass(
+        1, "a", 2
+    )
+    # error quality is traded for speed
+    with pytest.raises(KeyError):
+        DataClass.from_dict({"y": None})
+    with pytest.raises(ValueError) as exc_info:
+        DataClass.from_dict({"x": "a", "y": None})
+    assert not isinstance(exc_info.value, InvalidFieldValue)
+    with pytest.raises(TypeError):
+        DataClass.from_dict([])
+
+
+def test_trusted_input_with_deserialization_not_by_alias():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int = field(metadata={"alias": "X"})
+
+        class Config(BaseConfig):
+            trusted_input = True
+            allow_deserialization_not_by_alias = True
+
+    assert DataClass.from_dict({"X": 1}) == DataClass(1)
+    assert DataClass.from_dict({"x": 1}) == DataClass(1)
+    with pytest.raises(MissingField):
+        DataClass.from_dict({})
+
+
+def test_construct_without_init(mocker):
+    @dataclass(frozen=True)
+    class DataClass(DataClassDictMixin):
+        x: int
+        y: List[int] = field(default_factory=list)
+        z: Optional[str] = None
+        c: ClassVar[int] = 0
+
+        class Config(BaseConfig):
+            construct_without_init = True
+
+    assert DataClass.from_dict({"x": 1}) == DataClass(1)
+    mocker.patch.object(DataClass, "__init__", side_effect=AssertionError)
+    obj = DataClass.from_dict({"x": "1", "y": ["2"], "z": None})
+    assert (obj.x, obj.y, obj.z) == (1, [2], None)
+    assert (
+        DataClass.from_dict({"x": 1}).y is not DataClass.from_dict({"x": 1}).y
+    )
+    with pytest.raises(MissingField):
+        DataClass.from_dict({})
+
+
+def test_construct_without_init_falls_back_to_init():
+    calls = []
+
+    @dataclass(frozen=True)
+    class WithPostInit(DataClassDictMixin):
+        x: int
+
+        def __post_init__(self):
+            calls.append(self.x)
+
+        class Config(BaseConfig):
+            construct_without_init = True
+
+    @dataclass(frozen=True)
+    class WithInitVar(DataClassDictMixin):
+        x: int
+        y: InitVar[int] = 0
+
+        class Config(BaseConfig):
+            construct_without_init = True
+
+    @dataclass(frozen=True)
+    class WithCustomInit(DataClassDictMixin):
+        x: int
+
+        def __init__(self, x):
+            calls.append(x)
+            object.__setattr__(self, "x", x)
+
+        class Config(BaseConfig):
+            construct_without_init = True
+
+    assert WithPostInit.from_dict({"x": 1}) == WithPostInit(1)
+    assert WithCustomInit.from_dict({"x": 2}).x == 2
+    assert calls == [1, 1, 2]
+    assert WithInitVar.from_dict({"x": 1}) == WithInitVar(1)
+
+
+def test_construct_without_init_in_subclass():
+    @dataclass(frozen=True)
+    class DataClass(DataClassDictMixin):
+        x: int
+
+        class Config(BaseConfig):
+            construct_without_init = True
+
+    class SubClass(DataClass):
+        def __init__(self, x):
+            super().__init__(x + 1)
+
+    assert DataClass.from_dict({"x": 1}) == DataClass(1)
+    obj = SubClass.from_dict({"x": 1})
+    assert type(obj) is SubClass
+    assert obj.x == 2
@@ -7,6 +7,7 @@ import os
 import uuid
 from dataclasses import InitVar, dataclass, field
 from datetime import date, datetime, time, timedelta, timezone
+from enum import Enum
 from pathlib import (
     Path,
     PosixPath,
@@ -1530,3 +1531,36 @@ def test_encoder(value_info):
     encoder = BasicEncoder(x_type)
     assert encoder.encode(x_value) == x_value_dumped
     assert encode(x_value, x_type) == x_value_dumped
+
+
+class EnumWithMissing(Enum):
+    A = "a"
+    LIST = ("x", "y")
+
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, list):
+            return cls(tuple(value))
+        elif isinstance(value, str):
+            return cls(value.lower())
+
+
+def test_enum_values_not_in_value_to_member_map():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: EnumWithMissing
+        y: MyFlag
+        z: MyIntEnum
+
+    assert DataClass.from_dict({"x": "A", "y": 3, "z": 1.0}) == DataClass(
+        EnumWithMissing.A, MyFlag.a | MyFlag.b, MyIntEnum.a
+    )
+    assert DataClass.from_dict({"x": ["x", "y"], "y": 1, "z": 2}) == DataClass(
+        EnumWithMissing.LIST, MyFlag.a, MyIntEnum.b
+    )
+    with pytest.raises(InvalidFieldValue) as exc_info:
+        DataClass.from_dict({"x": "b", "y": 1, "z": 2})
+    assert exc_info.value.field_name == "x"
+    with pytest.raises(InvalidFieldValue) as exc_info:
+        DataClass.from_dict({"x": "a", "y": 1, "z": [1]})
+    assert exc_info.value.field_name == "z"
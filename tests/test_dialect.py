@@ -19,8 +19,9 @@ from typing_extensions import TypedDict
 
 from mashumaro import DataClassDictMixin, pass_through
 from mashumaro.config import ADD_DIALECT_SUPPORT, BaseConfig
+from mashumaro.core.const import Sentinel
 from mashumaro.dialect import Dialect
-from mashumaro.exceptions import BadDialect
+from mashumaro.exceptions import BadDialect, MissingField
 from mashumaro.mixins.msgpack import DataClassMessagePackMixin
 from mashumaro.mixins.msgpack import default_encoder as msgpack_encoder
 from mashumaro.types import SerializationStrategy
@@ -1202,6 +1203,28 @@ def test_dialect_no_copy():
     assert data["g"] is not obj.g
 
 
+class TrustedDialect(Dialect):
+    trusted_input = True
+
+
+def test_trusted_input_dialect():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int
+        y: List[date]
+
+        class Config(BaseConfig):
+            code_generation_options = [ADD_DIALECT_SUPPORT]
+
+    data = {"x": 1, "y": ["2023-09-22"]}
+    obj = DataClass(1, [date(2023, 9, 22)])
+    assert DataClass.from_dict(data, dialect=TrustedDialect) == obj
+    with pytest.raises(KeyError):
+        DataClass.from_dict({}, dialect=TrustedDialect)
+    with pytest.raises(MissingField):
+        DataClass.from_dict({})
+
+
 def test_dialect_merge():
     class DialectA(Dialect):
         omit_none = True
@@ -1235,6 +1258,8 @@ def test_dialect_merge():
         }
 
     DialectC = DialectA.merge(DialectB)
+    assert DialectC.trusted_input is Sentinel.MISSING
+    assert DialectA.merge(TrustedDialect).trusted_input is True
     assert DialectC.omit_none is False
     assert DialectC.omit_default is False
     assert DialectC.no_copy_collections == [list]
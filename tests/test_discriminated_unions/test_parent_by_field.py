@@ -560,3 +560,80 @@ def test_by_field_with_custom_variant_tagger():
         VariantWitCustomTaggerOwner.from_dict({"x": {"type": "unknown"}})
     with pytest.raises(InvalidFieldValue):
         decode({"x": {"type": "unknown"}}, _VariantWitCustomTaggerOwner)
+
+
+tagged_variants = []
+
+
+def counting_variant_tagger(cls):
+    tagged_variants.append(cls)
+    return cls.__name__.lower()
+
+
+@dataclass
+class CountedBase(DataClassDictMixin):
+    pass
+
+
+@dataclass
+class CountedSub1(CountedBase):
+    pass
+
+
+@dataclass
+class CountedOwner(DataClassDictMixin):
+    x: Annotated[
+        CountedBase,
+        Discriminator(
+            field="type",
+            include_subtypes=True,
+            variant_tagger_fn=counting_variant_tagger,
+        ),
+    ]
+
+
+@dataclass
+class _CountedBase:
+    pass
+
+
+@dataclass
+class _CountedOwner:
+    x: Annotated[
+        _CountedBase,
+        Discriminator(
+            field="type",
+            include_subtypes=True,
+            variant_tagger_fn=counting_variant_tagger,
+        ),
+    ]
+
+
+def test_unknown_tag_does_not_collect_variants_again():
+    tagged_variants.clear()
+    for _ in range(3):
+        with pytest.raises(InvalidFieldValue):
+            CountedOwner.from_dict({"x": {"type": "countedsub2"}})
+    assert tagged_variants == [CountedSub1]
+
+    @dataclass
+    class CountedSub2(CountedBase):
+        pass
+
+    assert CountedOwner.from_dict(
+        {"x": {"type": "countedsub2"}}
+    ) == CountedOwner(CountedSub2())
+    assert tagged_variants == [CountedSub1, CountedSub1, CountedSub2]
+
+
+def test_unknown_tag_with_new_subclass_without_mixin():
+    with pytest.raises(InvalidFieldValue):
+        decode({"x": {"type": "_countedsub"}}, _CountedOwner)
+
+    @dataclass
+    class _CountedSub(_CountedBase):
+        pass
+
+    assert decode({"x": {"type": "_countedsub"}}, _CountedOwner) == (
+        _CountedOwner(_CountedSub())
+    )
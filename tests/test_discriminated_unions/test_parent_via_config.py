@@ -811,3 +811,27 @@ def test_by_subtypes_with_custom_variant_tagger_and_multiple_tags():
         VariantWithMultipleTags.from_dict({"type": "unknown"})
     with pytest.raises(SuitableVariantNotFoundError):
         decode({"type": "unknown"}, _VariantWithMultipleTags)
+
+
+def test_unknown_tag_does_not_collect_subtypes_again():
+    @dataclass
+    class Base(DataClassDictMixin):
+        type: str
+
+        class Config(BaseConfig):
+            discriminator = Discriminator(field="type", include_subtypes=True)
+
+    @dataclass
+    class Sub1(Base):
+        type = "sub1"
+
+    for _ in range(2):
+        with pytest.raises(SuitableVariantNotFoundError):
+            Base.from_dict({"type": "sub2"})
+    assert Base.__dict__["__mashumaro_subtype_variants__"] == {"sub1": Sub1}
+
+    @dataclass
+    class Sub2(Base):
+        type = "sub2"
+
+    assert Base.from_dict({"type": "sub2"}) == Sub2("sub2")
@@ -73,7 +73,13 @@ from mashumaro.jsonschema.models import (
     JSONSchemaStringFormat,
 )
 from mashumaro.jsonschema.schema import UTC_OFFSET_PATTERN, EmptyJSONSchema
-from mashumaro.types import Discriminator, SerializationStrategy
+from mashumaro.types import (
+    Discriminator,
+    Lazy,
+    RawBytes,
+    RawJSON,
+    SerializationStrategy,
+)
 from tests.entities import (
     CustomPath,
     GenericNamedTuple,
@@ -284,6 +290,40 @@ def test_jsonschema_for_datetime_objects(instance_type, string_format):
     )
 
 
+def test_jsonschema_for_datetime_as_timestamp():
+    @dataclass
+    class DataClass:
+        x: datetime.datetime = field(metadata={"serialize": "timestamp"})
+        y: datetime.datetime = field(metadata={"serialize": "timestamp_ms"})
+        z: datetime.datetime
+
+        class Config:
+            serialization_strategy = {
+                datetime.datetime: {"serialize": "timestamp"}
+            }
+
+    schema = build_json_schema(DataClass)
+    assert schema.properties["x"] == JSONSchema(
+        type=JSONSchemaInstanceType.NUMBER,
+        format=JSONSchemaInstanceFormatExtension.TIMESTAMP,
+    )
+    assert schema.properties["y"] == JSONSchema(
+        type=JSONSchemaInstanceType.INTEGER,
+        format=JSONSchemaInstanceFormatExtension.TIMESTAMP_MS,
+    )
+    assert schema.properties["z"] == schema.properties["x"]
+
+
+def test_jsonschema_for_lazy():
+    assert build_json_schema(Lazy[List[int]]) == build_json_schema(List[int])
+    assert build_json_schema(Lazy) == EmptyJSONSchema()
+
+
+def test_jsonschema_for_raw_types():
+    assert build_json_schema(RawJSON) == EmptyJSONSchema()
+    assert build_json_schema(RawBytes) == EmptyJSONSchema()
+
+
 def test_jsonschema_for_timedelta():
     assert build_json_schema(datetime.timedelta) == JSONSchema(
         type=JSONSchemaInstanceType.NUMBER,
@@ -0,0 +1,137 @@
+import copy
+import pickle
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from mashumaro import DataClassDictMixin
+from mashumaro.codecs import BasicDecoder, BasicEncoder
+from mashumaro.codecs.json import JSONDecoder, JSONEncoder
+from mashumaro.config import BaseConfig
+from mashumaro.dialect import Dialect
+from mashumaro.exceptions import MissingField
+from mashumaro.types import Lazy
+
+
+@dataclass
+class Comment:
+    text: str
+    created_at: datetime
+
+
+@dataclass
+class Post(DataClassDictMixin):
+    title: str
+    comments: Lazy[List[Comment]]
+    counters: Optional[Lazy[Dict[str, int]]] = None
+
+
+POST_DATA = {
+    "title": "title",
+    "comments": [{"text": "text", "created_at": "2024-01-01T00:00:00"}],
+    "counters": {"likes": "1"},
+}
+
+
+def test_lazy_field_is_unpacked_on_access():
+    post = Post.from_dict(POST_DATA)
+    assert post.comments._pending is not None
+    assert repr(post.comments) == "Lazy(<not loaded>)"
+    assert post.comments.value == [Comment("text", datetime(2024, 1, 1))]
+    assert post.comments._pending is None
+    assert post.comments.value is post.comments.value
+    assert post.counters is not None
+    assert post.counters.value == {"likes": 1}
+    assert Post.from_dict({**POST_DATA, "counters": None}).counters is None
+
+
+def test_untouched_lazy_field_is_packed_as_is():
+    post = Post.from_dict(POST_DATA)
+    d = post.to_dict()
+    assert d == POST_DATA
+    assert post.comments._pending is not None
+    d["comments"][0]["text"] = "changed"
+    d["counters"].clear()
+    assert POST_DATA["comments"][0]["text"] == "text"
+    assert POST_DATA["counters"] == {"likes": "1"}
+    assert post.comments.value == [Comment("text", datetime(2024, 1, 1))]
+
+
+def test_untouched_lazy_field_with_no_copy_collections():
+    class NoCopyDialect(Dialect):
+        no_copy_collections = (list, dict)
+
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Lazy[List[Dict[str, int]]]
+
+        class Config(BaseConfig):
+            dialect = NoCopyDialect
+
+    data = {"x": [{"a": 1}]}
+    assert DataClass.from_dict(data).to_dict()["x"] is data["x"]
+
+
+def test_loaded_lazy_field_is_packed():
+    post = Post.from_dict(POST_DATA)
+    post.comments.value.append(Comment("new", datetime(2024, 1, 2)))
+    assert post.counters is not None
+    post.counters.value["likes"] += 1
+    assert post.to_dict() == {
+        "title": "title",
+        "comments": [
+            {"text": "text", "created_at": "2024-01-01T00:00:00"},
+            {"text": "new", "created_at": "2024-01-02T00:00:00"},
+        ],
+        "counters": {"likes": 2},
+    }
+
+
+def test_lazy_field_created_with_value():
+    post = Post("title", Lazy([Comment("text", datetime(2024, 1, 1))]))
+    assert repr(post.comments) == (
+        "Lazy([Comment(text='text', "
+        "created_at=datetime.datetime(2024, 1, 1, 0, 0))])"
+    )
+    assert post.to_dict() == {**POST_DATA, "counters": None}
+    assert post == Post.from_dict({**POST_DATA, "counters": None})
+
+
+def test_lazy_field_errors_are_raised_on_access():
+    post = Post.from_dict({"title": "title", "comments": [{}]})
+    with pytest.raises(MissingField):
+        post.comments.value
+
+
+def test_lazy_with_codecs():
+    decoder = JSONDecoder(Post)
+    encoder = JSONEncoder(Post)
+    post = decoder.decode('{"title": "title", "comments": []}')
+    assert encoder.encode(post) == (
+        '{"title": "title", "comments": [], "counters": null}'
+    )
+    assert post.comments.value == []
+    assert BasicDecoder(Lazy[int]).decode("1").value == 1
+    assert BasicEncoder(Lazy).encode(Lazy(1)) == 1
+
+
+def test_untouched_lazy_field_is_pickled_with_value():
+    post = Post.from_dict(POST_DATA)
+    loaded = pickle.loads(pickle.dumps(post))
+    assert loaded == post
+    assert loaded.comments._pending is None
+    assert copy.deepcopy(post) == post
+
+
+def test_lazy_field_hash():
+    @dataclass(frozen=True)
+    class DataClass(DataClassDictMixin):
+        x: Lazy[Tuple[int, ...]]
+
+    obj = DataClass.from_dict({"x": [1, 2]})
+    assert hash(obj) == hash(DataClass(Lazy((1, 2))))
+    assert {obj, DataClass(Lazy((1, 2)))} == {obj}
+    with pytest.raises(TypeError):
+        hash(Lazy([1]))
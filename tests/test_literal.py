@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from enum import Enum
 
 import pytest
 from typing_extensions import Literal
@@ -127,3 +128,90 @@ def test_literal_with_dialect():
     assert instance.to_dict(dialect=MyDialect) == {"x": b"\x00"}
     with pytest.raises(InvalidFieldValue):
         DataClass.from_dict({"x": "AA==\n"}, dialect=MyDialect)
+
+
+class UnhashableEnum(Enum):
+    A = ["a"]
+
+
+class BytesEnum(Enum):
+    B = b"b"
+
+
+def test_literal_with_many_values():
+    codes = tuple(f"C{i}" for i in range(200))
+
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Literal[codes]  # type: ignore
+
+    for code in codes:
+        assert DataClass.from_dict({"x": code}) == DataClass(code)
+        assert DataClass(code).to_dict() == {"x": code}
+    with pytest.raises(InvalidFieldValue):
+        DataClass.from_dict({"x": "C200"})
+    with pytest.raises(InvalidFieldValue):
+        DataClass.from_dict({"x": ["C1"]})
+    with pytest.raises(InvalidFieldValue):
+        DataClass("C200").to_dict()
+    with pytest.raises(InvalidFieldValue):
+        DataClass(["C1"]).to_dict()
+
+
+def test_literal_first_matching_value_wins():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Literal[1, True, "YQ==", b"a", MyEnum.a, "letter a", b"b"]
+
+    assert DataClass.from_dict({"x": True}).x == 1
+    assert DataClass.from_dict({"x": "YQ=="}).x == "YQ=="
+    assert DataClass.from_dict({"x": "Yg=="}).x == b"b"
+    assert DataClass.from_dict({"x": "letter a"}).x is MyEnum.a
+    assert DataClass(True).to_dict() == {"x": True}
+    assert DataClass(b"a").to_dict() == {"x": "YQ==\n"}
+    assert DataClass(MyEnum.a).to_dict() == {"x": "letter a"}
+    assert DataClass("letter a").to_dict() == {"x": "letter a"}
+
+
+def test_literal_with_bytes_only():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Literal[b"a", b"b"]
+
+    assert DataClass.from_dict({"x": "Yg=="}) == DataClass(b"b")
+    with pytest.raises(InvalidFieldValue):
+        DataClass.from_dict({"x": "Yw=="})
+    with pytest.raises(InvalidFieldValue):
+        DataClass.from_dict({"x": 1})
+
+
+def test_literal_with_unhashable_enum_value():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Literal[UnhashableEnum.A]
+
+    assert DataClass.from_dict({"x": ["a"]}) == DataClass(UnhashableEnum.A)
+    assert DataClass(UnhashableEnum.A).to_dict() == {"x": ["a"]}
+    with pytest.raises(InvalidFieldValue):
+        DataClass.from_dict({"x": ["b"]})
+
+
+def test_literal_with_unhashable_value_equal_to_literal_value():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Literal[b"b"]
+        y: Literal[BytesEnum.B]
+        z: Literal[BytesEnum.B, b"c"]
+
+    assert DataClass(bytearray(b"b"), BytesEnum.B, b"c").to_dict() == {
+        "x": "Yg==\n",
+        "y": b"b",
+        "z": "Yw==\n",
+    }
+    assert DataClass.from_dict(
+        {"x": "Yg==", "y": bytearray(b"b"), "z": bytearray(b"b")}
+    ) == DataClass(b"b", BytesEnum.B, BytesEnum.B)
+    with pytest.raises(InvalidFieldValue):
+        DataClass(bytearray(b"c"), BytesEnum.B, b"c").to_dict()
+    with pytest.raises(InvalidFieldValue):
+        DataClass.from_dict({"x": "Yg==", "y": bytearray(b"c"), "z": b"b"})
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from datetime import date, datetime, time, timezone
+from datetime import date, datetime, time, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
@@ -7,7 +7,9 @@ import ciso8601
 import pytest
 
 from mashumaro import DataClassDictMixin
+from mashumaro.config import ADD_DIALECT_SUPPORT, BaseConfig
 from mashumaro.core.const import PY_312_MIN
+from mashumaro.dialect import Dialect
 from mashumaro.exceptions import (
     UnserializableField,
     UnsupportedDeserializationEngine,
@@ -96,6 +98,84 @@ def test_unsupported_datetime_parser_engine():
             x: datetime = field(metadata={"deserialize": "unsupported"})
 
 
+def test_timestamp_datetime_engine():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: datetime = field(
+            metadata={"serialize": "timestamp", "deserialize": "timestamp"}
+        )
+        y: datetime = field(
+            metadata={
+                "serialize": "timestamp_ms",
+                "deserialize": "timestamp_ms",
+            }
+        )
+
+    dt = datetime(2021, 1, 2, 3, 4, 5, 678999, tzinfo=timezone.utc)
+    instance = DataClass(dt, dt)
+    data = {"x": 1609556645.678999, "y": 1609556645678}
+    assert instance.to_dict() == data
+    assert DataClass.from_dict(data) == DataClass(
+        dt, dt.replace(microsecond=678000)
+    )
+    assert DataClass.from_dict({"x": 0, "y": -1}) == DataClass(
+        datetime(1970, 1, 1, tzinfo=timezone.utc),
+        datetime(1969, 12, 31, 23, 59, 59, 999000, tzinfo=timezone.utc),
+    )
+    # milliseconds are decoded without float rounding
+    big = datetime(9999, 12, 31, 23, 59, 59, 999000, tzinfo=timezone.utc)
+    assert DataClass.from_dict({"x": 0, "y": 253402300799999}).y == big
+    assert DataClass(dt, big).to_dict()["y"] == 253402300799999
+
+
+def test_timestamp_datetime_engine_with_time_zones():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: datetime = field(metadata={"serialize": "timestamp_ms"})
+
+    tz = timezone(timedelta(hours=3))
+    dt = datetime(2021, 1, 2, 3, 4, 5, 678999, tzinfo=tz)
+    assert DataClass(dt).to_dict() == {"x": 1609545845678}
+    naive = datetime(2021, 1, 2, 3, 4, 5)
+    assert DataClass(naive).to_dict() == {"x": int(naive.timestamp()) * 1000}
+
+
+def test_timestamp_datetime_engine_in_dialect():
+    class TimestampDialect(Dialect):
+        serialization_strategy = {
+            datetime: {"serialize": "timestamp", "deserialize": "timestamp"}
+        }
+
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: datetime
+
+        class Config(BaseConfig):
+            code_generation_options = [ADD_DIALECT_SUPPORT]
+
+    dt = datetime(2021, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert DataClass(dt).to_dict(dialect=TimestampDialect) == {
+        "x": 1609556645.0
+    }
+    data = {"x": 1609556645}
+    assert DataClass.from_dict(data, dialect=TimestampDialect) == DataClass(dt)
+
+
+def test_timestamp_engine_for_date_and_time():
+    for engine in ("serialize", "deserialize"):
+        for typ in (date, time):
+            with pytest.raises(
+                (
+                    UnsupportedSerializationEngine,
+                    UnsupportedDeserializationEngine,
+                )
+            ):
+
+                @dataclass
+                class DataClass(DataClassDictMixin):
+                    x: typ = field(metadata={engine: "timestamp"})
+
+
 def test_global_function_datetime_parser():
     @dataclass
     class DataClass(DataClassDictMixin):
@@ -1,3 +1,5 @@
+import gc
+import tracemalloc
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List
@@ -7,7 +9,11 @@ import msgpack
 from mashumaro import DataClassDictMixin
 from mashumaro.config import ADD_DIALECT_SUPPORT, BaseConfig
 from mashumaro.dialect import Dialect
-from mashumaro.mixins.msgpack import DataClassMessagePackMixin
+from mashumaro.mixins.msgpack import (
+    PACKER_BUFFER_LIMIT,
+    DataClassMessagePackMixin,
+    default_encoder,
+)
 
 
 class MyDialect(Dialect):
@@ -164,3 +170,18 @@ def test_msgpack_with_custom_encoder_and_decoder():
     dumped = msgpack.packb({"x": b"ABC", "inner": {"x": b"DEF"}})
     assert instance.to_msgpack(encoder=encoder) == dumped
     assert DataClass.from_msgpack(dumped, decoder=decoder) == instance
+
+
+def test_default_encoder_does_not_retain_big_buffer():
+    data = b"x" * (PACKER_BUFFER_LIMIT * 10)
+    tracemalloc.start()
+    try:
+        result = default_encoder(data)
+        assert msgpack.unpackb(result) == data
+        del result
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert current < PACKER_BUFFER_LIMIT
+    assert default_encoder(b"abc") == msgpack.packb(b"abc")
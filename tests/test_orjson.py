@@ -1,6 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime, time
-from typing import Dict, List
+from decimal import Decimal
+from enum import Enum
+from functools import cached_property
+from typing import Dict, List, Optional, Union
 from uuid import UUID, uuid4
 
 import orjson
@@ -255,3 +258,144 @@ def test_to_orjson_with_non_str_keys():
         instance.to_jsonb()
     assert instance.to_jsonb(orjson_options=orjson.OPT_NON_STR_KEYS) == dumped
     assert DataClass.from_json(dumped) == instance
+
+
+def test_to_orjson_native():
+    class Color(Enum):
+        RED = "red"
+
+    @dataclass
+    class Point:
+        x: int
+        color: Color
+
+        class Config(BaseConfig):
+            orjson_native = True
+
+    @dataclass
+    class Aliased:
+        x: int = field(metadata={"alias": "X"})
+
+        class Config(BaseConfig):
+            orjson_native = True
+            serialize_by_alias = True
+
+    @dataclass
+    class DataClass(DataClassORJSONMixin):
+        points: List[Point]
+        aliased: Aliased
+        point: Optional[Point] = None
+
+        class Config(BaseConfig):
+            orjson_native = True
+
+    instance = DataClass([Point(1, Color.RED)], Aliased(2))
+    assert instance.to_jsonb() == orjson.dumps(
+        {
+            "points": [{"x": 1, "color": "red"}],
+            "aliased": {"X": 2},
+            "point": None,
+        }
+    )
+    assert instance.to_dict() == {
+        "points": [{"x": 1, "color": "red"}],
+        "aliased": {"X": 2},
+        "point": None,
+    }
+    # the values are given to orjson as they are
+    instance = DataClass([Point(True, Color.RED)], Aliased(True))
+    assert instance.to_jsonb() == orjson.dumps(
+        {
+            "points": [{"x": True, "color": "red"}],
+            "aliased": {"X": True},
+            "point": None,
+        }
+    )
+
+
+def test_to_orjson_native_with_union():
+    class Color(Enum):
+        RED = "red"
+
+    @dataclass
+    class Item:
+        long_name: int = field(metadata={"alias": "n"})
+
+        class Config(BaseConfig):
+            serialize_by_alias = True
+
+    @dataclass
+    class DataClass(DataClassORJSONMixin):
+        x: Union[int, Item]
+        y: Union[float, Decimal]
+        z: Union[Color, Item]
+
+        class Config(BaseConfig):
+            orjson_native = True
+
+    # the following union arms are tried if the value isn't of the arm type
+    instance = DataClass(Item(1), Decimal("1.5"), Item(2))
+    assert instance.to_jsonb() == b'{"x":{"n":1},"y":1.5,"z":{"n":2}}'
+    instance = DataClass(1, 1.5, Color.RED)
+    assert instance.to_jsonb() == b'{"x":1,"y":1.5,"z":"red"}'
+
+
+def test_to_orjson_native_skips_instances_with_dict():
+    @dataclass
+    class Point:
+        x: int
+        y: int
+
+        def __post_init__(self):
+            self.norm = 3
+
+        @cached_property
+        def area(self):
+            return 2
+
+        class Config(BaseConfig):
+            orjson_native = True
+
+    @dataclass
+    class DataClass(DataClassORJSONMixin):
+        points: List[Point]
+
+        class Config(BaseConfig):
+            orjson_native = True
+
+    point = Point(1, 2)
+    assert point.area == 2
+    assert DataClass([point]).to_jsonb() == b'{"points":[{"x":1,"y":2}]}'
+
+
+@dataclass
+class SlottedPoint:
+    __slots__ = ("x", "y")
+    x: int
+    y: int
+
+    class Config(BaseConfig):
+        orjson_native = True
+
+
+@dataclass
+class SlottedPoint3D(SlottedPoint):
+    __slots__ = ("z",)
+    z: int
+
+
+def test_to_orjson_native_with_slotted_dataclass():
+    @dataclass
+    class DataClass(DataClassORJSONMixin):
+        points: List[SlottedPoint]
+
+        class Config(BaseConfig):
+            orjson_native = True
+
+    method = next(
+        v for k, v in vars(DataClass).items() if k.endswith("to_jsonb__")
+    )
+    assert SlottedPoint in method.__globals__.values()
+    # instances of subclasses are packed as the declared class
+    instance = DataClass([SlottedPoint(1, 2), SlottedPoint3D(3, 4, 5)])
+    assert instance.to_jsonb() == b'{"points":[{"x":1,"y":2},{"x":3,"y":4}]}'
@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from typing import List
+
+import msgpack
+import orjson
+import pytest
+
+from mashumaro import DataClassDictMixin
+from mashumaro.codecs import BasicDecoder, BasicEncoder
+from mashumaro.codecs.msgpack import MessagePackDecoder, MessagePackEncoder
+from mashumaro.codecs.orjson import ORJSONDecoder, ORJSONEncoder
+from mashumaro.mixins.json import DataClassJSONMixin
+from mashumaro.mixins.msgpack import DataClassMessagePackMixin
+from mashumaro.mixins.orjson import DataClassORJSONMixin
+from mashumaro.types import RawBytes, RawJSON
+
+BLOB = {"x": [1, 2], "y": {"z": None}}
+
+
+@dataclass
+class JSONEnvelope(DataClassORJSONMixin):
+    id: int
+    blob: RawJSON
+
+
+@dataclass
+class MessagePackEnvelope(DataClassMessagePackMixin):
+    id: int
+    blob: RawBytes
+
+
+def test_raw_json_keeps_encoded_data():
+    data = orjson.dumps({"id": 1, "blob": BLOB})
+    obj = JSONEnvelope.from_json(data)
+    assert obj == JSONEnvelope(1, RawJSON(orjson.dumps(BLOB)))
+    assert repr(obj.blob) == f"RawJSON({orjson.dumps(BLOB)!r})"
+    assert obj.to_jsonb() == data
+    assert obj.to_dict() == {"id": 1, "blob": BLOB}
+    # compact data is emitted the same with and without orjson.Fragment
+    assert JSONEnvelope(1, RawJSON('{"x":[1,2]}')).to_jsonb() == (
+        b'{"id":1,"blob":{"x":[1,2]}}'
+    )
+
+
+def test_raw_json_data_is_bytes():
+    assert RawJSON('{"x": "\u00e9"}').data == '{"x": "\u00e9"}'.encode()
+    assert RawJSON('{"x": 1}') == RawJSON(b'{"x": 1}')
+
+
+def test_raw_types_are_hashable():
+    @dataclass(frozen=True)
+    class DataClass:
+        x: RawJSON
+        y: RawBytes
+
+    assert hash(RawJSON('{"x": 1}')) == hash(RawJSON(b'{"x": 1}'))
+    assert hash(RawBytes(b"\x01")) == hash(RawBytes(b"\x01"))
+    obj = DataClass(RawJSON("[1]"), RawBytes(b"\x91\x01"))
+    assert hash(obj) == hash(DataClass(RawJSON(b"[1]"), RawBytes(b"\x91\x01")))
+    assert {obj, DataClass(RawJSON("[1]"), RawBytes(b"\x91\x01"))} == {obj}
+
+
+@pytest.mark.skipif(
+    not hasattr(orjson, "Fragment"), reason="requires orjson.Fragment"
+)
+def test_raw_json_is_embedded_as_is_with_fragment():
+    blob = b'{"x" : [1,  2],\n "y":1.50}'
+    obj = JSONEnvelope(1, RawJSON(blob))
+    assert obj.to_jsonb() == b'{"id":1,"blob":' + blob + b"}"
+    encoder = ORJSONEncoder(JSONEnvelope)
+    assert encoder.encode(obj) == b'{"id":1,"blob":' + blob + b"}"
+
+
+def test_raw_json_with_codecs():
+    data = orjson.dumps([{"id": 1, "blob": BLOB}])
+    decoder = ORJSONDecoder(List[JSONEnvelope])
+    encoder = ORJSONEncoder(List[JSONEnvelope])
+    assert encoder.encode(decoder.decode(data)) == data
+    obj = BasicDecoder(JSONEnvelope).decode({"id": 1, "blob": BLOB})
+    assert obj.blob == RawJSON('{"x": [1, 2], "y": {"z": null}}')
+    assert BasicEncoder(JSONEnvelope).encode(obj) == {"id": 1, "blob": BLOB}
+
+
+def test_raw_json_with_json_mixin():
+    @dataclass
+    class DataClass(DataClassJSONMixin):
+        blob: RawJSON
+
+    obj = DataClass.from_json('{"blob": {"x": [1, 2]}}')
+    assert obj == DataClass(RawJSON('{"x": [1, 2]}'))
+    assert obj.to_json() == '{"blob": {"x": [1, 2]}}'
+
+
+def test_raw_bytes_keeps_packed_data():
+    data = msgpack.packb({"id": 1, "blob": BLOB})
+    obj = MessagePackEnvelope.from_msgpack(data)
+    assert obj == MessagePackEnvelope(1, RawBytes(msgpack.packb(BLOB)))
+    assert repr(obj.blob) == f"RawBytes({msgpack.packb(BLOB)!r})"
+    assert obj.to_msgpack() == data
+    assert obj.to_dict() == {"id": 1, "blob": msgpack.packb(BLOB)}
+
+
+def test_raw_bytes_with_codecs():
+    data = msgpack.packb([{"id": 1, "blob": BLOB}])
+    decoder = MessagePackDecoder(List[MessagePackEnvelope])
+    encoder = MessagePackEncoder(List[MessagePackEnvelope])
+    assert encoder.encode(decoder.decode(data)) == data
+
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        blob: RawBytes
+
+    assert DataClass.from_dict({"blob": b"\x90"}) == DataClass(
+        RawBytes(b"\x90")
+    )
+    assert DataClass(RawBytes(b"\x90")).to_dict() == {"blob": b"\x90"}
@@ -3,6 +3,8 @@ from dataclasses import dataclass, field
 import pytest
 
 from mashumaro import DataClassDictMixin, field_options
+from mashumaro.codecs import BasicDecoder
+from mashumaro.config import BaseConfig
 from mashumaro.core.const import PY_310_MIN
 
 if not PY_310_MIN:
@@ -59,3 +61,34 @@ def test_no_field_options_in_inherited_dataclass_with_slots_and_default():
     instance = DataClass(y=456)
     assert DataClass.from_dict({"y": 456}) == instance
     assert instance.to_dict() == {"x": 123, "y": 456}
+
+
+def test_construct_dataclass_with_slots_without_init(mocker):
+    @dataclass(slots=True)
+    class DataClass(DataClassDictMixin):
+        x: int
+        y: str = "y"
+
+        class Config(BaseConfig):
+            construct_without_init = True
+
+    assert DataClass.from_dict({"x": 1}) == DataClass(1)
+    mocker.patch.object(DataClass, "__init__", side_effect=AssertionError)
+    assert DataClass.from_dict({"x": "1"}).y == "y"
+    assert DataClass.from_dict({"x": 1, "y": "z"}).y == "z"
+
+
+def test_construct_frozen_dataclass_with_slots_without_init(mocker):
+    @dataclass(slots=True, frozen=True)
+    class DataClass:
+        x: int
+        y: str = "y"
+
+        class Config(BaseConfig):
+            construct_without_init = True
+
+    decoder = BasicDecoder(DataClass)
+    assert decoder.decode({"x": 1}) == DataClass(1)
+    mocker.patch.object(DataClass, "__init__", side_effect=AssertionError)
+    obj = decoder.decode({"x": "1", "y": "z"})
+    assert (obj.x, obj.y) == (1, "z")
@@ -0,0 +1,147 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Optional, Union
+
+import pytest
+
+from mashumaro import DataClassDictMixin, stats
+from mashumaro.codecs import BasicDecoder
+from mashumaro.config import ADD_DIALECT_SUPPORT, BaseConfig
+from mashumaro.dialect import Dialect
+from mashumaro.mixins.orjson import DataClassORJSONMixin
+from mashumaro.stats import CodegenStatsCollector
+
+
+class OrdinalDialect(Dialect):
+    serialization_strategy = {
+        date: {
+            "serialize": date.toordinal,
+            "deserialize": date.fromordinal,
+        }
+    }
+
+
+@pytest.fixture
+def enabled_stats():
+    stats.reset()
+    stats.enable()
+    yield
+    stats.disable()
+    stats.reset()
+
+
+def get_stats(target, format_name="dict"):
+    for item in stats.codegen_report():
+        if item.target is target and item.format_name == format_name:
+            return item
+    raise LookupError(target)
+
+
+def test_stats_are_disabled_by_default():
+    stats.reset()
+
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int
+
+    assert not stats.is_enabled()
+    assert stats.codegen_report() == []
+
+
+def test_codegen_report(enabled_stats):
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Union[int, str]
+        y: Optional[List[int]] = None
+
+    item = get_stats(DataClass)
+    assert item.methods == 2
+    assert item.helpers == 2  # pack_union and unpack_union
+    assert item.lazy_compilations == 0
+    assert item.resolve_time > 0
+    assert item.generate_time > 0
+    assert item.compile_time > 0
+    assert item.total_time == pytest.approx(
+        item.resolve_time + item.generate_time + item.compile_time
+    )
+
+
+def test_codegen_report_formats(enabled_stats):
+    @dataclass
+    class DataClass(DataClassORJSONMixin):
+        x: int
+
+    assert get_stats(DataClass, "dict").methods == 2
+    assert get_stats(DataClass, "json").methods == 1
+    assert get_stats(DataClass, "jsonb").methods == 1
+
+
+def test_codegen_report_is_sorted(enabled_stats):
+    report = stats.codegen_report()
+    assert [s.total_time for s in report] == sorted(
+        (s.total_time for s in report), reverse=True
+    )
+
+
+def test_lazy_compilations(enabled_stats):
+    @dataclass
+    class LazyDataClass(DataClassDictMixin):
+        x: date
+
+        class Config(BaseConfig):
+            lazy_compilation = True
+
+    @dataclass
+    class DataClassWithDialectSupport(DataClassDictMixin):
+        x: date
+
+        class Config(BaseConfig):
+            code_generation_options = [ADD_DIALECT_SUPPORT]
+
+    assert get_stats(LazyDataClass).lazy_compilations == 0
+    LazyDataClass.from_dict({"x": "2023-01-01"})
+    item = get_stats(LazyDataClass)
+    assert item.lazy_compilations == 1
+    assert item.methods == 3
+
+    assert get_stats(DataClassWithDialectSupport).lazy_compilations == 0
+    DataClassWithDialectSupport(date(2023, 1, 1)).to_dict(
+        dialect=OrdinalDialect
+    )
+    item = get_stats(DataClassWithDialectSupport)
+    assert item.lazy_compilations == 1
+    assert item.methods == 3
+
+
+def test_codec_stats(enabled_stats):
+    BasicDecoder(List[Union[int, str]])
+    item = get_stats(List[Union[int, str]])
+    assert item.methods == 1
+    assert item.helpers == 1
+
+
+def test_unhashable_target():
+    collector = CodegenStatsCollector(enabled=True)
+    collector.count([1], "dict", "methods")
+    with collector.measure([1], "dict", "compile"):
+        pass
+    (item,) = collector.report()
+    assert item.target == "[1]"
+    assert item.methods == 1
+
+
+def test_nested_phases_are_not_counted_twice():
+    collector = CodegenStatsCollector(enabled=True)
+    with collector.measure(int, "dict", "generate"):
+        with collector.measure(int, "dict", "compile"):
+            with collector.measure(str, "dict", "generate"):
+                pass
+    int_stats, str_stats = sorted(
+        collector.report(), key=lambda s: s.target is str
+    )
+    assert int_stats.target is int
+    assert str_stats.target is str
+    assert int_stats.generate_time >= 0
+    assert int_stats.compile_time >= 0
+    collector.reset()
+    assert collector.report() == []
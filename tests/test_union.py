@@ -1,9 +1,18 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Union
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, List, Literal, Tuple, Union
 
 import pytest
+from typing_extensions import Annotated
 
 from mashumaro import DataClassDictMixin
+from mashumaro.codecs import BasicDecoder, BasicEncoder
+from mashumaro.config import BaseConfig
+from mashumaro.core.meta.helpers import get_args
+from mashumaro.exceptions import InvalidFieldValue
+
+from .entities import MyEnum
 
 
 @dataclass
@@ -32,3 +41,322 @@ def test_union(test_case):
     instance = DataClass(x=test_case.loaded)
     assert DataClass.from_dict({"x": test_case.dumped}) == instance
     assert instance.to_dict() == {"x": test_case.dumped}
+
+
+def test_union_helpers_are_shared_between_fields():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        a: Union[int, str]
+        b: Union[int, str]
+        c: Literal["x", 1]
+        d: Literal["x", 1]
+
+    helper_names = [
+        name
+        for name in vars(DataClass)
+        if name.startswith(("__pack_", "__unpack_"))
+    ]
+    assert len(helper_names) == 4
+    obj = DataClass(1, "b", "x", 1)
+    assert DataClass.from_dict(obj.to_dict()) == obj
+
+
+def test_shared_union_helper_reports_own_field_name():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        a: Union[date, datetime]
+        b: Union[date, datetime]
+
+    with pytest.raises(InvalidFieldValue) as exc_info:
+        DataClass(date(2023, 1, 1), "2023-01-01").to_dict()  # type: ignore
+    assert exc_info.value.field_name == "b"
+    with pytest.raises(InvalidFieldValue) as exc_info:
+        DataClass.from_dict({"a": "2023-01-01", "b": "x"})
+    assert exc_info.value.field_name == "b"
+    assert exc_info.value.__context__.field_name == "b"
+
+
+@dataclass
+class UnionArm(DataClassDictMixin):
+    x: int
+
+
+@dataclass
+class UnionArmWithHook(DataClassDictMixin):
+    x: int
+
+    @classmethod
+    def __pre_deserialize__(cls, d):
+        return {"x": d} if isinstance(d, int) else d
+
+
+@pytest.mark.parametrize(
+    "union_type",
+    [
+        Union[int, str, float, None],
+        Union[float, int, List[int]],
+        Union[List[int], Dict[str, int], UnionArm, datetime, str],
+        Union[Dict[str, int], List[str], int],
+        Union[UnionArm, List[int], None],
+        Union[UnionArmWithHook, str],
+        Union[Tuple[int, ...], date, bool],
+    ],
+)
+@pytest.mark.parametrize(
+    "value",
+    [None, True, 0, 1.5, "1", "a", "2023-01-01", [], ["1"], [1, "a"]]
+    + [{}, {"x": 1}, {"1": 2}, 1j],
+)
+def test_union_dispatch_keeps_arms_order(union_type, value):
+    def reference():
+        for arm in get_args(union_type):
+            try:
+                return BasicDecoder(arm).decode(value)
+            except Exception:
+                pass
+        raise ValueError(value)
+
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: union_type
+
+    try:
+        expected = reference()
+    except ValueError:
+        with pytest.raises(InvalidFieldValue):
+            DataClass.from_dict({"x": value})
+    else:
+        assert DataClass.from_dict({"x": value}).x == expected
+
+
+class SingleMemberEnum(Enum):
+    B = "b"
+
+
+@dataclass
+class TaggedA(DataClassDictMixin):
+    kind: Literal["a"]
+    x: int
+
+
+@dataclass
+class TaggedB(DataClassDictMixin):
+    kind: SingleMemberEnum
+    x: int = 0
+
+
+@dataclass
+class TaggedC(DataClassDictMixin):
+    kind: Literal["c", "cc"]
+    y: str
+
+
+@dataclass
+class TaggedD:
+    kind: Literal["d"]
+    y: str
+    x: int = 0
+
+
+@dataclass
+class UntaggedE(DataClassDictMixin):
+    y: str
+
+
+@pytest.mark.parametrize(
+    "union_type",
+    [
+        Union[TaggedA, TaggedB, TaggedC],
+        Union[TaggedC, TaggedB, TaggedA, None],
+        Union[TaggedA, TaggedD, Dict[str, int]],
+        Union[TaggedA, UntaggedE, TaggedC],
+        Union[UntaggedE, TaggedA, TaggedB],
+        Union[UnionArm, UntaggedE],
+    ],
+)
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"kind": "a", "x": 1},
+        {"kind": "b"},
+        {"kind": "b", "x": "1"},
+        {"kind": "c", "y": "y"},
+        {"kind": "cc", "y": "y", "x": 1},
+        {"kind": "d", "y": "y"},
+        {"kind": "a", "y": "y"},
+        {"kind": "z", "x": 1, "y": "y"},
+        {"kind": ["a"], "x": 1},
+        {"kind": "b", "x": "x"},
+        {"x": 1},
+        {"y": "y"},
+        {},
+        "b",
+    ],
+)
+def test_union_of_dataclasses_dispatch_keeps_arms_order(union_type, value):
+    def reference():
+        for arm in get_args(union_type):
+            try:
+                return BasicDecoder(arm).decode(value)
+            except Exception:
+                pass
+        raise ValueError(value)
+
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: union_type
+
+    try:
+        expected = reference()
+    except ValueError:
+        with pytest.raises(InvalidFieldValue):
+            DataClass.from_dict({"x": value})
+        with pytest.raises(ValueError):
+            BasicDecoder(union_type).decode(value)
+    else:
+        assert DataClass.from_dict({"x": value}).x == expected
+        assert BasicDecoder(union_type).decode(value) == expected
+
+
+def test_union_of_dataclasses_discriminator_inference():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Union[TaggedA, TaggedB, TaggedC, None]
+        y: Union[TaggedA, UntaggedE]
+
+    assert [a for a in vars(DataClass) if "_x_tags_" in a]
+    assert not [a for a in vars(DataClass) if "_y_tags_" in a]
+    assert DataClass.from_dict(
+        {"x": {"kind": "cc", "y": "y"}, "y": {"y": "y"}}
+    ) == DataClass(TaggedC("cc", "y"), UntaggedE("y"))
+
+
+class MyDate(date):
+    pass
+
+
+class MyList(list):
+    pass
+
+
+@dataclass
+class UnionArmSubclass(UnionArm):
+    pass
+
+
+@pytest.mark.parametrize(
+    "union_type",
+    [
+        Union[float, int, str],
+        Union[int, datetime, List[int], str],
+        Union[UnionArm, List[int], Dict[str, int], None],
+        Union[date, int, Tuple[int, ...]],
+        Union[Dict[str, int], List[str], int],
+        Union[MyEnum, int, float],
+    ],
+)
+@pytest.mark.parametrize(
+    "value",
+    [None, True, 0, 1.5, "1", "a", b"1", [], ["1"], [1, "a"], (1,), {1}]
+    + [{}, {"x": 1}, {"1": 2}, 1j, MyEnum.a, MyList([1])]
+    + [date(2023, 1, 1), MyDate(2023, 1, 1), datetime(2023, 1, 1)]
+    + [UnionArm(1), UnionArmSubclass(1)],
+)
+def test_union_pack_dispatch_keeps_arms_order(union_type, value):
+    def reference():
+        for arm in get_args(union_type):
+            try:
+                return BasicEncoder(arm).encode(value)
+            except Exception:
+                pass
+        raise ValueError(value)
+
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: union_type
+
+    try:
+        expected = reference()
+    except ValueError:
+        with pytest.raises(InvalidFieldValue):
+            DataClass(value).to_dict()
+        with pytest.raises(ValueError):
+            BasicEncoder(union_type).encode(value)
+    else:
+        assert DataClass(value).to_dict() == {"x": expected}
+        assert BasicEncoder(union_type).encode(value) == expected
+
+
+def test_union_pack_dispatch_table_caches_subclasses():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Union[int, UnionArm, List[int]]
+
+    table = next(
+        v
+        for k, v in DataClass.__mashumaro_to_dict__.__globals__.items()
+        if k.endswith("_dispatch")
+    )
+    assert UnionArmSubclass not in table
+    assert DataClass(UnionArmSubclass(1)).to_dict() == {"x": {"x": 1}}
+    assert table[UnionArmSubclass] == table[UnionArm]
+    assert DataClass(MyList([1])).to_dict() == {"x": [1]}
+    assert MyList in table
+
+
+def test_union_dispatch_respects_overridden_arms():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Union[int, List[int], str]
+        y: Union[Annotated[datetime, "meta"], int] = 0
+
+        class Config(BaseConfig):
+            serialization_strategy = {
+                int: {"deserialize": lambda v: int(v, 16)},
+                List[int]: {"deserialize": lambda v: [len(v)]},
+            }
+
+    assert DataClass.from_dict({"x": "ff"}) == DataClass(255)
+    assert DataClass.from_dict({"x": "zz"}) == DataClass([2])
+    assert DataClass.from_dict({"x": "zz", "y": "2023-01-01"}) == DataClass(
+        [2], datetime(2023, 1, 1)
+    )
+
+
+@dataclass
+class MixinArmA(DataClassDictMixin):
+    a: int
+
+
+@dataclass
+class MixinArmB(DataClassDictMixin):
+    b: str
+
+
+def test_union_pack_dispatch_with_mixin_arms():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Union[MixinArmA, MixinArmB, int, List[int]]
+
+    table = next(
+        v
+        for k, v in DataClass.__mashumaro_to_dict__.__globals__.items()
+        if k.endswith("_dispatch")
+    )
+    assert table.branches[table[int]] == (2,)
+    assert table.branches[table[list]] == (3,)
+    assert DataClass(MixinArmB("b")).to_dict() == {"x": {"b": "b"}}
+    assert DataClass(1).to_dict() == {"x": 1}
+    assert DataClass([1]).to_dict() == {"x": [1]}
+
+
+def test_union_pack_dispatch_respects_overridden_arms():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Union[List[int], int]
+
+        class Config(BaseConfig):
+            serialization_strategy = {List[int]: {"serialize": repr}}
+
+    assert DataClass(5).to_dict() == {"x": "5"}
+    assert DataClass([5]).to_dict() == {"x": "[5]"}
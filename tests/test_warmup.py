@@ -0,0 +1,177 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import List
+
+import pytest
+
+from mashumaro import DataClassDictMixin, warmup
+from mashumaro.config import ADD_DIALECT_SUPPORT, BaseConfig
+from mashumaro.core.meta.code.builder import LAZY_METHODS_ATTR
+from mashumaro.dialect import Dialect
+from mashumaro.exceptions import UnresolvedTypeReferenceError
+from mashumaro.mixins.orjson import DataClassORJSONMixin
+
+
+class OrdinalDialect(Dialect):
+    serialization_strategy = {
+        date: {
+            "serialize": date.toordinal,
+            "deserialize": date.fromordinal,
+        }
+    }
+
+
+@dataclass
+class LazyDataClass(DataClassDictMixin):
+    x: int
+
+    class Config(BaseConfig):
+        lazy_compilation = True
+
+
+@dataclass
+class LazyORJSONDataClass(DataClassORJSONMixin):
+    x: List[int]
+
+    class Config(BaseConfig):
+        lazy_compilation = True
+
+
+@dataclass
+class DataClassWithDialectSupport(DataClassDictMixin):
+    x: date
+
+    class Config(BaseConfig):
+        code_generation_options = [ADD_DIALECT_SUPPORT]
+
+
+def test_warmup_lazy_methods():
+    assert LazyDataClass.__dict__[LAZY_METHODS_ATTR] == {
+        "__mashumaro_from_dict__",
+        "__mashumaro_to_dict__",
+    }
+    warmup([LazyDataClass])
+    assert not LazyDataClass.__dict__[LAZY_METHODS_ATTR]
+    assert LazyDataClass.from_dict({"x": "1"}) == LazyDataClass(1)
+    assert LazyDataClass(1).to_dict() == {"x": 1}
+    assert not LazyDataClass.__dict__[LAZY_METHODS_ATTR]
+
+
+def test_lazy_method_compiled_on_call_is_not_pending():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int
+
+        class Config(BaseConfig):
+            lazy_compilation = True
+
+    assert DataClass.from_dict({"x": 1}) == DataClass(1)
+    assert DataClass.__dict__[LAZY_METHODS_ATTR] == {"__mashumaro_to_dict__"}
+
+
+def test_warmup_formats():
+    warmup([LazyORJSONDataClass], formats=["json"])
+    assert LazyORJSONDataClass.__dict__[LAZY_METHODS_ATTR] == {
+        "__mashumaro_from_dict__",
+        "__mashumaro_to_dict__",
+        "__mashumaro_to_jsonb__",
+    }
+    warmup([LazyORJSONDataClass], formats=["dict", "jsonb"])
+    assert not LazyORJSONDataClass.__dict__[LAZY_METHODS_ATTR]
+    assert LazyORJSONDataClass.from_json('{"x": [1]}').to_jsonb() == (
+        b'{"x":[1]}'
+    )
+
+
+def test_warmup_dialects():
+    cache_name = "__dialect_dict_unpacker_cache__"
+    assert (
+        OrdinalDialect not in DataClassWithDialectSupport.__dict__[cache_name]
+    )
+    warmup([DataClassWithDialectSupport], dialects=[OrdinalDialect])
+    assert OrdinalDialect in DataClassWithDialectSupport.__dict__[cache_name]
+    assert (
+        OrdinalDialect
+        in DataClassWithDialectSupport.__dict__[
+            "__dialect_dict_packer_cache__"
+        ]
+    )
+    obj = DataClassWithDialectSupport(date(2023, 1, 1))
+    ordinal = date(2023, 1, 1).toordinal()
+    assert obj.to_dict(dialect=OrdinalDialect) == {"x": ordinal}
+    assert (
+        DataClassWithDialectSupport.from_dict(
+            {"x": ordinal}, dialect=OrdinalDialect
+        )
+        == obj
+    )
+
+
+def test_warmup_ignores_dialects_without_dialect_support():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: date
+
+    warmup([DataClass], dialects=[OrdinalDialect])
+    assert "__dialect_dict_unpacker_cache__" not in DataClass.__dict__
+
+
+def test_warmup_postponed_evaluation():
+    @dataclass
+    class A(DataClassDictMixin):
+        b: "B"
+
+    @dataclass
+    class B(DataClassDictMixin):
+        x: int
+
+    globals()["B"] = B
+    try:
+        assert "__mashumaro_from_dict__" in A.__dict__[LAZY_METHODS_ATTR]
+        warmup([A])
+        assert not A.__dict__[LAZY_METHODS_ATTR]
+        assert A.from_dict({"b": {"x": 1}}) == A(B(1))
+    finally:
+        del globals()["B"]
+
+
+def test_warmup_unresolved_type_reference():
+    @dataclass
+    class A(DataClassDictMixin):
+        c: "C"  # noqa: F821
+
+    with pytest.raises(UnresolvedTypeReferenceError):
+        warmup([A])
+
+
+def test_warmup_all_subclasses(mocker):
+    import mashumaro.core.meta.mixin as mixin
+
+    warmup_unpacker = mocker.spy(mixin, "_warmup_unpacker")
+    mocker.patch(
+        "mashumaro.core.meta.mixin.iter_all_subclasses",
+        return_value=iter([LazyDataClass, LazyDataClass, int]),
+    )
+    warmup()
+    assert warmup_unpacker.call_count == 1
+
+
+def test_warmup_all_subclasses_skips_unresolved_type_reference(mocker):
+    @dataclass
+    class A(DataClassDictMixin):
+        d: "D"  # noqa: F821
+
+    @dataclass
+    class E(DataClassDictMixin):
+        x: int
+
+        class Config(BaseConfig):
+            lazy_compilation = True
+
+    mocker.patch(
+        "mashumaro.core.meta.mixin.iter_all_subclasses",
+        return_value=iter([A, E]),
+    )
+    warmup()
+    assert "__mashumaro_from_dict__" in A.__dict__[LAZY_METHODS_ATTR]
+    assert not E.__dict__[LAZY_METHODS_ATTR]